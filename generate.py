@@ -0,0 +1,129 @@
+'''
+Entry point for generating images without the GUI.
+
+Example:
+    python generate.py circuit_tile_set --count 1000 --rows 30 --columns 30 --first-seed 0
+    python generate.py circuit_tile_set --world 8 8 --rows 32 --columns 32 --first-seed 7
+    python generate.py circuit_tile_set --pack tile_sets/circuit_tile_set.wfcpack
+'''
+import argparse
+from pathlib import Path
+
+from src.formatters.wfc_config_formatter import format_wfc_configs
+from src.generation.batch import BatchConfig, JobResult, generate_batch
+from src.generation.chunks import ChunkGenerator
+from src.generation.scheduler import ChunkScheduler
+from src.readers.yaml_reader import read_config_file
+from src.solver.solver import BACKENDS, SEARCH_MODES
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_loader import create_tile_set_manager, write_tile_set_pack
+
+
+def parse_arguments(configs: dict) -> argparse.Namespace:
+    '''
+    Parses command line arguments, using @configs for defaults.
+    '''
+    parser = argparse.ArgumentParser(description='Generate images with Wave Function Collapse.')
+    parser.add_argument('tile_set', nargs='?', default='default_tile_set',
+                        help='name of a tile set directory or packed archive in the tile path')
+    parser.add_argument('--count', type=int, default=1,
+                        help='number of images to generate')
+    parser.add_argument('--first-seed', type=int, default=0,
+                        help='seed of the first image, each next image uses the next seed')
+    parser.add_argument('--rows', type=int, default=configs['default_cell_rows'])
+    parser.add_argument('--columns', type=int, default=configs['default_cell_columns'])
+    parser.add_argument('--cell-size', type=int, nargs=2, default=configs['default_cell_size'])
+    parser.add_argument('--tile-path', type=Path, default=Path(configs['default_tile_path']))
+    parser.add_argument('--tile-cache', type=Path, default=configs.get('default_tile_cache_path'),
+                        help='directory of compiled tile sets')
+    parser.add_argument('--output', type=Path, default=Path('output'))
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes, one per core by default')
+    parser.add_argument('--backend', choices=BACKENDS, default='python')
+    parser.add_argument('--search', choices=SEARCH_MODES, default='greedy')
+    parser.add_argument('--world', type=int, nargs=2, metavar=('CHUNK_COLUMNS', 'CHUNK_ROWS'),
+                        help='generate one world of chunks, each of --rows by --columns cells, '
+                             'with --first-seed as the master seed')
+    parser.add_argument('--max-attempts', type=int, default=3,
+                        help='attempts made to solve each chunk of a world, each with a new seed')
+    parser.add_argument('--pack', type=Path, metavar='FILE',
+                        help='write the tile set, resized to --cell-size, '
+                             'to a packed archive at FILE instead of generating images')
+
+    return parser.parse_args()
+
+
+def print_result(result: JobResult) -> None:
+    '''
+    Prints the outcome of one job.
+    '''
+    outcome = 'solved' if result.is_solved else f'{result.invalid_cells} invalid cells'
+    print(f'seed {result.seed}: {outcome} in {result.solve_time:.3f}s -> {result.path}')
+
+
+def generate_world(tile_set: TileSet, arguments: argparse.Namespace) -> None:
+    '''
+    Generates a world of chunks in parallel, writing each chunk as an image once it is solved.
+    '''
+    chunk_columns, chunk_rows = arguments.world
+    generator = ChunkGenerator(tile_set,
+                               (arguments.rows, arguments.columns),
+                               arguments.first_seed,
+                               tuple(arguments.cell_size),
+                               arguments.backend,
+                               arguments.search,
+                               arguments.max_attempts)
+    scheduler = ChunkScheduler(generator, arguments.workers)
+    arguments.output.mkdir(parents=True, exist_ok=True)
+
+    for chunk in scheduler.solve(range(chunk_rows), range(chunk_columns)):
+        path = Path(arguments.output, f'chunk_{chunk.chunk_row}_{chunk.chunk_column}.png')
+        generator.get_image(chunk).save(path)
+
+        outcome = 'solved' if chunk.is_solved else 'has invalid cells'
+        print(f'chunk ({chunk.chunk_row}, {chunk.chunk_column}): {outcome} -> {path}')
+
+
+def main():
+    '''
+    Reads configs and arguments, and generates the requested images.
+    '''
+    configs = read_config_file(Path('configs.yaml'))
+    configs = format_wfc_configs(configs)
+    arguments = parse_arguments(configs)
+
+    if arguments.pack is not None:
+        write_tile_set_pack(Path(arguments.tile_path, arguments.tile_set),
+                            arguments.pack,
+                            tuple(arguments.cell_size))
+        print(f'{arguments.tile_set} -> {arguments.pack}')
+        return
+
+    # tile set directory or packed archive
+    tile_set_manager = create_tile_set_manager(arguments.tile_path,
+                                               arguments.tile_cache,
+                                               tuple(arguments.cell_size))
+    tile_set = tile_set_manager[arguments.tile_set]
+
+    if arguments.world is not None:
+        generate_world(tile_set, arguments)
+        return
+
+    config = BatchConfig(tile_set_name=arguments.tile_set,
+                         rows=arguments.rows,
+                         columns=arguments.columns,
+                         cell_size=tuple(arguments.cell_size),
+                         backend=arguments.backend,
+                         search=arguments.search,
+                         output_dir=arguments.output)
+    seeds = range(arguments.first_seed, arguments.first_seed + arguments.count)
+
+    summary = generate_batch(tile_set, config, seeds, arguments.workers, print_result)
+
+    solved = sum(job.is_solved for job in summary.jobs)
+    print(f'{solved}/{len(summary.jobs)} solved in {summary.elapsed:.3f}s '
+          f'with {summary.workers} workers')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,235 +1,299 @@
-'''
-Entry point of Wave Function Collapse app.
-'''
-import os
-import tkinter as tk
-
-from pathlib import Path
-from tkinter import filedialog
-from PIL import Image
-
-from src.formatters.image_config_formatter import format_image_configs
-from src.formatters.wfc_config_formatter import format_wfc_configs
-from src.readers.yaml_reader import read_config_file
-from src.readers.image_reader import read_images
-from src.cells.cell_manager import CellManager
-from src.solver.solver import Solver
-from src.tiles.tile import Tile
-from src.tiles.tile_set_manager import TileSetManager
-from src.tiles.tile_set import TileSet
-
-
-def highlight_cell(event, cell_manager: CellManager):
-    '''
-    Highlight cell on mouse hover.
-    '''
-    row, column = cell_manager.get_cell_indices(event.x, event.y)
-    cell_manager.highlight_cell(row, column)
-
-
-def collapse(event, cell_manager: CellManager):
-    '''
-    Collapse cell on mouse click.
-    '''
-    row, column = cell_manager.get_cell_indices(event.x, event.y)
-    chosen_tile = cell_manager.collapse(row, column)
-    if chosen_tile is not None:
-        cell_manager.reduce_possibilities_for(row, column, chosen_tile)
-
-
-def save_image(cell_manager: CellManager):
-    '''
-    Dialog to save current state of canvas as image.
-    '''
-    file_types = [('png', '*.png'), ('jpeg', '*.jpeg')]
-
-    file = filedialog.asksaveasfilename(title='Save Current Image As',
-                                        filetypes=file_types,
-                                        initialdir=os.getcwd(),
-                                        defaultextension="*.*")
-
-    if file != '':
-        image = cell_manager.get_current_image()
-        image.save(file)
-
-
-def chose_tile_set(bool_variable, tile_set_name, cell_manager):
-    '''
-    Switch between available TileSet's from TileSet menu.
-    '''
-    print(tile_set_name)
-    cell_manager.switch_tile_sets_with(bool_variable, tile_set_name)
-
-
-def show_extra_cell_information(bool_variable, cell_manager):
-    '''
-    Show number of available tiles in each cell.
-    '''
-    if bool_variable.get() is True:
-        cell_manager.enable_cell_extra_information()
-    else:
-        cell_manager.disable_cell_extra_information()
-
-
-def solver_csp(cell_manager: CellManager, delay):
-    '''
-    Automatically solve/fill canvas based on state of grid cells,
-    from Solver menu.
-    '''
-    solver = Solver(cell_manager, delay)
-    solver.start()
-    solver.check_invalid()
-
-
-def create_tile_set(configs: dict, images: dict[str, Image.Image]) -> TileSet:
-    '''
-    Create a tile set based on TileSet configs and available images.
-    '''
-    tiles = []
-
-    for image_name in configs:
-        # create a TIle for each image in configs
-        image_configs = configs[image_name]
-        side_codes = image_configs['directions']
-
-        original_tile = Tile(images[image_name], side_codes)
-        tiles.append(original_tile)
-
-        # create a number of copies of Tile based on configs
-        for rotations_amount, rotation_direction in image_configs['rotations']:
-            rotated_tile = Tile(images[image_name], side_codes)
-            rotated_tile.rotate_tile(rotations_amount, rotation_direction)
-            tiles.append(rotated_tile)
-
-    return TileSet(tiles)
-
-
-def create_tile_set_manager(path_to_tiles: Path) -> TileSetManager:
-    '''
-    Create all valid TileSets from given directory, and collect them
-    in a TileSetManager.
-    '''
-    tile_set_dirs = [ts for ts in os.listdir(path_to_tiles) if ts.endswith('tile_set')]
-    tile_sets = {}
-
-    for tile_set_name in tile_set_dirs:
-        configs = read_config_file(Path(path_to_tiles, tile_set_name, f'{tile_set_name}.yaml'))
-        tile_set_formatted_configs = format_image_configs(configs)
-
-        tile_set_images = read_images(Path(path_to_tiles, tile_set_name))
-        tile_set = create_tile_set(tile_set_formatted_configs, tile_set_images)
-        tile_sets[tile_set_name] = tile_set
-
-    return TileSetManager(tile_sets)
-
-
-def create_tkinter_widgets(rows, column, size):
-    '''
-    Create Tkinter widgets for UI.
-    '''
-    # Create root window
-    root = tk.Tk()
-    root.geometry(f'{rows*size[0]}x{column*size[1]}')
-    root.resizable(False, False)
-
-    # Create canvas
-    canvas = tk.Canvas(root)
-    canvas.pack(fill=tk.BOTH, expand=True)
-    canvas.configure(bg='grey')
-
-    return root, canvas
-
-
-def create_menus(root, cell_manager, tile_set_manager, show_extra_information, delay):
-    '''
-    Create dropdown menus for main window.
-    '''
-    # Menus
-    menubar = tk.Menu(root)
-
-    # Menu for saving image
-    file_menu = tk.Menu(menubar, tearoff=0)
-    file_menu.add_command(label="save as", command=lambda cm=cell_manager:save_image(cm))
-    menubar.add_cascade(menu = file_menu, label = "File")
-
-    # Menu for switching tile sets
-    tile_set_menu = tk.Menu(menubar, tearoff=0)
-    for tile_set_name in tile_set_manager:
-        tile_set_menu.add_command(
-            label=tile_set_name,
-            command=lambda sei=show_extra_information,
-            tile_set_manager=tile_set_name: chose_tile_set(sei, tile_set_manager, cell_manager)
-        )
-    menubar.add_cascade(menu=tile_set_menu, label = "Tile Sets")
-
-    # Menu for showing extra cell information on canvas
-    cell_menu = tk.Menu(root, tearoff=0)
-    cell_menu.add_checkbutton(
-        label='Show extra information',
-        onvalue=1,
-        offvalue=0,
-        variable=show_extra_information,
-        command=lambda: show_extra_cell_information(show_extra_information, cell_manager)
-    )
-    menubar.add_cascade(menu=cell_menu, label = "Cells")
-
-    # Menu for starting solver
-    solver_menu = tk.Menu(root, tearoff=0)
-    solver_menu.add_command(label='Start solver',
-                          command=lambda: solver_csp(cell_manager, delay))
-    menubar.add_cascade(menu=solver_menu, label = "Solver")
-
-    root.config(menu=menubar)
-
-    return show_extra_information
-
-
-def main():
-    '''
-    Main program flow that reads needed files and creates objects.
-    '''
-    # Load and format default configs
-    configs = read_config_file(Path('configs.yaml'))
-    configs = format_wfc_configs(configs)
-
-    # get all default configs
-    default_tile_path = configs['default_tile_path']
-    default_cell_rows = configs['default_cell_rows']
-    default_cell_columns = configs['default_cell_columns']
-    default_cell_size = configs['default_cell_size']
-    default_solver_delay = configs['default_solver_delay']
-
-    # Get path to directory with TileSets
-    path_to_tiles = Path(default_tile_path)
-
-    # Create tkinter window and gadgets
-    root, canvas = create_tkinter_widgets(default_cell_rows,
-                                          default_cell_columns,
-                                          default_cell_size)
-
-    # Create managers
-    tile_set_manager = create_tile_set_manager(path_to_tiles)
-    cell_manager = CellManager(default_cell_rows,
-                               default_cell_columns,
-                               default_cell_size,
-                               canvas,
-                               tile_set_manager)
-
-    # Create tkinter variables
-    show_extra_information = tk.BooleanVar()
-    show_extra_information.set(False)
-
-    # Create menus
-    create_menus(root, cell_manager, tile_set_manager, show_extra_information, default_solver_delay)
-
-    # Bind events
-    cell_manager.switch_tile_sets_with(show_extra_information)
-    canvas.bind('<Button-1>', lambda event: collapse(event, cell_manager))
-    root.bind('<Motion>', lambda event: highlight_cell(event, cell_manager))
-
-    # Start mainloop
-    root.mainloop()
-
-
-if __name__ == '__main__':
-    main()
+'''
+Entry point of Wave Function Collapse app.
+'''
+import os
+import tkinter as tk
+
+from pathlib import Path
+from tkinter import filedialog
+
+from src.formatters.wfc_config_formatter import format_wfc_configs
+from src.readers.yaml_reader import read_config_file
+from src.cells.cell_manager import CellManager
+from src.motion_coalescer import MotionCoalescer
+from src.solver.background_solver import BackgroundSolver
+from src.solver.render_scheduler import RenderScheduler
+from src.solver.restart import RestartPolicy
+from src.solver.solver import Solver
+from src.tiles.tile_set_loader import create_tile_set_manager
+
+
+def highlight_cell(x, y, cell_manager: CellManager):
+    '''
+    Highlight cell on mouse hover.
+    '''
+    row, column = cell_manager.get_cell_indices(x, y)
+    cell_manager.highlight_cell(row, column)
+
+
+def is_solver_running(running: dict) -> bool:
+    '''
+    Returns True if a BackgroundSolver is changing the cells.
+    '''
+    background_solver = running.get('solver')
+    return background_solver is not None and background_solver.is_running()
+
+
+def collapse(event, cell_manager: CellManager, running: dict):
+    '''
+    Collapse cell on mouse click, unless a solver is running.
+    '''
+    if is_solver_running(running):
+        return
+
+    row, column = cell_manager.get_cell_indices(event.x, event.y)
+    chosen_tile = cell_manager.collapse(row, column)
+    if chosen_tile is not None:
+        cell_manager.reduce_possibilities_for(row, column, chosen_tile)
+
+
+def save_image(cell_manager: CellManager):
+    '''
+    Dialog to save current state of canvas as image.
+    '''
+    file_types = [('png', '*.png'), ('jpeg', '*.jpeg')]
+
+    file = filedialog.asksaveasfilename(title='Save Current Image As',
+                                        filetypes=file_types,
+                                        initialdir=os.getcwd(),
+                                        defaultextension="*.*")
+
+    if file != '':
+        image = cell_manager.get_current_image()
+        image.save(file)
+
+
+def chose_tile_set(bool_variable, tile_set_name, cell_manager, running):
+    '''
+    Switch between available TileSet's from TileSet menu, unless a solver is running.
+    '''
+    if is_solver_running(running):
+        return
+
+    print(tile_set_name)
+    cell_manager.switch_tile_sets_with(bool_variable, tile_set_name)
+
+
+def show_extra_cell_information(bool_variable, cell_manager):
+    '''
+    Show number of available tiles in each cell.
+    '''
+    if bool_variable.get() is True:
+        cell_manager.enable_cell_extra_information()
+    else:
+        cell_manager.disable_cell_extra_information()
+
+
+def solver_csp(root: tk.Tk,
+               cell_manager: CellManager,
+               running: dict,
+               fps,
+               backend='python',
+               search='greedy',
+               restart_policy=None):
+    '''
+    Automatically solve/fill canvas based on state of grid cells,
+    from Solver menu. The solver runs on a worker thread, so the window stays responsive.
+
+    - running - {'solver': BackgroundSolver} of the last started solver
+    - fps - frames per second of the animation, None to draw only the result
+    '''
+    if is_solver_running(running):
+        return
+
+    solver = Solver(cell_manager,
+                    backend=backend,
+                    search=search,
+                    restart_policy=restart_policy)
+    running['solver'] = BackgroundSolver(solver,
+                                         root.after,
+                                         RenderScheduler(fps),
+                                         report_solver)
+    running['solver'].start()
+
+
+def report_solver(background_solver: BackgroundSolver):
+    '''
+    Prints the outcome of a solver, once it stopped.
+    '''
+    solver = background_solver.solver
+
+    if background_solver.control.is_cancelled():
+        print('solver cancelled')
+
+    # report attempts, so slow tile sets can be tuned
+    for report in solver.reports:
+        print(report)
+
+    if solver.restart_policy is not None:
+        print(f'winning seed: {solver.winning_seed}')
+
+
+def pause_solver(running: dict):
+    '''
+    Pauses a running solver, or resumes a paused one, from Solver menu.
+    '''
+    if is_solver_running(running) is False:
+        return
+
+    background_solver = running['solver']
+
+    if background_solver.control.is_paused():
+        background_solver.resume()
+    else:
+        background_solver.pause()
+
+
+def cancel_solver(running: dict):
+    '''
+    Stops a running solver, from Solver menu.
+    '''
+    if is_solver_running(running):
+        running['solver'].cancel()
+
+
+def create_tkinter_widgets(rows, column, size):
+    '''
+    Create Tkinter widgets for UI.
+    '''
+    # Create root window
+    root = tk.Tk()
+    root.geometry(f'{rows*size[0]}x{column*size[1]}')
+    root.resizable(False, False)
+
+    # Create canvas
+    canvas = tk.Canvas(root)
+    canvas.pack(fill=tk.BOTH, expand=True)
+    canvas.configure(bg='grey')
+
+    return root, canvas
+
+
+def create_menus(root, cell_manager, tile_set_manager, show_extra_information, fps, running):
+    '''
+    Create dropdown menus for main window.
+    '''
+    # Menus
+    menubar = tk.Menu(root)
+
+    # Menu for saving image
+    file_menu = tk.Menu(menubar, tearoff=0)
+    file_menu.add_command(label="save as", command=lambda cm=cell_manager:save_image(cm))
+    menubar.add_cascade(menu = file_menu, label = "File")
+
+    # Menu for switching tile sets
+    tile_set_menu = tk.Menu(menubar, tearoff=0)
+    for tile_set_name in tile_set_manager:
+        tile_set_menu.add_command(
+            label=tile_set_name,
+            command=lambda sei=show_extra_information,
+            tile_set_manager=tile_set_name: chose_tile_set(sei, tile_set_manager, cell_manager, running)
+        )
+    menubar.add_cascade(menu=tile_set_menu, label = "Tile Sets")
+
+    # Menu for showing extra cell information on canvas
+    cell_menu = tk.Menu(root, tearoff=0)
+    cell_menu.add_checkbutton(
+        label='Show extra information',
+        onvalue=1,
+        offvalue=0,
+        variable=show_extra_information,
+        command=lambda: show_extra_cell_information(show_extra_information, cell_manager)
+    )
+    menubar.add_cascade(menu=cell_menu, label = "Cells")
+
+    # Menu for starting solver
+    solver_menu = tk.Menu(root, tearoff=0)
+    def start(**kwargs):
+        solver_csp(root, cell_manager, running, **kwargs)
+
+    solver_menu.add_command(label='Start solver',
+                          command=lambda: start(fps=fps))
+    solver_menu.add_command(label='Start solver (turbo)',
+                          command=lambda: start(fps=None))
+    solver_menu.add_command(label='Start solver (numpy)',
+                          command=lambda: start(fps=fps, backend='numpy'))
+    solver_menu.add_command(label='Start solver (backtracking)',
+                          command=lambda: start(fps=fps, search='backtracking'))
+    solver_menu.add_command(label='Start solver (backjumping)',
+                          command=lambda: start(fps=fps, search='backjumping'))
+    solver_menu.add_command(label='Start solver (restarts)',
+                          command=lambda: start(fps=fps, restart_policy=RestartPolicy()))
+    solver_menu.add_separator()
+    solver_menu.add_command(label='Pause / resume solver',
+                          command=lambda: pause_solver(running))
+    solver_menu.add_command(label='Cancel solver',
+                          command=lambda: cancel_solver(running))
+    menubar.add_cascade(menu=solver_menu, label = "Solver")
+
+    root.config(menu=menubar)
+
+    return show_extra_information
+
+
+def main():
+    '''
+    Main program flow that reads needed files and creates objects.
+    '''
+    # Load and format default configs
+    configs = read_config_file(Path('configs.yaml'))
+    configs = format_wfc_configs(configs)
+
+    # get all default configs
+    default_tile_path = configs['default_tile_path']
+    default_cell_rows = configs['default_cell_rows']
+    default_cell_columns = configs['default_cell_columns']
+    default_cell_size = configs['default_cell_size']
+    default_solver_fps = configs['default_solver_fps']
+    default_tile_cache_path = configs.get('default_tile_cache_path')
+    default_rendering = configs.get('default_rendering', 'items')
+
+    # Get path to directory with TileSets, and to their compiled copies
+    path_to_tiles = Path(default_tile_path)
+    path_to_tile_cache = None if default_tile_cache_path is None else Path(default_tile_cache_path)
+
+    # Create tkinter window and gadgets
+    root, canvas = create_tkinter_widgets(default_cell_rows,
+                                          default_cell_columns,
+                                          default_cell_size)
+
+    # Create managers
+    tile_set_manager = create_tile_set_manager(path_to_tiles,
+                                               path_to_tile_cache,
+                                               default_cell_size)
+    cell_manager = CellManager(default_cell_rows,
+                               default_cell_columns,
+                               default_cell_size,
+                               canvas,
+                               tile_set_manager,
+                               default_rendering)
+
+    # Create tkinter variables
+    show_extra_information = tk.BooleanVar()
+    show_extra_information.set(False)
+
+    # {'solver': BackgroundSolver} of the last started solver
+    running = {}
+
+    # Create menus
+    create_menus(root,
+                 cell_manager,
+                 tile_set_manager,
+                 show_extra_information,
+                 default_solver_fps,
+                 running)
+
+    # Bind events
+    cell_manager.switch_tile_sets_with(show_extra_information)
+    canvas.bind('<Button-1>', lambda event: collapse(event, cell_manager, running))
+    # highlight at most once per frame, however many motion events arrive
+    motion_coalescer = MotionCoalescer(root.after,
+                                       lambda x, y: highlight_cell(x, y, cell_manager))
+    root.bind('<Motion>', motion_coalescer.on_motion)
+
+    # Start mainloop
+    root.mainloop()
+
+
+if __name__ == '__main__':
+    main()
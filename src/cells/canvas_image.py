@@ -0,0 +1,113 @@
+'''
+CanvasImage
+'''
+from tkinter import Canvas
+
+from PIL import Image, ImageTk
+
+
+class CanvasImage:
+    '''
+    One image item on a tk.Canvas, drawn from a PIL image of the same size.
+
+    Changes are pasted into the PIL image and the changed boxes are remembered.
+    flush pushes only those boxes to the PhotoImage shown on canvas, through
+    a PhotoImage of one box, so a redraw costs as much as the number of changed boxes.
+    All boxes must have the size given as box_size.
+    '''
+    def __init__(self,
+                 canvas: Canvas,
+                 size: tuple[int, int],
+                 box_size: tuple[int, int],
+                 mode: str = 'RGB',
+                 color: str|tuple[int, ...] = 'white') -> None:
+        '''
+        - canvas - tkinter canvas the image is shown on, at (0, 0)
+        - size - size of the image in pixels
+        - box_size - size of every box pasted into the image
+        - mode - PIL mode of the image, 'RGBA' to show items under transparent pixels
+        - color - initial color of the image
+        '''
+        self.canvas = canvas
+        self.image = Image.new(mode, size, color=color)
+        self.box_size = tuple(box_size)
+        '''
+        + _dirty - {(left, upper): box} of boxes changed since the last flush
+        + _photo_image - PhotoImage of the whole image, shown on canvas
+        + _box_photo_image - PhotoImage of one box, boxes are pushed through it
+        + _item_id - id of the image in canvas
+        '''
+        self._dirty: dict[tuple[int, int], tuple[int, int, int, int]] = {}
+        self._photo_image: ImageTk.PhotoImage|None = None
+        self._box_photo_image: ImageTk.PhotoImage|None = None
+        self._item_id: int|None = None
+
+        self._create_photo_images()
+
+
+    def paste(self,
+              source: Image.Image|str|tuple[int, ...],
+              box: tuple[int, int, int, int]) -> None:
+        '''
+        Pastes an image, or fills with a color, @box of the image,
+        and remembers it to be pushed on the next flush.
+        '''
+        if isinstance(source, Image.Image):
+            self.image.paste(source, box[:2])
+        else:
+            self.image.paste(source, box)
+
+        self._dirty[box[:2]] = box
+
+
+    def is_dirty(self) -> bool:
+        '''
+        Returns True if some box changed since the last flush.
+        '''
+        return len(self._dirty) > 0
+
+
+    def flush(self) -> None:
+        '''
+        Pushes the boxes changed since the last flush to the canvas.
+        '''
+        for box in self._dirty.values():
+            self._push(box)
+
+        self._dirty.clear()
+
+
+    def lower(self) -> None:
+        '''
+        Moves the image under every other item on canvas.
+        '''
+        self.canvas.tag_lower(self._item_id)
+
+
+    def delete(self) -> None:
+        '''
+        Removes the image from canvas.
+        '''
+        if self._item_id is not None:
+            self.canvas.delete(self._item_id)
+            self._item_id = None
+
+
+    def _create_photo_images(self) -> None:
+        '''
+        Creates the PhotoImage of the whole image, shows it on canvas,
+        and the PhotoImage of one box.
+        '''
+        self._photo_image = ImageTk.PhotoImage(self.image)
+        self._box_photo_image = ImageTk.PhotoImage(self.image.mode, self.box_size)
+        self._item_id = self.canvas.create_image(0, 0, image=self._photo_image, anchor='nw')
+
+
+    def _push(self, box: tuple[int, int, int, int]) -> None:
+        '''
+        Copies @box of the image to the same place in the PhotoImage shown on canvas,
+        replacing its pixels, transparent ones included.
+        '''
+        self._box_photo_image.paste(self.image.crop(box))
+        self.canvas.tk.call(str(self._photo_image), 'copy', str(self._box_photo_image),
+                            '-to', box[0], box[1], '-compositingrule', 'set')
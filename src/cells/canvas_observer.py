@@ -0,0 +1,227 @@
+'''
+CanvasObserver
+'''
+from tkinter import Canvas
+
+from src.cells.cell import Cell
+from src.cells.cell_grid import GridObserver
+from src.cells.heatmap_overlay import HeatmapOverlay
+from src.cells.photo_image_cache import PhotoImageCache
+from src.highlight_data import HighlightData
+from src.tiles.tile import Tile
+
+
+class CanvasObserver(GridObserver):
+    '''
+    Draws the cells of a CellGrid on a tk.Canvas, as they change.
+
+    Keeps the canvas item ids of every cell, so the cells themselves hold only data.
+    Cells showing the same Tile share one PhotoImage from a PhotoImageCache.
+
+    Extra information is shown as one HeatmapOverlay over the grid, updated
+    for changed cells only, and pushed to canvas once per frame in flush.
+    '''
+    def __init__(self,
+                 canvas: Canvas,
+                 show_extra_information: bool = False,
+                 heatmap_metric: str = 'size') -> None:
+        '''
+        - canvas - tkinter canvas to draw on
+        - show_extra_information - color each cell by its number of possible tiles
+        - heatmap_metric - how cells are colored, see HeatmapOverlay
+        '''
+        self.canvas = canvas
+        self.show_extra_information = show_extra_information
+        self.heatmap_metric = heatmap_metric
+        '''
+        + _image_ids - {(row, column): PhotoImage id in canvas}
+        + _overlay - HeatmapOverlay shown while extra information is enabled
+        + _is_flush_scheduled - a flush is waiting for Tk to be idle
+        '''
+        self._photo_image_cache = PhotoImageCache()
+        self._image_ids: dict[tuple[int, int], int] = {}
+        self._overlay: HeatmapOverlay|None = None
+        self._is_flush_scheduled = False
+        self._highlight_data = HighlightData()
+
+
+    def on_load(self, cells: list[list[Cell]]) -> None:
+        '''
+        Clears images and extra information of previous cells,
+        and draws extra information of new cells, if it is enabled.
+        Cached PhotoImages are kept only if the TileSet and cell size did not change.
+        '''
+        for item_id in self._image_ids.values():
+            self.canvas.delete(item_id)
+
+        self._image_ids.clear()
+        self._delete_overlay()
+
+        if len(cells) > 0 and len(cells[0]) > 0:
+            first_cell = cells[0][0]
+            self._photo_image_cache.invalidate_for(first_cell.domain.tile_set, first_cell.cell_size)
+
+        if self.show_extra_information is True:
+            self.enable_extra_information([cell for cell_row in cells for cell in cell_row])
+
+
+    def on_collapse(self, cell: Cell, tile: Tile) -> None:
+        '''
+        Draws given Tile on Canvas, with respect to the Cell's grid
+        coordinates and cell_size, replacing any image the Cell has.
+        '''
+        self._draw_tile(cell, tile)
+
+        # remove extra information from cell on draw
+        self._update_overlay(cell)
+
+
+    def on_reduce(self, cell: Cell) -> None:
+        '''
+        Updates the color of Cell in the overlay, if extra information is enabled.
+        '''
+        self._update_overlay(cell)
+
+
+    def on_restore(self, cell: Cell) -> None:
+        '''
+        Removes the image of a Cell that is no longer collapsed,
+        and shows its extra information again, if it is enabled.
+
+        Events may be passed later than they happened, by a QueuedObserver,
+        so the image is always replaced by one matching the current state of Cell.
+        '''
+        tile = cell.get_chosen_tile() if cell.get_tile_set_size() == -1 else None
+
+        if tile is None:
+            self._delete_image(cell)
+        else:
+            self._draw_tile(cell, tile)
+
+        self._update_overlay(cell)
+
+
+    def refresh(self) -> None:
+        '''
+        Pushes changes to the canvas and redraws it.
+        '''
+        self.flush()
+        self.canvas.update_idletasks()
+
+
+    def flush(self) -> None:
+        '''
+        Pushes the cells of the overlay changed since the last flush to the canvas.
+        '''
+        self._is_flush_scheduled = False
+
+        if self._overlay is not None:
+            self._overlay.flush()
+
+
+    def highlight(self, cell: Cell) -> None:
+        '''
+        Draw a rectangle on the Canvas around the Cell that was hovered over,
+        with respect to the Cell's grid coordinates and cell_size.
+
+        One rectangle is created on first use, and moved with canvas.coords afterwards.
+        '''
+        # move rectangle only when a new cell is hovered over
+        if self._highlight_data.check_match(cell.row, cell.column):
+            return
+
+        x = cell.column * cell.cell_size[0]
+        y = cell.row * cell.cell_size[1]
+        x_end = x + cell.cell_size[0]
+        y_end = y + cell.cell_size[1]
+
+        if self._highlight_data.last_rect is None:
+            rectangle = self.canvas.create_rectangle(x, y, x_end, y_end)
+        else:
+            rectangle = self._highlight_data.last_rect
+            self.canvas.coords(rectangle, x, y, x_end, y_end)
+            # keep rectangle above images of cells collapsed since it was created
+            self.canvas.tag_raise(rectangle)
+
+        self._highlight_data.update(cell.row, cell.column, rectangle)
+
+
+    def enable_extra_information(self, cells: list[Cell]) -> None:
+        '''
+        Shows the number of possible tiles of each not collapsed Cell
+        as a HeatmapOverlay over the grid.
+        '''
+        self.show_extra_information = True
+
+        if self._overlay is not None or len(cells) == 0:
+            return
+
+        rows = max(cell.row for cell in cells) + 1
+        columns = max(cell.column for cell in cells) + 1
+        self._overlay = HeatmapOverlay(self.canvas,
+                                       rows,
+                                       columns,
+                                       cells[0].cell_size,
+                                       self.heatmap_metric)
+        self._overlay.update_all(cells)
+        self._schedule_flush()
+
+
+    def disable_extra_information(self) -> None:
+        '''
+        Removes the HeatmapOverlay from Canvas.
+        '''
+        self.show_extra_information = False
+        self._delete_overlay()
+
+
+    def _draw_tile(self, cell: Cell, tile: Tile) -> None:
+        '''
+        Draws @tile as the image of Cell, deleting its previous image.
+        '''
+        self._delete_image(cell)
+
+        self._image_ids[cell.get_coordinates()] = self.canvas.create_image(
+            cell.column * cell.cell_size[0],
+            cell.row * cell.cell_size[1],
+            image=self._photo_image_cache.get_photo_image(tile, cell.cell_size),
+            anchor='nw'
+        )
+
+
+    def _delete_image(self, cell: Cell) -> None:
+        '''
+        Deletes the image of Cell from Canvas, if it has one.
+        '''
+        image_id = self._image_ids.pop(cell.get_coordinates(), None)
+
+        if image_id is not None:
+            self.canvas.delete(image_id)
+
+
+    def _update_overlay(self, cell: Cell) -> None:
+        '''
+        Updates the color of Cell in the overlay, if it is shown.
+        '''
+        if self._overlay is not None:
+            self._overlay.update(cell)
+            self._schedule_flush()
+
+
+    def _delete_overlay(self) -> None:
+        '''
+        Removes the overlay from Canvas, if it is shown.
+        '''
+        if self._overlay is not None:
+            self._overlay.delete()
+            self._overlay = None
+
+
+    def _schedule_flush(self) -> None:
+        '''
+        Schedules a flush for when Tk is idle, so changes outside of a Solver
+        are shown once per frame.
+        '''
+        if self._is_flush_scheduled is False:
+            self._is_flush_scheduled = True
+            self.canvas.after_idle(self.flush)
@@ -0,0 +1,428 @@
+'''
+CellGrid
+'''
+import random
+from collections import deque
+from PIL import Image
+from src.constants import ERROR_BACKGROUND_TILE, VALID_REDUCE_MOVES
+from src.cells.cell import Cell, CellState
+from src.cells.entropy_index import EntropyIndex
+from src.cells.trail import Trail
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_manager import TileSetManager
+from src.tiles.tile import Tile
+
+
+class GridObserver:
+    '''
+    Is notified of changes to the cells of a CellGrid, for example to draw them.
+    Every method does nothing, so observers only override what they need.
+    '''
+    def on_load(self, cells: list[list[Cell]]) -> None:
+        '''
+        Invoked after the grid creates new cells.
+        '''
+
+
+    def on_collapse(self, cell: Cell, tile: Tile) -> None:
+        '''
+        Invoked after @cell is collapsed to @tile.
+        '''
+
+
+    def on_reduce(self, cell: Cell) -> None:
+        '''
+        Invoked after tiles are removed from @cell's TileSet.
+        '''
+
+
+    def on_restore(self, cell: Cell) -> None:
+        '''
+        Invoked after @cell is restored to an earlier state.
+        '''
+
+
+    def refresh(self) -> None:
+        '''
+        Invoked after each step of a Solver.
+        '''
+
+
+class CellGrid:
+    # pylint: disable=too-many-instance-attributes
+    '''
+    Grid of cells and the methods to collapse them and propagate constraints.
+
+    Holds only data and never imports tkinter, so grids can be solved
+    headless, on a server or in a worker process. Anything that should
+    react to changes, like a Canvas, is added as a GridObserver.
+    '''
+    def __init__(self,
+                 rows: int,
+                 columns: int,
+                 cell_size: int|tuple[int, int],
+                 tile_set_manager: TileSetManager) -> None:
+        '''
+        - rows - rows in grid
+        - columns - columns in grid
+        - cell_size - size of cells in pixels
+        - tile_set_manager - TileSet's the grid can be loaded with
+        '''
+        self.cells: list[list[Cell]] = []
+        self.rows = rows
+        self.columns = columns
+        self.cell_size = (cell_size, cell_size) if isinstance(cell_size, int) else cell_size
+        self.tile_set_manager = tile_set_manager
+        self.observers: list[GridObserver] = []
+        self.rng: random.Random|None = None
+        self.entropy_index = EntropyIndex()
+        self.trail: Trail|None = None
+        self.record_culprits = False
+
+        self._current_tile_set = 'default_tile_set'
+
+
+    def add_observer(self, observer: GridObserver) -> None:
+        '''
+        Adds an observer, notified of every change to the cells.
+        '''
+        self.observers.append(observer)
+
+
+    def refresh(self) -> None:
+        '''
+        Lets observers show the current state of cells.
+        '''
+        for observer in self.observers:
+            observer.refresh()
+
+
+    def collapse(self, row: int, column: int, tile_index: int|None = None) -> None|Tile:
+        '''
+        Collapses given cell, chasing a random tile that satisfies surrounding constraints
+        and notifies observers of the chosen tile.
+
+        - tile_index - index of the tile in the cell's TileSet to choose, instead of a random one
+        '''
+        cell = self.cells[row][column]
+        state = cell.get_state()
+        chosen_tile = cell.collapse(tile_index, self.rng)
+
+        if chosen_tile is None:
+            return None
+
+        if self.trail is not None:
+            self.trail.record(cell, state)
+
+        self.entropy_index.remove(cell)
+
+        for observer in self.observers:
+            observer.on_collapse(cell, chosen_tile)
+
+        return chosen_tile
+
+
+    def reduce_possibilities_for(self,
+                                 row: int,
+                                 column: int,
+                                 chosen_tile: Tile|None = None) -> tuple[int, int]|None:
+        '''
+        When a cell is collapsed, this method should be invoked on that cell.
+        Reduces the neighboring cells' tilesets, according to
+        the constraints(sides_code) of the chosen_tile, and keeps propagating
+        each reduction outward (AC-3) until no tile set changes.
+
+        Only neighbours of cells whose tile set actually changed are revisited.
+        If chosen_tile is None, propagates the current tile set of the cell.
+        If a Trail is set, every change is recorded in it.
+        If record_culprits is set, each reduced cell also takes the culprits
+        of the cell that reduced it.
+
+        If some cell is left without tiles, stops and returns its coordinates.
+        Otherwise, returns None.
+        '''
+        # an invalid cell puts no constraints on its neighbours
+        if chosen_tile is ERROR_BACKGROUND_TILE:
+            return None
+
+        worklist = deque([(row, column)])
+        queued = set(worklist)
+
+        while worklist:
+            row, column = worklist.popleft()
+            queued.discard((row, column))
+            source = self.cells[row][column]
+            domain = source.domain
+
+            for i, j, self_dir in VALID_REDUCE_MOVES:
+                if not (0 <= row + i < self.rows and 0 <= column + j < self.columns):
+                    continue
+
+                cell = self.cells[row + i][column + j]
+                state = cell.get_state()
+                old_tile_set_size = cell.get_tile_set_size()
+                new_tile_set_size = cell.restrict_domain(domain, self_dir,
+                                                         self_dir.get_opposite())
+
+                if new_tile_set_size is None or new_tile_set_size == old_tile_set_size:
+                    continue
+
+                if self.trail is not None:
+                    self.trail.record(cell, state)
+
+                if self.record_culprits is True:
+                    cell.culprits |= source.culprits
+
+                self._notify_reduce(cell)
+
+                if new_tile_set_size == 0:
+                    return cell.get_coordinates()
+
+                if cell.get_coordinates() not in queued:
+                    worklist.append(cell.get_coordinates())
+                    queued.add(cell.get_coordinates())
+
+        return None
+
+
+    def restrict(self,
+                 row: int,
+                 column: int,
+                 mask: int,
+                 culprits: int = 0) -> tuple[int, int]|None:
+        '''
+        Keeps only the tiles set in bitmask @mask possible in given cell,
+        and propagates the change to the other cells.
+        If a Trail is set, every change is recorded in it.
+
+        - culprits - bitmask of Solver decision levels that caused the restriction,
+                     added to the cell's culprits if record_culprits is set
+
+        If some cell is left without tiles, returns its coordinates.
+        Otherwise, returns None.
+        '''
+        cell = self.cells[row][column]
+
+        if cell.get_tile_set_size() == -1:
+            return None
+
+        state = cell.get_state()
+        old_tile_set_size = cell.get_tile_set_size()
+        new_tile_set_size = cell.domain.intersect(mask)
+
+        if new_tile_set_size == old_tile_set_size:
+            return None
+
+        if self.trail is not None:
+            self.trail.record(cell, state)
+
+        if self.record_culprits is True:
+            cell.culprits |= culprits
+
+        self._notify_reduce(cell)
+
+        if new_tile_set_size == 0:
+            return cell.get_coordinates()
+
+        return self.reduce_possibilities_for(row, column)
+
+
+    def empty(self, row: int, column: int) -> None:
+        '''
+        Removes all tiles from the given cell, without propagating,
+        so it is treated as invalid.
+        '''
+        cell = self.cells[row][column]
+
+        if cell.get_tile_set_size() > 0:
+            cell.domain.intersect(0)
+            self._notify_reduce(cell)
+
+
+    def undo_to(self, mark: int) -> None:
+        '''
+        Undoes all changes recorded in the Trail after @mark.
+        '''
+        if self.trail is None:
+            return
+
+        for cell, state in self.trail.pop_to(mark):
+            cell.restore_state(state)
+            self.entropy_index.update(cell)
+            self._notify_restore(cell)
+
+
+    def _notify_reduce(self, cell: Cell) -> None:
+        '''
+        Re-indexes a reduced cell and notifies observers.
+        '''
+        self.entropy_index.update(cell)
+
+        for observer in self.observers:
+            observer.on_reduce(cell)
+
+
+    def _notify_restore(self, cell: Cell) -> None:
+        '''
+        Notifies observers of a restored cell.
+        '''
+        for observer in self.observers:
+            observer.on_restore(cell)
+
+
+    def get_current_tile_set(self) -> TileSet:
+        '''
+        Returns the TileSet the cells were loaded with.
+        '''
+        return self.tile_set_manager[self._current_tile_set]
+
+
+    def get_cell_indices(self, x: int, y: int) -> tuple[int, int]:
+        '''
+        Accepts pixel coordinates from a canvas(or other) and
+        translates them to coordinates in the cell grid.
+
+        Let X = rows * cell_size and Y = columns * cell_size.
+        Then x in [0, X] and y in [0, Y]. Grid coordinates are
+        in ranges [0, rows], [0, columns].
+        '''
+        if self.are_valid_cell_coordinates(x, y) is not True:
+            return (-1, -1)
+
+        column = x // self.cell_size[0] # horizontal axis for column index
+        row = y // self.cell_size[1] # vertical axis for row index
+
+        return row, column
+
+
+    def are_valid_cell_coordinates(self, x: int, y: int) -> bool:
+        '''
+        Returns true if pixel coordinates are in valid range.
+        Let X = rows * cell_size and Y = columns * cell_size.
+        Then x in [0, X] and y in [0, Y].
+        '''
+        return 0 <= x < self.rows * self.cell_size[0] and 0 <= y < self.columns * self.cell_size[1]
+
+
+    def load_cells(self) -> None:
+        '''
+        Clears previous cells state and creates them again,
+        loading the current chosen TileSet (self._current_tile_set).
+        '''
+        # get current_tile_set and check if images are present
+        tile_set = self.get_current_tile_set()
+        tile_set.resize_tiles(self.cell_size)
+        tile_set_image_size = tile_set.get_tile_image_size()
+        if tile_set_image_size is None:
+            raise ValueError('TileSet with None image.')
+
+        # create new cells with new TileSet
+        self.cells = [
+            [Cell(row, column, tile_set_image_size, tile_set) for column in range(self.columns)]
+            for row
+            in range(self.rows)
+        ]
+
+        # index new cells by entropy for the Solver
+        self.entropy_index = EntropyIndex(self._get_cells(), self.rng)
+
+        for observer in self.observers:
+            observer.on_load(self.cells)
+
+
+    def switch_tile_set(self, new_tile_set: str = 'default_tile_set') -> None:
+        '''
+        Load cells with a TileSet from an available tile set from the TileSetManager.
+
+        - new_tile_set - name of TileSet to switch to
+        '''
+        if new_tile_set not in self.tile_set_manager:
+            raise ValueError('Invalid tile set name.'
+                             'No such tile set was loaded.'
+                             'Check for spelling errors in file names or the tile config file.')
+
+        self._current_tile_set = new_tile_set
+        self.load_cells()
+
+
+    def seed(self, seed: int|None) -> None:
+        '''
+        Makes cells choose tiles, and the Solver choose cells, with
+        a random number generator seeded with @seed.
+        If @seed is None, module random is used again.
+        '''
+        self.rng = None if seed is None else random.Random(seed)
+        self.entropy_index.rng = random if self.rng is None else self.rng
+
+
+    def get_cell_states(self) -> list[CellState]:
+        '''
+        Returns the state of every cell, row by row,
+        to be restored later with restore_cell_states.
+        '''
+        return [cell.get_state() for cell in self._get_cells()]
+
+
+    def restore_cell_states(self, states: list[CellState]) -> None:
+        '''
+        Restores states returned by get_cell_states in place,
+        without creating new cells, and indexes the cells again.
+        '''
+        cells = self._get_cells()
+
+        for cell, state in zip(cells, states):
+            cell.restore_state(state)
+            self._notify_restore(cell)
+
+        self.entropy_index = EntropyIndex(cells, self.rng)
+
+
+    def get_tile_indices(self) -> list[list[int]]:
+        '''
+        Returns the index in the current TileSet of the tile
+        each cell was collapsed to, or -1 if it was not collapsed to one.
+        '''
+        tile_set = self.get_current_tile_set()
+        tile_indices = []
+
+        for cell_row in self.cells:
+            row_indices = []
+
+            for cell in cell_row:
+                tile_index = tile_set.get_tile_index(cell.get_chosen_tile())
+                row_indices.append(-1 if tile_index is None else tile_index)
+
+            tile_indices.append(row_indices)
+
+        return tile_indices
+
+
+    def get_image_size(self) -> tuple[int, int]:
+        '''
+        Returns size in pixels of the image of the whole grid.
+        '''
+        return self.columns * self.cell_size[0], self.rows * self.cell_size[1]
+
+
+    def get_current_image(self, background_color: str = 'white') -> Image.Image:
+        '''
+        Constructs an Image, with size of get_image_size, combining all Cell images.
+        If some Cell does not have an Image, a default image
+        with @background_color is filled in it's place.
+        '''
+        save_image = Image.new('RGB', self.get_image_size())
+
+        for cell_row in self.cells:
+            for cell in cell_row:
+                cell_image = cell.get_chosen_image(background_color)
+                save_image.paste(cell_image, (cell.column * cell.cell_size[0],
+                                              cell.row * cell.cell_size[1],))
+
+        return save_image
+
+
+    def _get_cells(self) -> list[Cell]:
+        '''
+        Returns cells flattened from a matrix to a list, row by row.
+        '''
+        return [cell for cell_row in self.cells for cell in cell_row]
@@ -0,0 +1,113 @@
+'''
+CompositeCanvasObserver
+'''
+from tkinter import Canvas
+
+from PIL import Image
+
+from src.cells.canvas_image import CanvasImage
+from src.cells.canvas_observer import CanvasObserver
+from src.cells.cell import Cell
+from src.tiles.tile import Tile
+
+
+# color of cells without a tile
+BACKGROUND_COLOR = 'white'
+
+
+class CompositeCanvasObserver(CanvasObserver):
+    '''
+    Draws the cells of a CellGrid as one image item on a tk.Canvas.
+
+    Tiles are pasted into one CanvasImage of the whole grid, whose changed
+    cells are pushed to canvas once per frame, in flush. The canvas holds a single
+    image item, no matter how many cells there are, and a redraw costs
+    as much as the number of changed cells.
+    '''
+    # shows the grid on canvas, replaced in tests
+    canvas_image_type = CanvasImage
+
+    def __init__(self,
+                 canvas: Canvas,
+                 show_extra_information: bool = False,
+                 heatmap_metric: str = 'size') -> None:
+        '''
+        - canvas - tkinter canvas to draw on
+        - show_extra_information - color each cell by its number of possible tiles
+        - heatmap_metric - how cells are colored, see HeatmapOverlay
+        '''
+        super().__init__(canvas, show_extra_information, heatmap_metric)
+        '''
+        + _canvas_image - image of the whole grid, None if no cells were loaded
+        '''
+        self._canvas_image: CanvasImage|None = None
+
+
+    def on_load(self, cells: list[list[Cell]]) -> None:
+        '''
+        Creates a blank image of the size of the new grid, under any other canvas item.
+        '''
+        if self._canvas_image is not None:
+            self._canvas_image.delete()
+            self._canvas_image = None
+
+        if len(cells) > 0 and len(cells[0]) > 0:
+            cell_size = cells[0][0].cell_size
+            size = (len(cells[0]) * cell_size[0], len(cells) * cell_size[1])
+            self._canvas_image = self.canvas_image_type(self.canvas, size, cell_size,
+                                                        color=BACKGROUND_COLOR)
+            self._canvas_image.lower()
+
+        super().on_load(cells)
+
+
+    def on_collapse(self, cell: Cell, tile: Tile) -> None:
+        '''
+        Pastes given Tile into the grid image.
+        '''
+        self._canvas_image.paste(tile.image, self._get_box(cell))
+        self._schedule_flush()
+
+        # remove extra information from cell on draw
+        self._update_overlay(cell)
+
+
+    def on_restore(self, cell: Cell) -> None:
+        '''
+        Clears the image of a Cell that is no longer collapsed,
+        and shows its extra information again, if it is enabled.
+        A Cell restored to a collapsed state gets the image of its Tile.
+        '''
+        tile = cell.get_chosen_tile() if cell.get_tile_set_size() == -1 else None
+        image = BACKGROUND_COLOR if tile is None else tile.image
+
+        self._canvas_image.paste(image, self._get_box(cell))
+        self._schedule_flush()
+        self._update_overlay(cell)
+
+
+    def flush(self) -> None:
+        '''
+        Pushes cells changed since the last flush to the canvas.
+        '''
+        if self._canvas_image is not None:
+            self._canvas_image.flush()
+
+        super().flush()
+
+
+    def get_image(self) -> Image.Image|None:
+        '''
+        Returns the image of the whole grid, None if no cells were loaded.
+        '''
+        return None if self._canvas_image is None else self._canvas_image.image
+
+
+    @staticmethod
+    def _get_box(cell: Cell) -> tuple[int, int, int, int]:
+        '''
+        Returns the pixel box (left, upper, right, lower) of @cell in the grid image.
+        '''
+        x = cell.column * cell.cell_size[0]
+        y = cell.row * cell.cell_size[1]
+        return x, y, x + cell.cell_size[0], y + cell.cell_size[1]
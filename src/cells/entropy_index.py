@@ -0,0 +1,117 @@
+'''
+EntropyIndex bucket queue
+'''
+import random
+
+from src.cells.cell import Cell
+
+
+class EntropyIndex:
+    '''
+    Bucket queue of not-collapsed Cell's, keyed by the size of their TileSet.
+
+    Allows the Solver to pick a random Cell with least entropy without
+    rescanning the whole grid. Buckets hold Cells in a list with a
+    position lookup, so adding, removing and choosing a random Cell are O(1).
+    '''
+    def __init__(self, cells: list[Cell]|None = None, rng: random.Random|None = None) -> None:
+        '''
+        - cells - Cells to index, collapsed and empty Cells are skipped
+        - rng - random number generator used to break ties, defaults to module random
+        '''
+        self.rng = rng if rng is not None else random
+        '''
+        + _buckets - {tile_set_size: [Cell]}
+        + _positions - {Cell: (tile_set_size, index in bucket)}
+        + _min_size - lower bound of smallest non-empty bucket key
+        '''
+        self._buckets: dict[int, list[Cell]] = {}
+        self._positions: dict[Cell, tuple[int, int]] = {}
+        self._min_size: int = 0
+
+        for cell in cells or []:
+            self.update(cell)
+
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+    def __contains__(self, cell: Cell) -> bool:
+        return cell in self._positions
+
+
+    def update(self, cell: Cell) -> None:
+        '''
+        Moves Cell to the bucket matching its current TileSet size.
+        Should be invoked whenever a Cell's TileSet is reduced.
+
+        If Cell is collapsed or has no Tile's left, it is removed from the index.
+        '''
+        size = cell.get_tile_set_size()
+
+        if size <= 0:
+            self.remove(cell)
+            return
+
+        if cell in self._positions:
+            if self._positions[cell][0] == size:
+                return
+            self.remove(cell)
+
+        bucket = self._buckets.setdefault(size, [])
+        self._positions[cell] = (size, len(bucket))
+        bucket.append(cell)
+
+        if len(self._positions) == 1 or size < self._min_size:
+            self._min_size = size
+
+
+    def remove(self, cell: Cell) -> None:
+        '''
+        Removes Cell from the index, if present.
+        Last Cell of the bucket takes its place, to avoid shifting the bucket.
+        '''
+        if cell not in self._positions:
+            return
+
+        size, index = self._positions.pop(cell)
+        bucket = self._buckets[size]
+        last_cell = bucket.pop()
+
+        if last_cell is not cell:
+            bucket[index] = last_cell
+            self._positions[last_cell] = (size, index)
+
+
+    def get_min_size(self) -> int|None:
+        '''
+        Returns the smallest TileSet size of indexed Cells.
+        If index is empty, returns None.
+        '''
+        if len(self._positions) == 0:
+            return None
+
+        while len(self._buckets.get(self._min_size, [])) == 0:
+            self._min_size += 1
+
+        return self._min_size
+
+
+    def choose(self) -> Cell|None:
+        '''
+        Returns a random Cell with the smallest TileSet size, without removing it.
+        If index is empty, returns None.
+
+        Cells whose state was changed without calling update are re-indexed
+        lazily, before one is chosen.
+        '''
+        while (min_size := self.get_min_size()) is not None:
+            cell = self.rng.choice(self._buckets[min_size])
+
+            if cell.get_tile_set_size() == min_size:
+                return cell
+
+            self.update(cell)
+
+        return None
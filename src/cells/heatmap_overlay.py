@@ -0,0 +1,151 @@
+'''
+HeatmapOverlay of the number of possible tiles in each cell
+'''
+import math
+from tkinter import Canvas
+
+from PIL import ImageDraw
+
+from src.cells.canvas_image import CanvasImage
+from src.cells.cell import Cell
+
+
+METRICS = ('size', 'entropy')
+# cells at least this many pixels high also show the number of possible tiles
+LABEL_MIN_CELL_SIZE = 24
+
+COLLAPSED_COLOR = (0, 0, 0, 0)
+CONTRADICTION_COLOR = (255, 0, 0, 160)
+# colors of cells with one possible tile, and with every tile possible
+LOW_COLOR = (255, 220, 0)
+HIGH_COLOR = (0, 80, 255)
+HEAT_ALPHA = 120
+LABEL_COLOR = (0, 0, 0, 255)
+
+
+def get_heat(size: int, max_size: int, metric: str = 'size') -> float:
+    '''
+    Returns how undecided a cell with @size possible tiles out of @max_size is,
+    from 0 (one possible tile) to 1 (every tile possible).
+
+    - metric - 'size' grows linearly with the number of possible tiles,
+               'entropy' grows with its logarithm, the entropy of equally likely tiles
+    '''
+    if max_size <= 1:
+        return 0.0
+
+    if metric == 'entropy':
+        return math.log(size) / math.log(max_size)
+
+    return (size - 1) / (max_size - 1)
+
+
+def get_heat_color(heat: float) -> tuple[int, int, int, int]:
+    '''
+    Returns the RGBA color of @heat, blended from LOW_COLOR to HIGH_COLOR.
+    '''
+    return (*(round(low + (high - low) * heat) for low, high in zip(LOW_COLOR, HIGH_COLOR)),
+            HEAT_ALPHA)
+
+
+class HeatmapOverlay:
+    '''
+    A translucent image over the whole grid, coloring each not collapsed cell
+    by its number of possible tiles, so a large grid is diagnosed with one canvas item.
+
+    Only cells updated since the last flush are pushed to the canvas.
+    '''
+    # shows the overlay on canvas, replaced in tests
+    canvas_image_type = CanvasImage
+
+    def __init__(self,
+                 canvas: Canvas,
+                 rows: int,
+                 columns: int,
+                 cell_size: tuple[int, int],
+                 metric: str = 'size',
+                 show_labels: bool|None = None) -> None:
+        '''
+        - canvas - tkinter canvas to draw on
+        - rows - rows in grid
+        - columns - columns in grid
+        - cell_size - size of cells in pixels
+        - metric - how cells are colored, one of METRICS
+        - show_labels - draw the number of possible tiles in each cell,
+                        if None only when cells are at least LABEL_MIN_CELL_SIZE high
+        '''
+        if metric not in METRICS:
+            raise ValueError(f'Invalid heatmap metric. Expected one of {METRICS}.')
+
+        self.cell_size = tuple(cell_size)
+        self.metric = metric
+        self.show_labels = self.cell_size[1] >= LABEL_MIN_CELL_SIZE if show_labels is None \
+                           else show_labels
+        self.canvas_image = self.canvas_image_type(canvas,
+                                                   (columns * cell_size[0], rows * cell_size[1]),
+                                                   cell_size,
+                                                   'RGBA',
+                                                   COLLAPSED_COLOR)
+        '''
+        + _draw - draws labels into the overlay image
+        + _colors - {(size, max size): color}, as few distinct sizes repeat
+        '''
+        self._draw = ImageDraw.Draw(self.canvas_image.image)
+        self._colors: dict[tuple[int, int], tuple[int, int, int, int]] = {}
+
+
+    def update(self, cell: Cell) -> None:
+        '''
+        Colors @cell by its number of possible tiles, transparent if it is collapsed.
+        '''
+        x = cell.column * self.cell_size[0]
+        y = cell.row * self.cell_size[1]
+        box = (x, y, x + self.cell_size[0], y + self.cell_size[1])
+        size = cell.get_tile_set_size()
+
+        self.canvas_image.paste(self._get_color(size, len(cell.domain.tile_set)), box)
+
+        if self.show_labels is True and size != -1:
+            self._draw.text((x + self.cell_size[0] // 2, y + self.cell_size[1] // 2),
+                            str(size),
+                            fill=LABEL_COLOR,
+                            anchor='mm')
+
+
+    def update_all(self, cells: list[Cell]) -> None:
+        '''
+        Colors every cell in @cells.
+        '''
+        for cell in cells:
+            self.update(cell)
+
+
+    def flush(self) -> None:
+        '''
+        Pushes cells updated since the last flush to the canvas.
+        '''
+        self.canvas_image.flush()
+
+
+    def delete(self) -> None:
+        '''
+        Removes the overlay from canvas.
+        '''
+        self.canvas_image.delete()
+
+
+    def _get_color(self, size: int, max_size: int) -> tuple[int, int, int, int]:
+        '''
+        Returns the color of a cell with @size possible tiles out of @max_size.
+        '''
+        if size == -1:
+            return COLLAPSED_COLOR
+
+        if size == 0:
+            return CONTRADICTION_COLOR
+
+        key = (size, max_size)
+        if key not in self._colors:
+            self._colors[key] = get_heat_color(get_heat(size, max_size, self.metric))
+
+        return self._colors[key]
@@ -0,0 +1,75 @@
+'''
+PhotoImageCache of tile images shown on a tk.Canvas
+'''
+from typing import Callable
+
+from PIL import Image, ImageTk
+
+from src.tiles.tile import Tile
+
+
+class PhotoImageCache:
+    '''
+    Keeps one PhotoImage per Tile and cell size, shared by every cell showing that Tile,
+    so a grid needs as many Tk images as there are distinct tiles, not as many as cells.
+
+    Must be cleared when the TileSet is switched or its tiles are resized,
+    see invalidate_for.
+    '''
+    def __init__(self,
+                 photo_image_factory: Callable[[Image.Image], object] = ImageTk.PhotoImage) -> None:
+        '''
+        - photo_image_factory - creates a Tk image from a PIL image
+        '''
+        self.photo_image_factory = photo_image_factory
+        '''
+        + _photo_images - {(id(tile), cell size): (tile image, PhotoImage)}
+        + _tile_set_id - id of the TileSet the cached images belong to
+        + _cell_size - cell size the cached images belong to
+        '''
+        self._photo_images: dict[tuple[int, tuple[int, int]], tuple[Image.Image, object]] = {}
+        self._tile_set_id: int|None = None
+        self._cell_size: tuple[int, int]|None = None
+
+
+    def __len__(self) -> int:
+        return len(self._photo_images)
+
+
+    def get_photo_image(self, tile: Tile, cell_size: tuple[int, int]) -> object:
+        '''
+        Returns the PhotoImage of @tile at @cell_size, creating it on first use.
+        A PhotoImage is created again if the image of @tile was replaced.
+        '''
+        key = (id(tile), tuple(cell_size))
+        cached = self._photo_images.get(key)
+
+        # the tile image is kept with the PhotoImage, so its id is not reused
+        if cached is not None and cached[0] is tile.image:
+            return cached[1]
+
+        photo_image = self.photo_image_factory(tile.image)
+        self._photo_images[key] = (tile.image, photo_image)
+
+        return photo_image
+
+
+    def invalidate_for(self, tile_set: object, cell_size: tuple[int, int]) -> None:
+        '''
+        Clears the cache if @tile_set or @cell_size differ from the ones
+        of the cached images. Reloading the same TileSet keeps them.
+        '''
+        cell_size = tuple(cell_size)
+
+        if id(tile_set) != self._tile_set_id or cell_size != self._cell_size:
+            self.clear()
+
+        self._tile_set_id = id(tile_set)
+        self._cell_size = cell_size
+
+
+    def clear(self) -> None:
+        '''
+        Drops every PhotoImage.
+        '''
+        self._photo_images.clear()
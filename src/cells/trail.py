@@ -0,0 +1,48 @@
+'''
+Trail undo log
+'''
+from collections.abc import Iterator
+
+from src.cells.cell import Cell, CellState
+
+
+class Trail:
+    '''
+    Undo log of changes made to Cell's while solving.
+
+    Before a Cell is changed, its previous state is recorded.
+    Undoing back to a mark only restores the Cell's changed since that mark,
+    so its cost is proportional to the number of changes, not to the grid size.
+    '''
+    def __init__(self) -> None:
+        '''
+        + _entries - [(Cell, state before change)], oldest first
+        '''
+        self._entries: list[tuple[Cell, CellState]] = []
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    def mark(self) -> int:
+        '''
+        Returns a mark of the current point in the trail, to undo back to later.
+        '''
+        return len(self._entries)
+
+
+    def record(self, cell: Cell, state: CellState) -> None:
+        '''
+        Records the state of a Cell before it was changed.
+        '''
+        self._entries.append((cell, state))
+
+
+    def pop_to(self, mark: int) -> Iterator[tuple[Cell, CellState]]:
+        '''
+        Removes entries recorded after @mark and yields them newest first,
+        so restoring them in order undoes all changes made after @mark.
+        '''
+        while len(self._entries) > mark:
+            yield self._entries.pop()
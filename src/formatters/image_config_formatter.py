@@ -1,135 +1,195 @@
-'''
-Formats tile set image configurations.
-'''
-import copy
-from src.exceptions.tile_set_format_error import TileSetFormatError
-
-
-def format_image_configs(configs: dict) -> dict:
-    '''
-    Formats tile set image configurations to standardize configs.
-    The yaml configuration files are in a more human
-    readable format, making it easier to write.
-    '''
-    formatted_configs = copy.deepcopy(configs)
-
-    for image_name in configs:
-        try:
-            directions = configs[image_name]['directions']
-            formatted_configs[image_name]['directions'] = _format_directions(directions)
-        except KeyError as e:
-            raise TileSetFormatError('Invalid tile description. Directions are missing.') from e
-
-        try:
-            rotations = formatted_configs[image_name]['rotations']
-            formatted_configs[image_name]['rotations'] = _format_rotations(rotations)
-        except KeyError:
-            formatted_configs[image_name]['rotations'] = []
-
-    return formatted_configs
-
-
-def _format_directions(directions, k: int = 12) -> str:
-    '''
-    Formats direction into a K long character string
-    for a Tile sides_code.
-    '''
-    if isinstance(directions, int):
-        return _format_directions_int(directions, k)
-
-    if isinstance(directions, str):
-        return _format_directions_str(directions, k)
-
-    if isinstance(directions, dict):
-        return _format_directions_dict(directions)
-
-    raise TileSetFormatError('Unknown direction format.')
-
-
-def _format_directions_int(directions: int, k: int = 12) -> str:
-    '''
-    Formats integer digit into a K long character string.
-    
-    - 1 -> '111111111111'
-    - 5 -> '555555555555'
-    '''
-    if directions < 0 or directions > 9:
-        raise TileSetFormatError('Integer directions must be digits [0:9]')
-
-    return str(directions) * k
-
-
-def _format_directions_str(directions: str, k: int = 12) -> str:
-    '''
-    Formats string into a K long character string.
-    All spaces ' ' are replaced with ''.
-    
-    + directions - must be a string of len of 1 or 12
-    
-    - 'a' -> 'aaaaaaaaaaaa'
-    - '+' -> '++++++++++++'
-    '''
-    directions = directions.replace(' ', '')
-
-    if len(directions) == 1:
-        return directions * k
-
-    if len(directions) != k:
-        raise TileSetFormatError('Invalid direction string. Must be 12 characters long.')
-
-    return directions
-
-
-def _format_directions_dict(directions: dict) -> str:
-    '''
-    Formats dict into a K character string.
-    
-    - 'directions': -> '111222333444'
-      - 'north': 1
-      - 'east': 2
-      - 'south': 3
-      - 'west': 4
-    '''
-    if len(directions) != 4:
-        raise TileSetFormatError('Invalid direction dict. Must be 4 entries.')
-
-    correct_order = _get_correct_directions_order(directions)
-    correct_directions = [_format_directions(x, 3) for x in correct_order]
-    return ''.join(correct_directions)
-
-
-def _get_correct_directions_order(directions: dict[str, int|str]) -> list[int|str]:
-    '''
-    Accepts a dict with four keys ['north', 'east', 'south', 'west']
-    and returns a list with their values in order of
-    NORTH, EAST, SOUTH, WEST.
-    '''
-    try:
-        correct_order = [
-            directions['north'],
-            directions['east'],
-            directions['south'],
-            directions['west']
-        ]
-        return correct_order
-    except KeyError as e:
-        raise TileSetFormatError('Invalid directions keys. Must be [north|east|south|west]') from e
-
-
-def _format_rotations(rotations: int) -> list[tuple[int , str]]:
-    '''
-    Accepts an integer rotations and returns a list of tuples:
-    [(amount_of_rotations, rotation_direction)]
-    
-    - rotations: 3 -> [(1, 'left'), (2, 'left'), (3, 'left')]
-    '''
-    if isinstance(rotations, int):
-        formatted_rotations = [
-            (item, 'left')
-            for item
-            in range(1, rotations+1)
-        ]
-
-        return formatted_rotations
-
-    raise TileSetFormatError('Unknown rotations format. Must be an integer.')
+'''
+Formats tile set image configurations.
+'''
+import copy
+from src.exceptions.tile_set_format_error import TileSetFormatError
+
+
+# key of the section describing the atlas image, in tile sets made of one image
+ATLAS_KEY = 'atlas'
+
+
+def format_image_configs(configs: dict) -> dict:
+    '''
+    Formats tile set image configurations to standardize configs.
+    The yaml configuration files are in a more human
+    readable format, making it easier to write.
+
+    If configs have an ATLAS_KEY section, each tile is a cell of one atlas image,
+    and the position of each tile in the atlas is formatted too.
+    '''
+    formatted_configs = copy.deepcopy(configs)
+
+    if ATLAS_KEY in configs:
+        formatted_configs[ATLAS_KEY] = _format_atlas(configs[ATLAS_KEY])
+        _format_positions(formatted_configs)
+
+    for image_name in configs:
+        if image_name == ATLAS_KEY:
+            continue
+
+        try:
+            directions = configs[image_name]['directions']
+            formatted_configs[image_name]['directions'] = _format_directions(directions)
+        except KeyError as e:
+            raise TileSetFormatError('Invalid tile description. Directions are missing.') from e
+
+        try:
+            rotations = formatted_configs[image_name]['rotations']
+            formatted_configs[image_name]['rotations'] = _format_rotations(rotations)
+        except KeyError:
+            formatted_configs[image_name]['rotations'] = []
+
+    return formatted_configs
+
+
+def _format_directions(directions, k: int = 12) -> str:
+    '''
+    Formats direction into a K long character string
+    for a Tile sides_code.
+    '''
+    if isinstance(directions, int):
+        return _format_directions_int(directions, k)
+
+    if isinstance(directions, str):
+        return _format_directions_str(directions, k)
+
+    if isinstance(directions, dict):
+        return _format_directions_dict(directions)
+
+    raise TileSetFormatError('Unknown direction format.')
+
+
+def _format_directions_int(directions: int, k: int = 12) -> str:
+    '''
+    Formats integer digit into a K long character string.
+    
+    - 1 -> '111111111111'
+    - 5 -> '555555555555'
+    '''
+    if directions < 0 or directions > 9:
+        raise TileSetFormatError('Integer directions must be digits [0:9]')
+
+    return str(directions) * k
+
+
+def _format_directions_str(directions: str, k: int = 12) -> str:
+    '''
+    Formats string into a K long character string.
+    All spaces ' ' are replaced with ''.
+    
+    + directions - must be a string of len of 1 or 12
+    
+    - 'a' -> 'aaaaaaaaaaaa'
+    - '+' -> '++++++++++++'
+    '''
+    directions = directions.replace(' ', '')
+
+    if len(directions) == 1:
+        return directions * k
+
+    if len(directions) != k:
+        raise TileSetFormatError('Invalid direction string. Must be 12 characters long.')
+
+    return directions
+
+
+def _format_directions_dict(directions: dict) -> str:
+    '''
+    Formats dict into a K character string.
+    
+    - 'directions': -> '111222333444'
+      - 'north': 1
+      - 'east': 2
+      - 'south': 3
+      - 'west': 4
+    '''
+    if len(directions) != 4:
+        raise TileSetFormatError('Invalid direction dict. Must be 4 entries.')
+
+    correct_order = _get_correct_directions_order(directions)
+    correct_directions = [_format_directions(x, 3) for x in correct_order]
+    return ''.join(correct_directions)
+
+
+def _get_correct_directions_order(directions: dict[str, int|str]) -> list[int|str]:
+    '''
+    Accepts a dict with four keys ['north', 'east', 'south', 'west']
+    and returns a list with their values in order of
+    NORTH, EAST, SOUTH, WEST.
+    '''
+    try:
+        correct_order = [
+            directions['north'],
+            directions['east'],
+            directions['south'],
+            directions['west']
+        ]
+        return correct_order
+    except KeyError as e:
+        raise TileSetFormatError('Invalid directions keys. Must be [north|east|south|west]') from e
+
+
+def _format_rotations(rotations: int) -> list[tuple[int , str]]:
+    '''
+    Accepts an integer rotations and returns a list of tuples:
+    [(amount_of_rotations, rotation_direction)]
+    
+    - rotations: 3 -> [(1, 'left'), (2, 'left'), (3, 'left')]
+    '''
+    if isinstance(rotations, int):
+        formatted_rotations = [
+            (item, 'left')
+            for item
+            in range(1, rotations+1)
+        ]
+
+        return formatted_rotations
+
+    raise TileSetFormatError('Unknown rotations format. Must be an integer.')
+
+
+def _format_atlas(atlas: dict) -> dict:
+    '''
+    Formats the atlas section of a tile set configuration.
+
+    - 'atlas': -> {'image': 'atlas.png', 'tile_size': (40, 40)}
+      - 'image': 'atlas.png'
+      - 'tile_size': 40 or [40, 40]
+    '''
+    if not isinstance(atlas, dict) or 'image' not in atlas or 'tile_size' not in atlas:
+        raise TileSetFormatError('Invalid atlas description. Must have image and tile_size.')
+
+    tile_size = atlas['tile_size']
+
+    if isinstance(tile_size, int):
+        tile_size = [tile_size, tile_size]
+
+    if not isinstance(tile_size, list) or len(tile_size) != 2 \
+       or not all(isinstance(x, int) and x > 0 for x in tile_size):
+        raise TileSetFormatError('Invalid atlas tile_size. Must be an integer or [width, height].')
+
+    return {'image': str(atlas['image']), 'tile_size': (tile_size[0], tile_size[1])}
+
+
+def _format_positions(configs: dict) -> None:
+    '''
+    Formats the position in the atlas of each tile to a tuple (row, column),
+    or to an index of a cell in the atlas, counted row by row.
+    Tiles without a position take the index of their description in configs.
+
+    - 'position': [1, 2] -> (1, 2)
+    - 'position': 5 -> 5
+    '''
+    tile_names = [name for name in configs if name != ATLAS_KEY]
+
+    for index, image_name in enumerate(tile_names):
+        position = configs[image_name].get('position', index)
+
+        if isinstance(position, int) and position >= 0:
+            configs[image_name]['position'] = position
+        elif isinstance(position, list) and len(position) == 2 \
+             and all(isinstance(x, int) and x >= 0 for x in position):
+            configs[image_name]['position'] = (position[0], position[1])
+        else:
+            raise TileSetFormatError('Invalid atlas position. Must be [row, column] or an index.')
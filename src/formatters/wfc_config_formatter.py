@@ -4,6 +4,10 @@ Formats configs for main program
 import copy
 
 
+# frames per second of the solver animation, when configs do not give any
+DEFAULT_SOLVER_FPS = 30
+
+
 def format_wfc_configs(configs: dict) -> dict:
     '''
     Formats main configurations of WFC program.
@@ -13,6 +17,9 @@ def format_wfc_configs(configs: dict) -> dict:
     cell_size = formatted_configs['default_cell_size']
     formatted_configs['default_cell_size'] = _format_cell_size(cell_size)
 
+    solver_fps = formatted_configs.get('default_solver_fps', DEFAULT_SOLVER_FPS)
+    formatted_configs['default_solver_fps'] = _format_solver_fps(solver_fps)
+
     return formatted_configs
 
 
@@ -30,3 +37,16 @@ def _format_cell_size(cell_size: int|tuple[int, int]|list[int]) -> tuple[int, in
         return cell_size
 
     raise ValueError('Invalid default_cell_size format.')
+
+
+def _format_solver_fps(solver_fps: int|float|None) -> int|float|None:
+    '''
+    Checks default solver fps is a positive number, or None for turbo mode.
+    '''
+    if solver_fps is None:
+        return None
+
+    if isinstance(solver_fps, (int, float)) and not isinstance(solver_fps, bool) and solver_fps > 0:
+        return solver_fps
+
+    raise ValueError('Invalid default_solver_fps format.')
@@ -0,0 +1,184 @@
+'''
+Generates many images in parallel, one Solver per process
+'''
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterable
+
+from src.cells.cell_grid import CellGrid
+from src.solver.solver import Solver
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_manager import TileSetManager
+from src.tiles.tile_set_pack import PACK_FILE_EXTENSION, load_tile_set_pack, save_tile_set_pack
+
+
+SUMMARY_FILE_NAME = 'summary.json'
+
+
+@dataclass
+class BatchConfig:
+    '''
+    Settings shared by every job of a batch.
+
+    - tile_set_name - name of the TileSet, used in image file names
+    - rows - rows in grid
+    - columns - columns in grid
+    - cell_size - size of cells in pixels
+    - backend - Solver backend
+    - search - Solver search
+    - output_dir - directory images are written to
+    '''
+    tile_set_name: str
+    rows: int
+    columns: int
+    cell_size: tuple[int, int]
+    backend: str = 'python'
+    search: str = 'greedy'
+    output_dir: Path = Path('output')
+
+
+@dataclass
+class JobResult:
+    '''
+    Outcome of generating one image.
+    '''
+    seed: int
+    path: str
+    is_solved: bool
+    invalid_cells: int
+    solve_time: float
+    save_time: float
+
+
+@dataclass
+class BatchSummary:
+    '''
+    Outcome of a batch, with the result of each job in order of seeds.
+    '''
+    config: BatchConfig
+    workers: int
+    elapsed: float = 0.0
+    jobs: list[JobResult] = field(default_factory=list)
+
+
+    def to_dict(self) -> dict:
+        '''
+        Returns the summary as a dict of JSON types.
+        '''
+        summary = asdict(self)
+        summary['config']['output_dir'] = str(self.config.output_dir)
+        summary['solved'] = sum(job.is_solved for job in self.jobs)
+        return summary
+
+
+# state of a worker process, set once by _init_worker and reused by every job
+_worker_state: dict = {}
+
+
+def _init_worker(pack_path: Path, config: BatchConfig) -> None:
+    '''
+    Keeps the TileSet and settings in the worker process,
+    so they are read once per worker instead of once per job.
+
+    Tile images are mapped from the packed archive at @pack_path,
+    so every worker shares the same page cached pixels.
+    '''
+    tile_set = load_tile_set_pack(pack_path, share_pixels=True)
+    tile_set_manager = TileSetManager({config.tile_set_name: tile_set})
+
+    _worker_state['config'] = config
+    _worker_state['cell_grid'] = CellGrid(config.rows,
+                                          config.columns,
+                                          config.cell_size,
+                                          tile_set_manager)
+
+
+def _run_job(seed: int) -> JobResult:
+    '''
+    Solves a grid seeded with @seed and saves its image.
+    '''
+    config: BatchConfig = _worker_state['config']
+    cell_grid: CellGrid = _worker_state['cell_grid']
+
+    start_time = perf_counter()
+    cell_grid.seed(seed)
+    cell_grid.switch_tile_set(config.tile_set_name)
+
+    solver = Solver(cell_grid, 0, config.backend, config.search)
+    is_solved = solver.start(update_canvas=False)
+
+    invalid_cells = sum(cell.get_tile_set_size() == 0
+                        for cell_row in cell_grid.cells
+                        for cell in cell_row)
+    solver.check_invalid()
+    solve_time = perf_counter() - start_time
+
+    start_time = perf_counter()
+    path = Path(config.output_dir, f'{config.tile_set_name}_{seed}.png')
+    cell_grid.get_current_image().save(path)
+    save_time = perf_counter() - start_time
+
+    return JobResult(seed=seed,
+                     path=str(path),
+                     is_solved=is_solved,
+                     invalid_cells=invalid_cells,
+                     solve_time=solve_time,
+                     save_time=save_time)
+
+
+def generate_batch(tile_set: TileSet,
+                   config: BatchConfig,
+                   seeds: Iterable[int],
+                   workers: int|None = None,
+                   on_result: Callable[[JobResult], None]|None = None) -> BatchSummary:
+    '''
+    Generates one image for each seed in @seeds, spreading the jobs over
+    a pool of worker processes, and writes a summary of the batch
+    to SUMMARY_FILE_NAME in the output directory.
+
+    The TileSet is resized, compiled and written to a temporary packed archive once,
+    which each worker maps when it starts, instead of receiving a copy of every image.
+
+    - tile_set - TileSet the images are made of
+    - config - settings shared by every job
+    - seeds - seed of each image, the same seed always gives the same image
+    - workers - number of worker processes, one per core if None
+    - on_result - invoked with the result of each job, in order of seeds
+    '''
+    seeds = list(seeds)
+    workers = workers or os.cpu_count() or 1
+
+    tile_set.resize_tiles(config.cell_size)
+    tile_set.compile()
+    os.makedirs(config.output_dir, exist_ok=True)
+
+    summary = BatchSummary(config, workers)
+    start_time = perf_counter()
+
+    # few jobs per message, but enough chunks to keep every worker busy
+    chunk_size = max(1, len(seeds) // (workers * 4))
+
+    with tempfile.TemporaryDirectory() as pack_directory:
+        pack_path = Path(pack_directory, config.tile_set_name + PACK_FILE_EXTENSION)
+        save_tile_set_pack(tile_set, pack_path)
+
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=(pack_path, config)) as executor:
+            for result in executor.map(_run_job, seeds, chunksize=chunk_size):
+                summary.jobs.append(result)
+
+                if on_result is not None:
+                    on_result(result)
+
+    summary.elapsed = perf_counter() - start_time
+
+    with open(Path(config.output_dir, SUMMARY_FILE_NAME), 'w', encoding='utf-8') as file:
+        json.dump(summary.to_dict(), file, indent=2)
+
+    return summary
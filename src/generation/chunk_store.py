@@ -0,0 +1,149 @@
+'''
+ChunkStore of solved chunks on disk
+'''
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from src.generation.chunks import Chunk
+from src.solver.restart import derive_seed
+from src.tiles.tile_set import TileSet
+
+
+# magic, rows, columns, master seed, tile set hash, seed, is_solved, attempt
+HEADER = struct.Struct('<4sHHQ16sQ?H')
+MAGIC = b'WFC2'
+TILE_SET_HASH_SIZE = 16
+# tile indices are stored as little-endian signed 16 bit integers, -1 for no tile
+INDEX_TYPE = 'h'
+INDEX_SIZE = array(INDEX_TYPE).itemsize
+
+
+def get_tile_set_hash(tile_set: TileSet) -> bytes:
+    '''
+    Returns a hash of the adjacency table of @tile_set. Chunks are made
+    from tile indices and adjacency alone, so a TileSet with another hash
+    gives other chunks for the same seeds.
+    '''
+    key = repr(tile_set.get_adjacency_table()).encode()
+    return hashlib.sha256(key).digest()[:TILE_SET_HASH_SIZE]
+
+
+class ChunkStore:
+    '''
+    Keeps solved chunks in a directory, one small file per chunk,
+    holding a header and the chunk's tile indices as a flat array.
+
+    Each world, given by its chunk size, master seed and tile set hash, keeps
+    its chunks in its own subdirectory, so worlds sharing a directory never
+    overwrite each other's chunks. The header records the world too, and files
+    that do not match it, like files in an older format, are treated as missing.
+    '''
+    def __init__(self,
+                 directory: Path,
+                 chunk_size: tuple[int, int],
+                 master_seed: int,
+                 tile_set_hash: bytes) -> None:
+        '''
+        - directory - directory the subdirectories of worlds are kept in, created if missing
+        - chunk_size - (rows, columns) of cells in a chunk
+        - master_seed - seed the chunks are derived from
+        - tile_set_hash - hash of the TileSet of the chunks, see get_tile_set_hash
+        '''
+        if len(tile_set_hash) != TILE_SET_HASH_SIZE:
+            raise ValueError(f'tile_set_hash must be {TILE_SET_HASH_SIZE} bytes')
+
+        self.chunk_size = chunk_size
+        self.master_seed = master_seed
+        self.tile_set_hash = tile_set_hash
+        '''
+        + _master_seed_key - master seed as 64 bits, master seeds can be any int
+        '''
+        self._master_seed_key = derive_seed(master_seed)
+
+        rows, columns = chunk_size
+        self.directory = Path(directory,
+                              f'{rows}x{columns}_{self._master_seed_key:016x}_{tile_set_hash.hex()}')
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+
+    def __contains__(self, coordinates: tuple[int, int]) -> bool:
+        return self._read(*coordinates) is not None
+
+
+    def save(self, chunk: Chunk) -> None:
+        '''
+        Writes @chunk to its file, replacing the file only once it is complete,
+        so readers never see a partly written chunk.
+        '''
+        rows, columns = self.chunk_size
+        indices = array(INDEX_TYPE, (index for row in chunk.tile_indices for index in row))
+
+        if sys.byteorder == 'big':
+            indices.byteswap()
+
+        path = self._get_path(chunk.chunk_row, chunk.chunk_column)
+        temporary_path = path.with_suffix('.tmp')
+
+        with open(temporary_path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, rows, columns, self._master_seed_key, self.tile_set_hash,
+                                   chunk.seed, chunk.is_solved, chunk.attempt))
+            file.write(indices.tobytes())
+
+        os.replace(temporary_path, path)
+
+
+    def load(self, chunk_row: int, chunk_column: int) -> Chunk|None:
+        '''
+        Reads the chunk at the given coordinates.
+        If it was never saved, or its file does not match this world, returns None.
+        '''
+        data = self._read(chunk_row, chunk_column)
+
+        if data is None:
+            return None
+
+        rows, columns = self.chunk_size
+        seed, is_solved, attempt = HEADER.unpack_from(data)[5:]
+
+        indices = array(INDEX_TYPE)
+        indices.frombytes(data[HEADER.size:])
+
+        if sys.byteorder == 'big':
+            indices.byteswap()
+
+        tile_indices = [indices[row * columns:(row + 1) * columns].tolist() for row in range(rows)]
+        return Chunk(chunk_row, chunk_column, seed, tile_indices, is_solved, attempt)
+
+
+    def _read(self, chunk_row: int, chunk_column: int) -> bytes|None:
+        '''
+        Returns the contents of the file of the chunk at the given coordinates.
+        If there is none, or its header does not match this world, returns None.
+        The file is left as it is, to be replaced by the next save.
+        '''
+        path = self._get_path(chunk_row, chunk_column)
+
+        if not path.exists():
+            return None
+
+        data = path.read_bytes()
+        rows, columns = self.chunk_size
+
+        # in an older format, or written for another world
+        if len(data) != HEADER.size + rows * columns * INDEX_SIZE or \
+           HEADER.unpack_from(data)[:5] != (MAGIC, rows, columns,
+                                            self._master_seed_key, self.tile_set_hash):
+            return None
+
+        return data
+
+
+    def _get_path(self, chunk_row: int, chunk_column: int) -> Path:
+        '''
+        Returns the path of the file of the chunk at the given coordinates.
+        '''
+        return Path(self.directory, f'{chunk_row}_{chunk_column}.chunk')
@@ -0,0 +1,298 @@
+'''
+Generates worlds too large for one grid, one chunk at a time
+'''
+import itertools
+import random
+from dataclasses import dataclass
+from typing import Iterator
+
+from PIL import Image
+
+from src.cells.cell_grid import CellGrid
+from src.constants import VALID_REDUCE_MOVES
+from src.direction import Direction
+from src.solver.restart import derive_seed
+from src.solver.solver import Solver
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_manager import TileSetManager
+
+
+CHUNK_TILE_SET_NAME = 'chunk_tile_set'
+
+# chunks per side of a super-chunk, must be even
+SUPER_CHUNK_SIZE = 8
+
+
+def get_chunk_level(chunk_row: int, chunk_column: int, super_chunk_size: int = SUPER_CHUNK_SIZE) -> int:
+    '''
+    Returns the level of the chunk at the given coordinates, the number of chunks
+    between it and the nearest anchor chunk, one at each multiple of @super_chunk_size,
+    counted along rows and columns that wrap every @super_chunk_size chunks.
+    '''
+    row, column = chunk_row % super_chunk_size, chunk_column % super_chunk_size
+    return min(row, super_chunk_size - row) + min(column, super_chunk_size - column)
+
+
+def get_chunk_dependencies(chunk_row: int,
+                           chunk_column: int,
+                           super_chunk_size: int = SUPER_CHUNK_SIZE) -> dict[Direction, tuple[int, int]]:
+    '''
+    Returns {side of chunk: coordinates of neighbour chunk} of the chunks
+    whose edges are the borders of the chunk at the given coordinates.
+
+    A chunk depends on the neighbours with a lower level, see get_chunk_level.
+    Levels of neighbour chunks always differ by one when @super_chunk_size is even,
+    so dependencies never form a cycle, and every chain of them ends at an anchor
+    chunk at most @super_chunk_size chunks away. Chunks are then the same
+    in any order they are solved in, and solving one costs the same wherever it is.
+
+    The chunk in the middle of each super-chunk has borders on all four sides,
+    so tile sets whose tiles constrain cells far away, like rows of tiles
+    that must run across a whole chunk, may leave it with invalid cells.
+    '''
+    if super_chunk_size < 2 or super_chunk_size % 2 != 0:
+        raise ValueError(f'super_chunk_size must be even and positive: {super_chunk_size}')
+
+    level = get_chunk_level(chunk_row, chunk_column, super_chunk_size)
+    dependencies = {}
+
+    # the neighbour's side facing the chunk is opposite to the chunk's side facing it
+    for i, j, neighbour_side in VALID_REDUCE_MOVES:
+        coordinates = (chunk_row + i, chunk_column + j)
+        if get_chunk_level(*coordinates, super_chunk_size) < level:
+            dependencies[neighbour_side.get_opposite()] = coordinates
+
+    return dependencies
+
+
+@dataclass
+class Chunk:
+    '''
+    A solved chunk of the world.
+
+    - chunk_row, chunk_column - coordinates of the chunk, in chunks
+    - seed - seed the chunk was solved with
+    - tile_indices - index in the TileSet of each cell's tile, -1 if it has none
+    - is_solved - False if some cell was left without tiles
+    - attempt - attempt the chunk was solved in, starting from 0
+    '''
+    chunk_row: int
+    chunk_column: int
+    seed: int
+    tile_indices: list[list[int]]
+    is_solved: bool
+    attempt: int = 0
+
+
+    def get_edge(self, direction: Direction) -> list[int]:
+        '''
+        Returns the tile indices on the @direction side of the chunk,
+        left to right for NORTH and SOUTH, top to bottom for EAST and WEST.
+        '''
+        match direction:
+            case Direction.NORTH: return list(self.tile_indices[0])
+            case Direction.SOUTH: return list(self.tile_indices[-1])
+            case Direction.WEST: return [row[0] for row in self.tile_indices]
+            case Direction.EAST: return [row[-1] for row in self.tile_indices]
+
+        raise ValueError(f'Invalid chunk edge direction: {direction}')
+
+
+class ChunkGenerator:
+    '''
+    Solves a world as a grid of fixed-size chunks.
+
+    Cells on the border of a new chunk are restricted to tiles that fit
+    the edges of already solved neighbour chunks, so chunks join without seams.
+    Each chunk is solved with a seed derived from the master seed and its coordinates.
+    If a chunk is left with cells without tiles, it is solved again with a new seed,
+    derived from the number of the attempt, up to max_attempts times.
+    '''
+    def __init__(self,
+                 tile_set: TileSet,
+                 chunk_size: tuple[int, int],
+                 master_seed: int|None = None,
+                 cell_size: tuple[int, int]|None = None,
+                 backend: str = 'python',
+                 search: str = 'greedy',
+                 max_attempts: int = 1) -> None:
+        '''
+        - tile_set - TileSet chunks are made of
+        - chunk_size - (rows, columns) of cells in a chunk
+        - master_seed - seed all chunk seeds are derived from, random if None
+        - cell_size - size of cells in pixels, size of tile images if None
+        - backend - Solver backend
+        - search - Solver search
+        - max_attempts - attempts made to solve each chunk
+        '''
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+
+        if cell_size is None:
+            cell_size = tile_set.get_tile_image_size()
+
+        self.tile_set = tile_set
+        self.chunk_size = chunk_size
+        self.master_seed = random.getrandbits(64) if master_seed is None else master_seed
+        self.cell_size = cell_size
+        self.backend = backend
+        self.search = search
+        self.max_attempts = max_attempts
+
+        self.tile_set.resize_tiles(cell_size)
+        self.tile_set.compile()
+
+        # one grid is reused for every chunk
+        self._cell_grid = CellGrid(chunk_size[0],
+                                   chunk_size[1],
+                                   cell_size,
+                                   TileSetManager({CHUNK_TILE_SET_NAME: tile_set}))
+
+
+    def get_seed(self, chunk_row: int, chunk_column: int, attempt: int = 0) -> int:
+        '''
+        Returns the seed of the chunk at the given coordinates,
+        for attempt number @attempt, starting from 0.
+        '''
+        if attempt == 0:
+            return derive_seed(self.master_seed, chunk_row, chunk_column)
+
+        return derive_seed(self.master_seed, chunk_row, chunk_column, attempt)
+
+
+    def generate_chunk(self,
+                       chunk_row: int,
+                       chunk_column: int,
+                       borders: dict[Direction, list[int]]|None = None) -> Chunk:
+        '''
+        Solves the chunk at the given coordinates.
+
+        - borders - {side of chunk: edge of the solved neighbour chunk on that side},
+                    as returned by Chunk.get_edge of the neighbour
+
+        Returns the first solved attempt, or the last attempt if none was solved.
+        '''
+        border_masks = self._get_border_masks(borders or {})
+
+        for attempt in range(self.max_attempts):
+            chunk, are_borders_valid = self._solve_chunk(chunk_row, chunk_column,
+                                                         border_masks, attempt)
+
+            # no seed can fix borders that leave some cell without tiles
+            if chunk.is_solved is True or are_borders_valid is False:
+                break
+
+        return chunk
+
+
+    def _solve_chunk(self,
+                     chunk_row: int,
+                     chunk_column: int,
+                     border_masks: dict[tuple[int, int], int],
+                     attempt: int) -> tuple[Chunk, bool]:
+        '''
+        Makes one attempt to solve the chunk at the given coordinates,
+        with its border cells restricted to @border_masks.
+
+        Returns the chunk, and False if the borders alone left some cell without tiles.
+        '''
+        seed = self.get_seed(chunk_row, chunk_column, attempt)
+        cell_grid = self._cell_grid
+        cell_grid.seed(seed)
+        cell_grid.switch_tile_set(CHUNK_TILE_SET_NAME)
+
+        are_borders_valid = True
+        for (row, column), mask in border_masks.items():
+            if cell_grid.restrict(row, column, mask) is not None:
+                are_borders_valid = False
+
+        solver = Solver(cell_grid, 0, self.backend, self.search)
+        is_solved = solver.start(update_canvas=False) and are_borders_valid
+        solver.check_invalid()
+
+        chunk = Chunk(chunk_row, chunk_column, seed, cell_grid.get_tile_indices(), is_solved, attempt)
+        return chunk, are_borders_valid
+
+
+    def stream(self,
+               chunk_columns: int,
+               chunk_rows: int|None = None,
+               first_chunk_row: int = 0) -> Iterator[Chunk]:
+        '''
+        Solves chunks row by row, @chunk_columns chunks per row, yielding each
+        chunk once it is solved. Each chunk takes its borders from
+        the chunk to its WEST and the chunk to its NORTH.
+
+        Only the SOUTH edges of the previous row of chunks are kept,
+        so memory does not grow with the number of rows.
+        If @chunk_rows is None, rows are generated without end.
+        '''
+        rows = itertools.count(first_chunk_row) if chunk_rows is None \
+               else range(first_chunk_row, first_chunk_row + chunk_rows)
+        north_edges: list[list[int]|None] = [None] * chunk_columns
+
+        for chunk_row in rows:
+            west_edge = None
+
+            for chunk_column in range(chunk_columns):
+                borders = {}
+                if north_edges[chunk_column] is not None:
+                    borders[Direction.NORTH] = north_edges[chunk_column]
+                if west_edge is not None:
+                    borders[Direction.WEST] = west_edge
+
+                chunk = self.generate_chunk(chunk_row, chunk_column, borders)
+                north_edges[chunk_column] = chunk.get_edge(Direction.SOUTH)
+                west_edge = chunk.get_edge(Direction.EAST)
+
+                yield chunk
+
+
+    def get_image(self, chunk: Chunk, background_color: str = 'white') -> Image.Image:
+        '''
+        Constructs an Image of @chunk from the images of its tiles.
+        Cells without a tile are filled with @background_color.
+        '''
+        rows, columns = self.chunk_size
+        width, height = self.cell_size
+        image = Image.new('RGB', (columns * width, rows * height), color=background_color)
+
+        for row, row_indices in enumerate(chunk.tile_indices):
+            for column, tile_index in enumerate(row_indices):
+                if tile_index != -1:
+                    image.paste(self.tile_set[tile_index].image, (column * width, row * height))
+
+        return image
+
+
+    def _get_border_masks(self, borders: dict[Direction, list[int]]) -> dict[tuple[int, int], int]:
+        '''
+        Returns {(row, column): bitmask of allowed tiles} for cells of the chunk
+        next to the given neighbour edges, matched with VALID_REDUCE_MOVES
+        as if the edge tiles were collapsed cells just outside the chunk.
+        '''
+        rows, columns = self.chunk_size
+        outside_positions = {
+            Direction.NORTH: [(-1, column) for column in range(columns)],
+            Direction.SOUTH: [(rows, column) for column in range(columns)],
+            Direction.WEST: [(row, -1) for row in range(rows)],
+            Direction.EAST: [(row, columns) for row in range(rows)],
+        }
+
+        masks = {}
+        for direction, edge in borders.items():
+            for (row, column), tile_index in zip(outside_positions[direction], edge):
+                # an invalid neighbour cell puts no constraints on the chunk
+                if tile_index == -1:
+                    continue
+
+                for i, j, self_dir in VALID_REDUCE_MOVES:
+                    if not (0 <= row + i < rows and 0 <= column + j < columns):
+                        continue
+
+                    # tiles fitting on the side of the edge tile facing the cell
+                    mask = self.tile_set.get_adjacency_mask(tile_index, self_dir.get_opposite())
+                    key = (row + i, column + j)
+                    masks[key] = masks.get(key, self.tile_set.get_full_mask()) & mask
+
+        return masks
@@ -0,0 +1,175 @@
+'''
+Solves chunks of a world in parallel, one ChunkGenerator per process
+'''
+import heapq
+import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Iterator
+
+from src.direction import Direction
+from src.generation.chunks import Chunk, ChunkGenerator, get_chunk_dependencies, get_chunk_level
+from src.tiles.tile_set_pack import PACK_FILE_EXTENSION, load_tile_set_pack, save_tile_set_pack
+
+
+# state of a worker process, set once by _init_worker and reused by every chunk
+_worker_state: dict = {}
+
+
+def _init_worker(pack_path: Path, settings: dict) -> None:
+    '''
+    Creates the ChunkGenerator of the worker process,
+    so the TileSet is read once per worker instead of once per chunk.
+    Tile images are mapped from the packed archive, shared by every worker.
+    '''
+    tile_set = load_tile_set_pack(pack_path, share_pixels=True)
+    _worker_state['generator'] = ChunkGenerator(tile_set, **settings)
+
+
+def _solve_chunk(chunk_row: int,
+                 chunk_column: int,
+                 borders: dict[Direction, list[int]]) -> Chunk:
+    '''
+    Solves a chunk in a worker process.
+    '''
+    return _worker_state['generator'].generate_chunk(chunk_row, chunk_column, borders)
+
+
+class ChunkScheduler:
+    '''
+    Solves a region of chunks with a pool of worker processes,
+    giving the same chunks as a LazyWorld with the same ChunkGenerator.
+
+    A chunk is queued as soon as the neighbours it depends on (see get_chunk_dependencies)
+    are solved. Queued chunks with the lowest level (see get_chunk_level) are sent first,
+    so solving spreads out from the anchor chunks, and edges of solved chunks
+    are dropped once no chunk needs them.
+    Idle workers take the next queued chunk, so slow chunks do not hold up the others.
+
+    Retries are made by each worker, which solves a failed chunk again
+    with a new derived seed, up to the generator's max_attempts.
+    '''
+    def __init__(self,
+                 generator: ChunkGenerator,
+                 workers: int|None = None,
+                 max_pending: int|None = None) -> None:
+        '''
+        - generator - settings of this ChunkGenerator are used by every worker
+        - workers - number of worker processes, one per core if None
+        - max_pending - maximum number of chunks sent to workers at once,
+                        four per worker if None
+        '''
+        self.generator = generator
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 4
+
+
+    def solve(self, chunk_rows: range, chunk_columns: range) -> Iterator[Chunk]:
+        '''
+        Solves the chunks in @chunk_rows and @chunk_columns,
+        yielding each chunk as soon as it is solved.
+
+        Chunks outside the region that chunks in it depend on, directly or not,
+        are solved too, but not yielded. They are all within a super-chunk of the region.
+        '''
+        region = {(row, column) for row in chunk_rows for column in chunk_columns}
+        dependencies = self._get_dependencies(region)
+
+        # {neighbour: chunks depending on it}, and number of neighbours each chunk waits for
+        dependents: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        for coordinates, neighbours in dependencies.items():
+            for neighbour in neighbours.values():
+                dependents.setdefault(neighbour, []).append(coordinates)
+
+        waiting = {coordinates: len(neighbours) for coordinates, neighbours in dependencies.items()}
+        # (level, chunk) of chunks whose neighbours are solved
+        ready = [(get_chunk_level(*coordinates), coordinates)
+                 for coordinates, count
+                 in waiting.items()
+                 if count == 0]
+        heapq.heapify(ready)
+        # {neighbour: solved Chunk}, kept until every dependent chunk is queued
+        solved: dict[tuple[int, int], Chunk] = {}
+        pending: dict[Future, tuple[int, int]] = {}
+
+        settings = {
+            'chunk_size': self.generator.chunk_size,
+            'master_seed': self.generator.master_seed,
+            'cell_size': self.generator.cell_size,
+            'backend': self.generator.backend,
+            'search': self.generator.search,
+            'max_attempts': self.generator.max_attempts,
+        }
+
+        with tempfile.TemporaryDirectory() as pack_directory:
+            pack_path = Path(pack_directory, 'chunks' + PACK_FILE_EXTENSION)
+            save_tile_set_pack(self.generator.tile_set, pack_path)
+
+            with ProcessPoolExecutor(max_workers=self.workers,
+                                     initializer=_init_worker,
+                                     initargs=(pack_path, settings)) as executor:
+                while ready or pending:
+                    while ready and len(pending) < self.max_pending:
+                        _, coordinates = heapq.heappop(ready)
+                        borders = self._get_borders(coordinates, dependencies, dependents, solved)
+                        pending[executor.submit(_solve_chunk, *coordinates, borders)] = coordinates
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        coordinates = pending.pop(future)
+                        chunk = future.result()
+
+                        if coordinates in dependents:
+                            solved[coordinates] = chunk
+
+                        for dependent in dependents.get(coordinates, ()):
+                            waiting[dependent] -= 1
+
+                            if waiting[dependent] == 0:
+                                heapq.heappush(ready, (get_chunk_level(*dependent), dependent))
+
+                        if coordinates in region:
+                            yield chunk
+
+
+    @staticmethod
+    def _get_dependencies(region: set[tuple[int, int]]) -> dict[tuple[int, int],
+                                                                dict[Direction, tuple[int, int]]]:
+        '''
+        Returns {chunk: {side: neighbour}} of the chunks in @region
+        and every chunk they depend on, directly or not.
+        '''
+        dependencies = {}
+        unvisited = list(region)
+
+        while unvisited:
+            coordinates = unvisited.pop()
+
+            if coordinates not in dependencies:
+                dependencies[coordinates] = get_chunk_dependencies(*coordinates)
+                unvisited.extend(dependencies[coordinates].values())
+
+        return dependencies
+
+
+    @staticmethod
+    def _get_borders(coordinates: tuple[int, int],
+                     dependencies: dict[tuple[int, int], dict[Direction, tuple[int, int]]],
+                     dependents: dict[tuple[int, int], list[tuple[int, int]]],
+                     solved: dict[tuple[int, int], Chunk]) -> dict[Direction, list[int]]:
+        '''
+        Returns the borders of the chunk at @coordinates, taken from the edges
+        of its solved neighbours. Neighbours no other chunk waits for are forgotten.
+        '''
+        borders = {}
+
+        for direction, neighbour in dependencies[coordinates].items():
+            borders[direction] = solved[neighbour].get_edge(direction.get_opposite())
+
+            dependents[neighbour].remove(coordinates)
+            if len(dependents[neighbour]) == 0:
+                del solved[neighbour]
+
+        return borders
@@ -0,0 +1,174 @@
+'''
+LazyWorld of chunks generated when they are first queried
+'''
+from collections import OrderedDict
+from pathlib import Path
+
+from src.generation.chunk_store import ChunkStore, get_tile_set_hash
+from src.generation.chunks import Chunk, ChunkGenerator, get_chunk_dependencies, get_chunk_level
+from src.tiles.tile import Tile
+
+
+class LazyWorld:
+    '''
+    An unbounded world whose chunks are generated on first use.
+
+    Chunks take their borders from the chunks given by get_chunk_dependencies,
+    so a chunk is the same no matter which part of the world is queried first.
+    A chunk needs the chunks it depends on to be generated first, all within a few
+    super-chunks of it, so queries far from the origin cost as much as queries near it.
+
+    The most recently used chunks are kept in memory. When there are more than
+    cache_size of them, the least recently used one is written to the ChunkStore,
+    if there is one, and read back from it when it is needed again.
+    '''
+    def __init__(self,
+                 generator: ChunkGenerator,
+                 cache_size: int = 64,
+                 store_directory: Path|None = None) -> None:
+        '''
+        - generator - generates chunks of the world
+        - cache_size - maximum number of chunks kept in memory
+        - store_directory - directory evicted chunks are written to,
+                            if None they are generated again when needed.
+                            Chunks stored for another master seed or TileSet are generated again
+        '''
+        if cache_size < 1:
+            raise ValueError('cache_size must be at least 1')
+
+        self.generator = generator
+        self.cache_size = cache_size
+        self.store = None if store_directory is None \
+                     else ChunkStore(store_directory,
+                                     generator.chunk_size,
+                                     generator.master_seed,
+                                     get_tile_set_hash(generator.tile_set))
+        '''
+        + _chunks - {(chunk row, chunk column): Chunk}, least recently used first
+        '''
+        self._chunks: OrderedDict[tuple[int, int], Chunk] = OrderedDict()
+        self.generated_chunks = 0
+
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+
+    def tile_index_at(self, x: int, y: int) -> int:
+        '''
+        Returns the index in the TileSet of the tile of the cell
+        in column @x and row @y of the world, -1 if it has none.
+        '''
+        rows, columns = self.generator.chunk_size
+        chunk = self.get_chunk(y // rows, x // columns)
+        return chunk.tile_indices[y % rows][x % columns]
+
+
+    def tile_at(self, x: int, y: int) -> Tile|None:
+        '''
+        Returns the tile of the cell in column @x and row @y of the world,
+        None if it has none.
+        '''
+        tile_index = self.tile_index_at(x, y)
+        return None if tile_index == -1 else self.generator.tile_set[tile_index]
+
+
+    def get_chunk(self, chunk_row: int, chunk_column: int) -> Chunk:
+        '''
+        Returns the chunk at the given coordinates, reading it from memory,
+        the ChunkStore, or generating it, in that order.
+        '''
+        coordinates = (chunk_row, chunk_column)
+
+        if coordinates in self._chunks:
+            self._chunks.move_to_end(coordinates)
+            return self._chunks[coordinates]
+
+        chunk = None if self.store is None else self.store.load(chunk_row, chunk_column)
+
+        if chunk is None:
+            chunk = self._generate_chunk(chunk_row, chunk_column)
+
+        self._add_chunk(chunk)
+        return chunk
+
+
+    def _generate_chunk(self, chunk_row: int, chunk_column: int) -> Chunk:
+        '''
+        Generates the chunk at the given coordinates, after the chunks it depends on.
+
+        Chunks it depends on, directly or through other chunks, that are neither
+        in memory nor in the ChunkStore are generated first, lowest level first,
+        see get_chunk_level. No chunk is generated twice.
+        '''
+        coordinates = (chunk_row, chunk_column)
+
+        # {(chunk row, chunk column): Chunk}, None for chunks still to be generated
+        chunks: dict[tuple[int, int], Chunk|None] = {coordinates: None}
+        unvisited = [coordinates]
+
+        while unvisited:
+            for dependency in get_chunk_dependencies(*unvisited.pop()).values():
+                if dependency in chunks:
+                    continue
+
+                chunks[dependency] = self._find_chunk(*dependency)
+                if chunks[dependency] is None:
+                    unvisited.append(dependency)
+
+        # chunks always have a higher level than the chunks they depend on
+        missing = sorted((key for key, chunk in chunks.items() if chunk is None),
+                         key=lambda key: (get_chunk_level(*key), key))
+
+        for row, column in missing:
+            chunks[(row, column)] = self._solve_chunk(row, column, chunks)
+
+            if (row, column) != coordinates:
+                self._add_chunk(chunks[(row, column)])
+
+        return chunks[coordinates]
+
+
+    def _find_chunk(self, chunk_row: int, chunk_column: int) -> Chunk|None:
+        '''
+        Returns the chunk at the given coordinates from memory or the ChunkStore,
+        without generating it. If it is in neither, returns None.
+        '''
+        chunk = self._chunks.get((chunk_row, chunk_column))
+
+        if chunk is None and self.store is not None:
+            chunk = self.store.load(chunk_row, chunk_column)
+
+        return chunk
+
+
+    def _solve_chunk(self,
+                     chunk_row: int,
+                     chunk_column: int,
+                     solved: dict[tuple[int, int], Chunk]) -> Chunk:
+        '''
+        Solves the chunk at the given coordinates, with borders taken
+        from the chunks it depends on, which must be in @solved.
+        '''
+        borders = {
+            direction: solved[coordinates].get_edge(direction.get_opposite())
+            for direction, coordinates
+            in get_chunk_dependencies(chunk_row, chunk_column).items()
+        }
+
+        self.generated_chunks += 1
+        return self.generator.generate_chunk(chunk_row, chunk_column, borders)
+
+
+    def _add_chunk(self, chunk: Chunk) -> None:
+        '''
+        Keeps @chunk in memory, evicting the least recently used chunk if there are too many.
+        '''
+        self._chunks[(chunk.chunk_row, chunk.chunk_column)] = chunk
+
+        while len(self._chunks) > self.cache_size:
+            coordinates, evicted = self._chunks.popitem(last=False)
+
+            # chunks never change, so a stored chunk is not written again
+            if self.store is not None and coordinates not in self.store:
+                self.store.save(evicted)
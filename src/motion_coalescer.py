@@ -0,0 +1,46 @@
+'''Motion coalescer'''
+from typing import Callable
+
+
+class MotionCoalescer:
+    '''
+    Coalesces mouse motion events, so that their handler runs at most once per frame,
+    with the position of the last event in that frame.
+    Events in between only overwrite the last position.
+    '''
+    def __init__(self,
+                 schedule: Callable[[int, Callable[[], None]], object],
+                 handler: Callable[[int, int], None],
+                 frame_time: int = 16) -> None:
+        '''
+        - schedule - invokes a callback after the given milliseconds, widget.after for Tk
+        - handler - invoked with (x, y) of the last event of a frame
+        - frame_time - milliseconds between two invocations of handler
+        '''
+        self.schedule = schedule
+        self.handler = handler
+        self.frame_time = frame_time
+        self.last_x = 0
+        self.last_y = 0
+        self.is_scheduled = False
+
+
+    def on_motion(self, event) -> None:
+        '''
+        Remembers the position of @event, and schedules handler if it is not scheduled yet.
+        Bound to '<Motion>'.
+        '''
+        self.last_x = event.x
+        self.last_y = event.y
+
+        if self.is_scheduled is False:
+            self.is_scheduled = True
+            self.schedule(self.frame_time, self.flush)
+
+
+    def flush(self) -> None:
+        '''
+        Invokes handler with the last position.
+        '''
+        self.is_scheduled = False
+        self.handler(self.last_x, self.last_y)
@@ -1,34 +1,115 @@
-"""
-Gives functionality to read images(directory with image files[png or jpeg]).
-"""
-
-from pathlib import Path
-
-from PIL import Image
-
-
-def read_images(directory_path: Path, file_extension: str = '.png') -> dict[str, Image.Image]:
-    '''
-    Opens all image files with @file_extension in specified @directory_path.
-    
-    Returns a dict of {'image_name': PIL.Image}.
-    
-    - directory_path - Path of directory from which images are read
-    - file_extension - only images with this extension are opened
-    '''
-    return {
-        image_path.stem: read_image(directory_path / image_path.name)
-        for image_path
-        in directory_path.glob('*' + file_extension)
-    }
-
-
-def read_image(image_file_path: Path) -> Image.Image:
-    '''
-    Tries to open a PIL.Image file from given path.
-    
-    If file exists and is in a format PIL can read, returns an Image.
-    
-    - image_file_path - Path of image file
-    '''
-    return Image.open(image_file_path, 'r')
+"""
+Gives functionality to read images(directory with image files[png or jpeg]).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+
+# mode every image is converted to by load_images
+DEFAULT_IMAGE_MODE = 'RGBA'
+
+
+def read_images(directory_path: Path, file_extension: str = '.png') -> dict[str, Image.Image]:
+    '''
+    Opens all image files with @file_extension in specified @directory_path.
+    
+    Returns a dict of {'image_name': PIL.Image}.
+    
+    - directory_path - Path of directory from which images are read
+    - file_extension - only images with this extension are opened
+    '''
+    return {
+        image_path.stem: read_image(directory_path / image_path.name)
+        for image_path
+        in directory_path.glob('*' + file_extension)
+    }
+
+
+def read_image(image_file_path: Path) -> Image.Image:
+    '''
+    Tries to open a PIL.Image file from given path.
+    
+    If file exists and is in a format PIL can read, returns an Image.
+    
+    - image_file_path - Path of image file
+    '''
+    return Image.open(image_file_path, 'r')
+
+
+def load_images(directory_path: Path,
+                file_extension: str = '.png',
+                mode: str|None = DEFAULT_IMAGE_MODE,
+                max_workers: int|None = None) -> dict[str, Image.Image]:
+    '''
+    Same as read_images, but images are decoded at once, in a pool of threads,
+    and their files are closed. Pillow decodes without holding the GIL,
+    so images are decoded in parallel.
+
+    Returns a dict of {'image_name': PIL.Image}.
+
+    - directory_path - Path of directory from which images are read
+    - file_extension - only images with this extension are opened
+    - mode - mode every image is converted to, None to keep the mode of each file
+    - max_workers - number of threads, chosen by ThreadPoolExecutor if None
+    '''
+    image_paths = sorted(directory_path.glob('*' + file_extension))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        images = executor.map(lambda image_path: load_image(image_path, mode), image_paths)
+        return {image_path.stem: image for image_path, image in zip(image_paths, images)}
+
+
+def load_image(image_file_path: Path, mode: str|None = DEFAULT_IMAGE_MODE) -> Image.Image:
+    '''
+    Opens and decodes a PIL.Image file from given path, then closes the file.
+
+    - image_file_path - Path of image file
+    - mode - mode the image is converted to, None to keep the mode of the file
+    '''
+    with Image.open(image_file_path, 'r') as image:
+        image.load()
+
+    if mode is not None and image.mode != mode:
+        return image.convert(mode)
+
+    return image
+
+
+def read_atlas(image_file_path: Path,
+               tile_size: tuple[int, int],
+               positions: dict[str, int|tuple[int, int]],
+               mode: str|None = DEFAULT_IMAGE_MODE) -> dict[str, Image.Image]:
+    '''
+    Decodes one atlas image, a grid of tiles, and slices it into one image per tile.
+    The atlas is read and decoded once, tiles are cropped from the decoded pixels.
+
+    Returns a dict of {'image_name': PIL.Image}.
+
+    - image_file_path - Path of atlas image file
+    - tile_size - (width, height) of each tile in the atlas
+    - positions - {'image_name': (row, column)} of each tile in the atlas grid,
+                  or the index of the tile, counted row by row
+    - mode - mode the atlas is converted to, None to keep the mode of the file
+
+    Raises ValueError if a position is outside the atlas.
+    '''
+    atlas = load_image(image_file_path, mode)
+    width, height = tile_size
+    columns, rows = atlas.width // width, atlas.height // height
+
+    images = {}
+    for image_name, position in positions.items():
+        row, column = divmod(position, columns) if isinstance(position, int) else position
+
+        if not (0 <= row < rows and 0 <= column < columns):
+            raise ValueError(f'Tile {image_name} at {position} is outside the atlas.')
+
+        images[image_name] = atlas.crop((column * width,
+                                         row * height,
+                                         (column + 1) * width,
+                                         (row + 1) * height))
+
+    return images
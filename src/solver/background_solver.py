@@ -0,0 +1,241 @@
+'''
+BackgroundSolver, running a Solver on a worker thread while a GUI stays responsive
+'''
+import queue
+import threading
+from typing import Callable
+
+from src.cells.cell import Cell
+from src.cells.cell_grid import GridObserver
+from src.solver.render_scheduler import RenderScheduler
+from src.solver.solver import Solver
+from src.solver.solver_control import SolverControl
+from src.tiles.tile import Tile
+
+
+# milliseconds between two checks for the end of a turbo solve
+TURBO_POLL_TIME = 100
+
+
+class QueuedObserver(GridObserver):
+    '''
+    Collects the events of a grid changed on a worker thread, and passes them
+    to the wrapped observers on the thread that drains them, in the same order.
+    '''
+    def __init__(self, observers: list[GridObserver]) -> None:
+        '''
+        - observers - observers the events are passed to when drained
+        '''
+        self.observers = observers
+        self._events: queue.SimpleQueue = queue.SimpleQueue()
+
+
+    def on_load(self, cells: list[list[Cell]]) -> None:
+        self._events.put(('on_load', (cells,)))
+
+
+    def on_collapse(self, cell: Cell, tile: Tile) -> None:
+        self._events.put(('on_collapse', (cell, tile)))
+
+
+    def on_reduce(self, cell: Cell) -> None:
+        self._events.put(('on_reduce', (cell,)))
+
+
+    def on_restore(self, cell: Cell) -> None:
+        self._events.put(('on_restore', (cell,)))
+
+
+    def drain(self, coalesce: bool = False) -> int:
+        '''
+        Passes the events collected before the call to the observers,
+        then lets them redraw once. Events collected while draining are left
+        for the next call, so a worker adding events cannot hold up the draining thread.
+        Returns the number of events taken from the queue.
+
+        - coalesce - if True, each cell is passed one event, see _coalesce.
+                     Only valid once the grid stopped changing
+        '''
+        # only the draining thread takes events, so at least this many are queued
+        count = self._events.qsize()
+        events = [self._events.get_nowait() for _ in range(count)]
+
+        if coalesce is True:
+            events = self._coalesce(events)
+
+        for name, arguments in events:
+            for observer in self.observers:
+                getattr(observer, name)(*arguments)
+
+        if count > 0:
+            for observer in self.observers:
+                observer.refresh()
+
+        return count
+
+
+    @staticmethod
+    def _coalesce(events: list[tuple[str, tuple]]) -> list[tuple[str, tuple]]:
+        '''
+        Returns the last on_load event of @events, if there is one, followed by
+        one event per cell changed after it, in the order cells first changed.
+
+        A cell whose last event is on_collapse keeps it. A cell that was only reduced
+        keeps its last on_reduce. Any other cell gets on_restore, which observers
+        draw from the current state of the cell.
+        '''
+        load_events = []
+        # {(row, column): event}
+        changes: dict[tuple[int, int], tuple[str, tuple]] = {}
+
+        for name, arguments in events:
+            if name == 'on_load':
+                load_events = [(name, arguments)]
+                changes.clear()
+                continue
+
+            coordinates = arguments[0].get_coordinates()
+            previous = changes.get(coordinates)
+
+            # a reduce does not redraw a cell collapsed or restored earlier in the events
+            if name == 'on_reduce' and previous is not None and previous[0] != 'on_reduce':
+                name = 'on_restore'
+
+            changes[coordinates] = (name, arguments)
+
+        return [*load_events, *changes.values()]
+
+
+class BackgroundSolver:
+    '''
+    Runs a Solver on a worker thread. Observers of its grid, like a CanvasObserver,
+    are replaced by a QueuedObserver while it runs, and the changes are passed
+    to them in batches, once per frame of the RenderScheduler, by polling
+    on the thread that started it. In turbo mode they are passed once, at the end,
+    one per changed cell.
+
+    The grid must not be changed by another thread while the Solver runs.
+    '''
+    def __init__(self,
+                 solver: Solver,
+                 schedule: Callable[[int, Callable[[], None]], object],
+                 render_scheduler: RenderScheduler|None = None,
+                 on_done: Callable[['BackgroundSolver'], None]|None = None) -> None:
+        '''
+        - solver - Solver to run, its control is replaced by a new SolverControl
+        - schedule - invokes a callback after the given milliseconds on the polling
+                     thread, root.after for a Tk window
+        - render_scheduler - gives the frames per second changes are shown at,
+                             30 if None
+        - on_done - invoked on the polling thread, after the Solver stopped
+                    and every change was passed to the observers
+        '''
+        self.solver = solver
+        self.schedule = schedule
+        self.render_scheduler = render_scheduler or RenderScheduler()
+        self.on_done = on_done
+        self.control = SolverControl()
+        self.is_solved: bool|None = None
+        self.error: BaseException|None = None
+        '''
+        + _observers - observers of the grid, restored when the Solver stops
+        + _queued_observer - collects events of the grid while the Solver runs
+        + _thread - worker thread the Solver runs on
+        '''
+        self._observers: list[GridObserver] = []
+        self._queued_observer: QueuedObserver|None = None
+        self._thread: threading.Thread|None = None
+
+        self.solver.control = self.control
+
+
+    def start(self) -> None:
+        '''
+        Starts the Solver on a worker thread, and polls for its changes.
+        '''
+        if self._thread is not None:
+            raise RuntimeError('BackgroundSolver can only be started once.')
+
+        cell_grid = self.solver.cell_manager
+        self._observers = cell_grid.observers
+        self._queued_observer = QueuedObserver(self._observers)
+        cell_grid.observers = [self._queued_observer]
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.schedule(self._get_frame_time(), self.poll)
+
+
+    def is_running(self) -> bool:
+        '''
+        Returns True if the Solver was started and has not stopped yet.
+        '''
+        return self._thread is not None and self._thread.is_alive()
+
+
+    def pause(self) -> None:
+        '''
+        Pauses the Solver before its next step.
+        '''
+        self.control.pause()
+
+
+    def resume(self) -> None:
+        '''
+        Lets a paused Solver continue.
+        '''
+        self.control.resume()
+
+
+    def cancel(self) -> None:
+        '''
+        Stops the Solver before its next step, leaving cells as they are.
+        '''
+        self.control.cancel()
+
+
+    def poll(self) -> None:
+        '''
+        Passes the changes made since the last poll to the observers.
+        Polls again after a frame, until the Solver stopped.
+        '''
+        is_alive = self._thread.is_alive()
+
+        # once the Solver stopped, only the last state of each cell is drawn
+        if is_alive is False or self.render_scheduler.is_turbo() is False:
+            self._queued_observer.drain(coalesce=is_alive is False)
+
+        if is_alive is True:
+            self.schedule(self._get_frame_time(), self.poll)
+            return
+
+        self.solver.cell_manager.observers = self._observers
+
+        if self.error is not None:
+            raise self.error
+
+        if self.on_done is not None:
+            self.on_done(self)
+
+
+    def _get_frame_time(self) -> int:
+        '''
+        Returns the milliseconds between two polls.
+        '''
+        if self.render_scheduler.is_turbo():
+            return TURBO_POLL_TIME
+
+        return max(1, round(1000 / self.render_scheduler.fps))
+
+
+    def _run(self) -> None:
+        '''
+        Runs the Solver, on the worker thread.
+        '''
+        try:
+            self.is_solved = self.solver.start(update_canvas=False)
+
+            if self.control.is_cancelled() is False:
+                self.solver.check_invalid()
+        except Exception as error: # pylint: disable=broad-exception-caught
+            self.error = error
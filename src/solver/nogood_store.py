@@ -0,0 +1,86 @@
+'''
+NogoodStore of learned forbidden tile combinations
+'''
+from collections import OrderedDict
+
+
+# (row, column, tile index) - cell at (row, column) is collapsed to TileSet[tile index]
+Literal = tuple[int, int, int]
+Nogood = frozenset[Literal]
+
+
+class NogoodStore:
+    '''
+    Bounded store of nogoods - combinations of cell/tile choices,
+    that were found to always leave some cell without possible tiles.
+
+    When the store is full, the least recently used nogood is evicted,
+    so memory stays bounded no matter how many dead ends the Solver finds.
+    '''
+    def __init__(self, max_size: int = 4096) -> None:
+        '''
+        - max_size - maximum number of nogoods kept
+        '''
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+
+        self.max_size = max_size
+        '''
+        + _nogoods - nogoods, least recently used first
+        + _by_cell - {(row, column): nogoods with a literal on that cell}
+        '''
+        self._nogoods: OrderedDict[Nogood, None] = OrderedDict()
+        self._by_cell: dict[tuple[int, int], set[Nogood]] = {}
+
+
+    def __len__(self) -> int:
+        return len(self._nogoods)
+
+
+    def __contains__(self, nogood: Nogood) -> bool:
+        return nogood in self._nogoods
+
+
+    def add(self, nogood: Nogood) -> None:
+        '''
+        Stores @nogood, evicting the least recently used one if the store is full.
+        '''
+        if nogood in self._nogoods:
+            self._nogoods.move_to_end(nogood)
+            return
+
+        if len(self._nogoods) >= self.max_size:
+            evicted, _ = self._nogoods.popitem(last=False)
+            self._remove_from_cells(evicted)
+
+        self._nogoods[nogood] = None
+        for row, column, _ in nogood:
+            self._by_cell.setdefault((row, column), set()).add(nogood)
+
+
+    def get_nogoods(self, row: int, column: int) -> list[Nogood]:
+        '''
+        Returns nogoods with a literal on the given cell,
+        and marks them as recently used.
+        '''
+        nogoods = list(self._by_cell.get((row, column), ()))
+
+        for nogood in nogoods:
+            self._nogoods.move_to_end(nogood)
+
+        return nogoods
+
+
+    def _remove_from_cells(self, nogood: Nogood) -> None:
+        '''
+        Removes @nogood from the lookup of each cell it has a literal on.
+        '''
+        for row, column, _ in nogood:
+            cell_nogoods = self._by_cell.get((row, column))
+
+            if cell_nogoods is None:
+                continue
+
+            cell_nogoods.discard(nogood)
+            if len(cell_nogoods) == 0:
+                del self._by_cell[(row, column)]
@@ -0,0 +1,74 @@
+'''
+RenderScheduler, deciding when a running Solver lets the grid be redrawn
+'''
+from time import perf_counter
+from typing import Callable
+
+from src.cells.cell_grid import CellGrid
+
+
+class RenderScheduler:
+    '''
+    Coalesces the changes a Solver makes into frames, so the Solver runs
+    at full speed and the grid is redrawn at most fps times per second,
+    no matter how many cells are collapsed between two frames.
+
+    In turbo mode (fps is None) the grid is redrawn only once, when solving ends.
+    '''
+    def __init__(self,
+                 fps: float|None = 30,
+                 clock: Callable[[], float] = perf_counter) -> None:
+        '''
+        - fps - maximum frames per second, None for turbo mode
+        - clock - returns the current time in seconds
+        '''
+        if fps is not None and fps <= 0:
+            raise ValueError('fps must be positive')
+
+        self.fps = fps
+        self.clock = clock
+        self.frames = 0
+        '''
+        + _next_frame_time - earliest time of the next frame
+        '''
+        self._next_frame_time = 0.0
+
+
+    def is_turbo(self) -> bool:
+        '''
+        Returns True if the grid is redrawn only when solving ends.
+        '''
+        return self.fps is None
+
+
+    def step(self, cell_grid: CellGrid) -> bool:
+        '''
+        Invoked after each step of a Solver.
+        Redraws @cell_grid if a frame is due, returns True if it was redrawn.
+        '''
+        if self.fps is None:
+            return False
+
+        now = self.clock()
+        if now < self._next_frame_time:
+            return False
+
+        self._next_frame_time = now + 1 / self.fps
+        self._render(cell_grid)
+        return True
+
+
+    def finish(self, cell_grid: CellGrid) -> None:
+        '''
+        Invoked when a Solver stops, redraws @cell_grid with its final state.
+        '''
+        self._next_frame_time = 0.0
+        self._render(cell_grid)
+
+
+    def _render(self, cell_grid: CellGrid) -> None:
+        '''
+        Lets grid observers show the current state of cells.
+        '''
+        self.frames += 1
+        cell_grid.refresh()
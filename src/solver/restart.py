@@ -0,0 +1,113 @@
+'''
+Restart policy for the Solver
+'''
+import hashlib
+import random
+from dataclasses import dataclass
+
+
+SCHEDULES = ('luby', 'geometric')
+BUDGET_TYPES = ('steps', 'contradictions')
+
+
+def luby(index: int) -> int:
+    '''
+    Returns the @index-th element (starting from 1) of the Luby sequence:
+    1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8, ...
+    '''
+    if index < 1:
+        raise ValueError('index must be at least 1')
+
+    while True:
+        # smallest k, such that index <= 2^k - 1
+        k = index.bit_length()
+
+        if index == (1 << k) - 1:
+            return 1 << (k - 1)
+
+        index -= (1 << (k - 1)) - 1
+
+
+def derive_seed(master_seed: int, *parts: int|str) -> int:
+    '''
+    Derives a 64 bit seed from @master_seed and @parts (attempt number, coordinates...).
+    The same arguments always give the same seed, on any platform and Python version.
+    '''
+    key = repr((master_seed, *parts)).encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], 'big')
+
+
+@dataclass
+class RestartPolicy:
+    '''
+    Decides how many attempts the Solver makes, how much work each attempt may do
+    before it is abandoned, and which seed each attempt uses.
+
+    - schedule - 'luby' - budget is base_budget * luby(attempt),
+                 'geometric' - budget is base_budget * factor ^ attempt
+    - budget_type - 'steps' counts collapsed cells (batches of cells for the numpy backend),
+                    'contradictions' counts cells left without tiles
+    - base_budget - budget of the first attempt
+    - factor - growth of budget per attempt, for the geometric schedule
+    - max_attempts - attempts made before giving up
+    - master_seed - seed all attempt seeds are derived from, random if None
+    '''
+    schedule: str = 'luby'
+    budget_type: str = 'contradictions'
+    base_budget: int = 8
+    factor: float = 2.0
+    max_attempts: int = 16
+    master_seed: int|None = None
+
+
+    def __post_init__(self) -> None:
+        if self.schedule not in SCHEDULES:
+            raise ValueError(f'Invalid restart schedule. Expected one of {SCHEDULES}.')
+
+        if self.budget_type not in BUDGET_TYPES:
+            raise ValueError(f'Invalid restart budget type. Expected one of {BUDGET_TYPES}.')
+
+        if self.max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+
+        # fix the master seed, so a random run can be reported and repeated
+        if self.master_seed is None:
+            self.master_seed = random.getrandbits(64)
+
+
+    def get_budget(self, attempt: int) -> int:
+        '''
+        Returns the budget of attempt number @attempt, starting from 0.
+        '''
+        if self.schedule == 'luby':
+            return self.base_budget * luby(attempt + 1)
+
+        return int(self.base_budget * self.factor ** attempt)
+
+
+    def get_seed(self, attempt: int) -> int:
+        '''
+        Returns the seed of attempt number @attempt, starting from 0.
+        '''
+        return derive_seed(self.master_seed, attempt)
+
+
+@dataclass
+class AttemptReport:
+    '''
+    Outcome of one Solver attempt.
+    '''
+    attempt: int
+    seed: int
+    budget: int|None
+    elapsed: float = 0.0
+    steps: int = 0
+    contradictions: int = 0
+    is_solved: bool = False
+    is_over_budget: bool = False
+
+
+    def __str__(self) -> str:
+        outcome = 'solved' if self.is_solved else 'over budget' if self.is_over_budget else 'failed'
+        return (f'attempt {self.attempt}: {outcome} in {self.elapsed:.3f}s, '
+                f'{self.steps} steps, {self.contradictions} contradictions, seed {self.seed}')
@@ -1,39 +1,203 @@
 '''
 Solver class to automatically fill in grid cell. 
 '''
-import random
-from time import sleep
+from time import perf_counter, sleep
 
 from src.cells.cell import Cell
-from src.cells.cell_manager import CellManager
+from src.cells.cell_grid import CellGrid
+from src.cells.trail import Trail
+from src.solver.nogood_store import NogoodStore
+from src.solver.render_scheduler import RenderScheduler
+from src.solver.restart import AttemptReport, RestartPolicy
+from src.solver.solver_control import SolverControl
+from src.tiles.tile_set import get_mask_indices
+
+
+BACKENDS = ('python', 'numpy')
+SEARCH_MODES = ('greedy', 'backtracking', 'backjumping')
+
+# learned nogoods with more decisions than this are not stored
+MAX_NOGOOD_SIZE = 4
+NOGOOD_STORE_SIZE = 4096
 
 
 class Solver:
+    # pylint: disable=too-many-instance-attributes
     '''
     Constraint Satisfaction Problem Solver
     '''
-    def __init__(self, cell_manager: CellManager, delay = 0.1) -> None:
+    def __init__(self,
+                 cell_manager: CellGrid,
+                 delay = 0.1,
+                 backend: str = 'python',
+                 search: str = 'greedy',
+                 restart_policy: RestartPolicy|None = None,
+                 render_scheduler: RenderScheduler|None = None,
+                 control: SolverControl|None = None) -> None:
+        '''
+        - cell_manager - CellGrid whose cells are solved, a CellManager to draw them
+        - delay - time between collapsing cells in seconds, if there is no render_scheduler
+        - backend - 'python' collapses Cell's one by one,
+                    'numpy' solves the whole grid at once with a WaveEngine
+        - search - 'greedy' never revisits a choice, leaving dead-end cells empty,
+                   'backtracking' undoes choices that lead to a dead end,
+                   'backjumping' undoes choices back to the one that caused a dead end
+                   (python backend only)
+        - restart_policy - if given, the grid is reset and solved again with a new seed,
+                           whenever an attempt fails or runs out of budget
+        - render_scheduler - if given, cells are collapsed without delay and
+                             the grid is redrawn in frames decided by it
+        - control - if given, another thread can pause, resume or cancel the Solver
+                    between steps
+        '''
+        if backend not in BACKENDS:
+            raise ValueError(f'Invalid solver backend. Expected one of {BACKENDS}.')
+
+        if search not in SEARCH_MODES:
+            raise ValueError(f'Invalid solver search. Expected one of {SEARCH_MODES}.')
+
+        if backend == 'numpy' and search != 'greedy':
+            raise ValueError('The numpy backend only supports greedy search.')
+
         self.cell_manager = cell_manager
         self.delay = delay
+        self.backend = backend
+        self.search = search
+        self.restart_policy = restart_policy
+        self.render_scheduler = render_scheduler
+        self.control = control
+        self.reports: list[AttemptReport] = []
+        self.winning_seed: int|None = None
+        '''
+        + _budget - (budget type, budget) of the current attempt, None if unlimited
+        + _steps - cells collapsed in the current attempt
+        + _contradictions - cells left without tiles in the current attempt
+        '''
+        self._budget: tuple[str, int]|None = None
+        self._steps = 0
+        self._contradictions = 0
 
 
-    def start(self, update_canvas: bool = True) -> None:
+    def start(self, update_canvas: bool = True) -> bool:
         '''
         Solves the Constraint Satisfaction Problem of choosing appropriate tiles
         for each cell in grid.
+
+        Cells are taken from the CellGrid's EntropyIndex, so choosing
+        the next cell does not rescan the grid.
+
+        Returns True if no cell was left without possible tiles.
         '''
-        cells = self._get_cells()
-        cells = self._prune_collapsed_cells(cells)
+        try:
+            if self.restart_policy is not None:
+                return self._start_with_restarts(update_canvas)
+
+            return self._solve(update_canvas)
+        finally:
+            if update_canvas is True and self.render_scheduler is not None:
+                self.render_scheduler.finish(self.cell_manager)
+
+
+    def _start_with_restarts(self, update_canvas: bool) -> bool:
+        '''
+        Makes attempts to solve the grid, as given by the restart policy.
+        Before each attempt, cells are reset in place to their state before start,
+        and seeded with the attempt's seed.
+
+        A report of each attempt is kept in reports, and the seed of
+        the successful attempt in winning_seed.
+        '''
+        policy = self.restart_policy
+        states = self.cell_manager.get_cell_states()
+        self.reports = []
+        self.winning_seed = None
+
+        try:
+            for attempt in range(policy.max_attempts):
+                seed = policy.get_seed(attempt)
+                budget = policy.get_budget(attempt)
+
+                self.cell_manager.restore_cell_states(states)
+                self.cell_manager.seed(seed)
+                self._budget = (policy.budget_type, budget)
+
+                start_time = perf_counter()
+                is_solved = self._solve(update_canvas, seed)
+
+                self.reports.append(AttemptReport(attempt=attempt,
+                                                  seed=seed,
+                                                  budget=budget,
+                                                  elapsed=perf_counter() - start_time,
+                                                  steps=self._steps,
+                                                  contradictions=self._contradictions,
+                                                  is_solved=is_solved,
+                                                  is_over_budget=not is_solved and
+                                                                 self._is_over_budget()))
+
+                if is_solved is True:
+                    self.winning_seed = seed
+                    return True
+
+                if self.control is not None and self.control.is_cancelled():
+                    return False
+        finally:
+            self._budget = None
+            self.cell_manager.seed(None)
+
+        return False
+
+
+    def _solve(self, update_canvas: bool, seed: int|None = None) -> bool:
+        '''
+        Makes one attempt to solve the grid with the chosen backend and search.
+        '''
+        self._steps = 0
+        self._contradictions = 0
+
+        if self.backend == 'numpy':
+            return self._start_vectorised(seed)
 
-        for _ in range(len(cells)):
-            # remove collapsed cells
-            cells = self._prune_collapsed_cells(cells)
-            if len(cells) == 0:
-                break
+        if self.search in ('backtracking', 'backjumping'):
+            return self._start_backtracking(update_canvas)
 
-            # choose cell with least entropy
-            min_cells = self.get_min_cells(cells)
-            cell = random.choice(min_cells)
+        return self._start_greedy(update_canvas)
+
+
+    def _is_over_budget(self) -> bool:
+        '''
+        Returns True if the current attempt may not continue:
+        it made as many steps as its budget, or had more contradictions than its budget.
+        '''
+        if self._budget is None:
+            return False
+
+        budget_type, budget = self._budget
+
+        if budget_type == 'steps':
+            return self._steps >= budget
+
+        return self._contradictions > budget
+
+
+    def _is_cancelled(self) -> bool:
+        '''
+        Waits while the Solver is paused by its control.
+        Returns True if it was cancelled.
+        '''
+        return self.control is not None and self.control.checkpoint() is False
+
+
+    def _start_greedy(self, update_canvas: bool) -> bool:
+        '''
+        Collapses cells with least entropy, until every cell is collapsed.
+        Cells left without tiles are skipped.
+        '''
+        entropy_index = self.cell_manager.entropy_index
+
+        # choose a random cell with least entropy, until every cell is collapsed
+        while (cell := entropy_index.choose()) is not None:
+            if self._is_over_budget() or self._is_cancelled():
+                return False
 
             # collapse cell
             row, column = cell.get_coordinates()
@@ -41,12 +205,256 @@ class Solver:
 
             # update surrounding cells
             if chosen_tile is not None:
-                self.cell_manager.reduce_possibilities_for(row, column, chosen_tile)
+                self._steps += 1
+                conflict = self.cell_manager.reduce_possibilities_for(row, column, chosen_tile)
+                if conflict is not None:
+                    self._contradictions += 1
 
             # update canvas and sleep
             if update_canvas is True:
-                self.cell_manager.canvas.update_idletasks()
-                sleep(self.delay)
+                self._update_canvas()
+
+        return self._contradictions == 0
+
+
+    def _start_backtracking(self, update_canvas: bool) -> bool:
+        '''
+        Same as start, but every change to the cells is recorded in a Trail.
+        When a cell is left without tiles, changes are undone back to a
+        decision, and the tile chosen there is removed from that cell's possibilities.
+
+        Backtracking goes back to the last decision. Backjumping goes back to the
+        last decision that caused the dead end, skipping unrelated ones,
+        and learns small nogoods, so the same dead end is not entered twice.
+
+        Returns False only if every choice was tried and the grid has no solution.
+        '''
+        cell_manager = self.cell_manager
+        entropy_index = cell_manager.entropy_index
+        trail = Trail()
+        # decisions[level] = (trail mark before decision, row, column, chosen tile index)
+        decisions: list[tuple[int, int, int, int]] = []
+        nogood_store = NogoodStore(NOGOOD_STORE_SIZE)
+
+        cell_manager.trail = trail
+        cell_manager.record_culprits = self.search == 'backjumping'
+
+        try:
+            while (cell := entropy_index.choose()) is not None:
+                if self._is_over_budget() or self._is_cancelled():
+                    return False
+
+                row, column = cell.get_coordinates()
+
+                # remove tiles forbidden by learned nogoods, then choose again
+                forbidden_mask, culprits = self._get_forbidden(row, column, nogood_store)
+                if forbidden_mask != 0:
+                    conflict = cell_manager.restrict(row, column, ~forbidden_mask, culprits)
+                else:
+                    conflict = self._decide(row, column, decisions)
+
+                if conflict is not None:
+                    self._contradictions += 1
+
+                    if self._backjump(conflict, decisions, nogood_store) is False:
+                        return False
+
+                if update_canvas is True:
+                    self._update_canvas()
+        finally:
+            cell_manager.trail = None
+            cell_manager.record_culprits = False
+
+        return True
+
+
+    def _decide(self,
+                row: int,
+                column: int,
+                decisions: list[tuple[int, int, int, int]]) -> tuple[int, int]|None:
+        '''
+        Collapses the given cell as a new decision and propagates the change.
+
+        If some cell is left without tiles, returns its coordinates.
+        Otherwise, returns None.
+        '''
+        cell = self.cell_manager.cells[row][column]
+        mark = self.cell_manager.trail.mark()
+        chosen_tile = self.cell_manager.collapse(row, column)
+
+        if chosen_tile is None:
+            return None
+
+        self._steps += 1
+        level = len(decisions)
+        decisions.append((mark, row, column, cell.domain.get_indices()[0]))
+        cell.culprits |= 1 << level
+
+        return self.cell_manager.reduce_possibilities_for(row, column, chosen_tile)
+
+
+    def _backjump(self,
+                  conflict: tuple[int, int],
+                  decisions: list[tuple[int, int, int, int]],
+                  nogood_store: NogoodStore) -> bool:
+        '''
+        Undoes decisions until removing the tile chosen by one of them
+        does not leave any cell without tiles.
+
+        - conflict - coordinates of the cell left without tiles
+
+        Returns False if there are no decisions left to undo.
+        '''
+        while conflict is not None:
+            conflict_levels = self._get_conflict_levels(conflict, decisions)
+
+            if conflict_levels == 0:
+                return False
+
+            # the newest decision responsible for the dead end
+            level = conflict_levels.bit_length() - 1
+            self._learn(conflict_levels, decisions, nogood_store)
+
+            mark, row, column, tile_index = decisions[level]
+            del decisions[level:]
+            self.cell_manager.undo_to(mark)
+
+            # the other responsible decisions are why the tile is removed
+            conflict = self.cell_manager.restrict(row, column, ~(1 << tile_index),
+                                                  conflict_levels & ~(1 << level))
+
+        return True
+
+
+    def _get_conflict_levels(self,
+                             conflict: tuple[int, int],
+                             decisions: list[tuple[int, int, int, int]]) -> int:
+        '''
+        Returns a bitmask of decision levels responsible for the cell at @conflict
+        being left without tiles. Without recorded culprits, every decision is.
+        '''
+        if self.cell_manager.record_culprits is True:
+            row, column = conflict
+            return self.cell_manager.cells[row][column].culprits
+
+        return (1 << len(decisions)) - 1
+
+
+    def _learn(self,
+               conflict_levels: int,
+               decisions: list[tuple[int, int, int, int]],
+               nogood_store: NogoodStore) -> None:
+        '''
+        Stores the choices of the decisions in @conflict_levels as a nogood,
+        if there are at most MAX_NOGOOD_SIZE of them.
+        '''
+        if self.search != 'backjumping' or conflict_levels.bit_count() > MAX_NOGOOD_SIZE:
+            return
+
+        nogood = frozenset(
+            decisions[level][1:]
+            for level
+            in get_mask_indices(conflict_levels)
+        )
+        nogood_store.add(nogood)
+
+
+    def _get_forbidden(self, row: int, column: int, nogood_store: NogoodStore) -> tuple[int, int]:
+        '''
+        Returns a bitmask of tiles of the given cell forbidden by learned nogoods,
+        because all other choices in the nogood are already made,
+        and the culprits of the cells with those choices.
+        '''
+        cells = self.cell_manager.cells
+        forbidden_mask = 0
+        culprits = 0
+
+        for nogood in nogood_store.get_nogoods(row, column):
+            tile_mask = 0
+            nogood_culprits = 0
+
+            for other_row, other_column, tile_index in nogood:
+                other_cell = cells[other_row][other_column]
+
+                if (other_row, other_column) == (row, column):
+                    tile_mask = 1 << tile_index
+                elif other_cell.domain.mask == 1 << tile_index:
+                    nogood_culprits |= other_cell.culprits
+                else:
+                    break
+            else:
+                forbidden_mask |= tile_mask
+                culprits |= nogood_culprits
+
+        return forbidden_mask & cells[row][column].domain.mask, culprits
+
+
+    def _update_canvas(self) -> None:
+        '''
+        Lets the render scheduler redraw the grid if a frame is due.
+        Without one, lets grid observers redraw and waits for delay seconds.
+        '''
+        if self.render_scheduler is not None:
+            self.render_scheduler.step(self.cell_manager)
+            return
+
+        self.cell_manager.refresh()
+        sleep(self.delay)
+
+
+    def _start_vectorised(self, seed: int|None = None) -> bool:
+        '''
+        Solves the grid with a WaveEngine, starting from the current state
+        of the cells, then collapses each Cell to the tile chosen for it.
+
+        Cells the engine left without tiles are emptied, so check_invalid marks them.
+        If the control cancels the Solver, cells are left as they were.
+        Returns True if every cell was collapsed to a tile.
+
+        - seed - seed of the WaveEngine, if None it is drawn from the CellGrid's
+                 random number generator, or random if the CellGrid is not seeded
+        '''
+        # numpy is only needed by this backend
+        from src.solver.wave_engine import WaveEngine # pylint: disable=import-outside-toplevel
+
+        if seed is None and self.cell_manager.rng is not None:
+            seed = self.cell_manager.rng.getrandbits(64)
+
+        tile_set = self.cell_manager.get_current_tile_set()
+        engine = WaveEngine(tile_set, self.cell_manager.rows, self.cell_manager.columns, seed)
+
+        # start from the cells' current possibilities, invalid cells constrain nothing
+        full_mask = tile_set.get_full_mask()
+        for cell in self._get_cells():
+            mask = cell.domain.mask
+
+            if cell.domain.tile_set is tile_set and mask not in (0, full_mask):
+                engine.restrict(cell.row, cell.column, mask)
+
+        max_steps, max_contradictions = None, None
+        if self._budget is not None:
+            budget_type, budget = self._budget
+            max_steps = budget if budget_type == 'steps' else None
+            max_contradictions = budget if budget_type == 'contradictions' else None
+
+        is_valid = engine.solve(max_steps, max_contradictions, self._is_cancelled)
+        self._steps = engine.steps
+        self._contradictions = engine.contradictions
+
+        if self.control is not None and self.control.is_cancelled():
+            return False
+
+        tile_indices = engine.get_tile_indices()
+        invalid_cells = set(engine.get_invalid_cells())
+        for cell in self._get_cells():
+            tile_index = int(tile_indices[cell.row, cell.column])
+
+            if cell.get_coordinates() in invalid_cells:
+                self.cell_manager.empty(cell.row, cell.column)
+            elif tile_index != -1:
+                self.cell_manager.collapse(cell.row, cell.column, tile_index)
+
+        return is_valid
 
 
     def check_invalid(self) -> None:
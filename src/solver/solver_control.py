@@ -0,0 +1,67 @@
+'''
+SolverControl, to pause, resume or cancel a Solver running on another thread
+'''
+import threading
+
+
+class SolverControl:
+    '''
+    Shared by a running Solver and the thread controlling it.
+
+    The Solver passes a checkpoint before each step, which blocks while
+    the control is paused and tells the Solver to stop once it is cancelled.
+    '''
+    def __init__(self) -> None:
+        '''
+        + _running - set while the Solver may continue
+        + _cancelled - set once the Solver should stop
+        '''
+        self._running = threading.Event()
+        self._running.set()
+        self._cancelled = threading.Event()
+
+
+    def pause(self) -> None:
+        '''
+        Makes the Solver wait at its next checkpoint, until resumed or cancelled.
+        '''
+        if self._cancelled.is_set() is False:
+            self._running.clear()
+
+
+    def resume(self) -> None:
+        '''
+        Lets a paused Solver continue.
+        '''
+        self._running.set()
+
+
+    def cancel(self) -> None:
+        '''
+        Makes the Solver stop at its next checkpoint, even if it is paused.
+        '''
+        self._cancelled.set()
+        self._running.set()
+
+
+    def is_paused(self) -> bool:
+        '''
+        Returns True if the Solver waits to be resumed.
+        '''
+        return self._running.is_set() is False
+
+
+    def is_cancelled(self) -> bool:
+        '''
+        Returns True if the Solver was told to stop.
+        '''
+        return self._cancelled.is_set()
+
+
+    def checkpoint(self) -> bool:
+        '''
+        Invoked by the Solver before each step. Waits while paused.
+        Returns False if the Solver should stop.
+        '''
+        self._running.wait()
+        return self._cancelled.is_set() is False
@@ -0,0 +1,382 @@
+'''
+Vectorised wave engine, solving a whole grid with NumPy arrays instead of Cell objects.
+'''
+from typing import Callable
+
+import numpy as np
+
+from src.constants import VALID_REDUCE_MOVES
+from src.direction import Direction
+from src.tiles.tile_set import CARDINAL_DIRECTIONS, TileSet, get_mask_indices
+
+
+WORD_BITS = 64
+
+
+def mask_to_words(mask: int, words_amount: int) -> np.ndarray:
+    '''
+    Splits a bitmask into an array of uint64 words, lowest bits first.
+
+    - 0b11 << 64, 2 -> [0, 3]
+    '''
+    return np.array(
+        [(mask >> (WORD_BITS * word)) & (2**WORD_BITS - 1) for word in range(words_amount)],
+        dtype=np.uint64
+    )
+
+
+def words_to_mask(words: np.ndarray) -> int:
+    '''
+    Joins an array of uint64 words, lowest bits first, into a bitmask.
+    '''
+    return sum(int(word) << (WORD_BITS * index) for index, word in enumerate(words))
+
+
+class WaveEngine:
+    # pylint: disable=too-many-instance-attributes
+    '''
+    Holds the possible tiles of every cell in one array (the wave), packed
+    as uint64 words of shape (rows, columns, words). Bit i of a cell is set
+    if TileSet[i] is still possible there, same as the mask of a TileDomain.
+
+    Each step collapses the cell with the least entropy (plus noise), or, if @batch_radius
+    is given, a batch of cells at once: every cell whose entropy is the smallest
+    in the square of cells within @batch_radius around it. Cells of a batch
+    do not see each other's changes before they collapse, so batches are faster
+    but leave contradictions more often.
+    Propagation works on arrays of changed cells with bitwise operations,
+    against the compiled adjacency table of the TileSet, so each step costs
+    a fixed number of NumPy calls, no matter how many cells it changes.
+
+    Does not depend on tkinter, so it can run headless.
+    '''
+    def __init__(self,
+                 tile_set: TileSet,
+                 rows: int,
+                 columns: int,
+                 seed: int|None = None,
+                 batch_radius: int|None = None) -> None:
+        '''
+        - tile_set - TileSet whose indices the wave refers to
+        - rows - rows in grid
+        - columns - columns in grid
+        - seed - seed of random number generator, None for a random seed
+        - batch_radius - cells collapsed in the same step are more than this many cells apart,
+                         if None or at least the grid size, one cell is collapsed per step
+        '''
+        if batch_radius is not None and batch_radius < 1:
+            raise ValueError('batch_radius must be at least 1')
+
+        self.tile_set = tile_set
+        self.rows = rows
+        self.columns = columns
+        self.batch_radius = batch_radius
+        self.rng = np.random.default_rng(seed)
+
+        self._tiles_amount = len(tile_set)
+        self._words_amount = max(1, -(-self._tiles_amount // WORD_BITS))
+
+        full_words = mask_to_words(tile_set.get_full_mask(), self._words_amount)
+        self.wave = np.tile(full_words, (rows, columns, 1))
+        '''
+        + _classes - [direction] -> (class members, class neighbours) packed as words,
+                     tiles with the same adjacency on a side share a class
+        + _noise - fixed noise in [0, 0.5) per cell, breaking ties between equal counts
+        + _entropy - number of possible tiles + noise, or inf for collapsed and invalid cells
+        + _result - chosen tile index for each cell, -1 if not collapsed
+        + _invalid - cells left without possible tiles
+        '''
+        self._classes = [self._get_classes(direction) for direction in CARDINAL_DIRECTIONS]
+        self._noise = self.rng.random((rows, columns)) * 0.5
+        self._entropy = self._tiles_amount + self._noise
+        self._result = np.full((rows, columns), -1, dtype=np.int32)
+        self._invalid = np.zeros((rows, columns), dtype=bool)
+
+        self.steps = 0
+        self.contradictions = 0
+
+
+    def _get_classes(self, direction: Direction) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Groups tiles by their adjacency bitmask on the @direction side.
+        Returns two arrays of shape (classes, words): the tiles in each class,
+        and the tiles that fit on the @direction side of that class.
+        '''
+        masks = [
+            self.tile_set.get_adjacency_mask(index, direction)
+            for index
+            in range(self._tiles_amount)
+        ]
+
+        # {adjacency mask: mask of tiles that have it}
+        classes: dict[int, int] = {}
+        for index, mask in enumerate(masks):
+            classes[mask] = classes.get(mask, 0) | 1 << index
+
+        members = np.array([mask_to_words(tiles, self._words_amount) for tiles in classes.values()],
+                           dtype=np.uint64).reshape(-1, self._words_amount)
+        neighbours = np.array([mask_to_words(mask, self._words_amount) for mask in classes],
+                              dtype=np.uint64).reshape(-1, self._words_amount)
+
+        return members, neighbours
+
+
+    def get_tile_indices(self) -> np.ndarray:
+        '''
+        Returns an array of shape (rows, columns) with the chosen tile index
+        of each cell, or -1 if a cell is not collapsed.
+        '''
+        return self._result.copy()
+
+
+    def get_mask(self, row: int, column: int) -> int:
+        '''
+        Returns the bitmask of possible tiles in the given cell.
+        '''
+        return words_to_mask(self.wave[row, column])
+
+
+    def get_invalid_cells(self) -> list[tuple[int, int]]:
+        '''
+        Returns coordinates of cells that were left without possible tiles.
+        '''
+        return [(int(row), int(column)) for row, column in np.argwhere(self._invalid)]
+
+
+    def restrict(self, row: int, column: int, mask: int) -> tuple[int, int]|None:
+        '''
+        Keeps only the tiles set in bitmask @mask possible in the given cell
+        and propagates the change.
+
+        If some cell is left without tiles, returns its coordinates.
+        Otherwise, returns None.
+        '''
+        self.wave[row, column] &= mask_to_words(mask, self._words_amount)
+
+        cell = np.array([row * self.columns + column])
+        self._update_entropy(cell)
+
+        if not self.wave[row, column].any():
+            return self._mark_invalid(cell)
+
+        return self.propagate(cell)
+
+
+    def collapse(self, row: int, column: int, tile_index: int|None = None) -> int|None:
+        '''
+        Chooses a random possible tile for the given cell, or @tile_index
+        if it is given, and propagates the change.
+
+        If cell is already collapsed or invalid, returns None.
+        Otherwise, returns chosen tile index.
+        '''
+        if self._result[row, column] != -1 or self._invalid[row, column]:
+            return None
+
+        if tile_index is not None:
+            self.wave[row, column] = mask_to_words(1 << tile_index, self._words_amount)
+
+        self._collapse_cells(np.array([row * self.columns + column]))
+        return int(self._result[row, column])
+
+
+    def step(self) -> int:
+        '''
+        Collapses a batch of cells with least entropy in their surroundings
+        and propagates the changes. Returns the number of collapsed cells.
+        '''
+        cells = self.choose_cells()
+
+        if cells.size > 0:
+            self._collapse_cells(cells)
+            self.steps += 1
+
+        return int(cells.size)
+
+
+    def solve(self,
+              max_steps: int|None = None,
+              max_contradictions: int|None = None,
+              should_stop: Callable[[], bool]|None = None) -> bool:
+        '''
+        Collapses cells until all are collapsed, @max_steps steps were made,
+        there were more than @max_contradictions contradictions,
+        or @should_stop, invoked before each step, returned True.
+
+        Invalid cells do not stop the solve, they are skipped.
+        Returns True if every cell was collapsed to a tile.
+        '''
+        while max_steps is None or self.steps < max_steps:
+            if max_contradictions is not None and self.contradictions > max_contradictions:
+                break
+
+            if should_stop is not None and should_stop() is True:
+                break
+
+            if self.step() == 0:
+                break
+
+        return bool((self._result != -1).all())
+
+
+    def choose_cells(self) -> np.ndarray:
+        '''
+        Returns flat indices of not collapsed cells, whose entropy is
+        the smallest within @batch_radius cells around them,
+        or of the one with the smallest entropy if @batch_radius is None.
+        '''
+        entropy = self._entropy
+
+        if entropy.size == 0:
+            return np.array([], dtype=np.intp)
+
+        if self.batch_radius is None or self.batch_radius >= max(self.rows, self.columns):
+            cell = int(np.argmin(entropy))
+            return np.array([cell] if np.isfinite(entropy.flat[cell]) else [], dtype=np.intp)
+
+        # minimum over a sliding window, first along rows, then along columns
+        radius = self.batch_radius
+        padded = np.pad(entropy, radius, constant_values=np.inf)
+
+        row_min = padded[:, :self.columns].copy()
+        for shift in range(1, 2 * radius + 1):
+            np.minimum(row_min, padded[:, shift:shift + self.columns], out=row_min)
+
+        window_min = row_min[:self.rows].copy()
+        for shift in range(1, 2 * radius + 1):
+            np.minimum(window_min, row_min[shift:shift + self.rows], out=window_min)
+
+        return np.flatnonzero((entropy == window_min) & np.isfinite(entropy))
+
+
+    def _collapse_cells(self, cells: np.ndarray) -> None:
+        '''
+        Chooses a random possible tile for each cell in flat indices @cells
+        and propagates the changes.
+        '''
+        wave = self.wave.reshape(-1, self._words_amount)
+
+        # unpack possible tiles to booleans, bit i of a word becomes column i
+        possible = np.unpackbits(wave[cells].astype('<u8').view(np.uint8),
+                                 axis=1,
+                                 bitorder='little')[:, :self._tiles_amount]
+
+        # random weights on possible tiles, the largest one is chosen
+        chosen = (self.rng.random(possible.shape) * possible).argmax(axis=1)
+
+        wave[cells] = 0
+        wave[cells, chosen // WORD_BITS] = np.left_shift(np.uint64(1),
+                                                         (chosen % WORD_BITS).astype(np.uint64))
+        self._result.reshape(-1)[cells] = chosen
+        self._update_entropy(cells)
+
+        self.propagate(cells)
+
+
+    def propagate(self, changed: np.ndarray) -> tuple[int, int]|None:
+        '''
+        Propagates changes of cells in flat indices @changed until no cell changes.
+        Each iteration only recomputes the neighbours of cells changed in the previous one.
+
+        Cells left without tiles are marked invalid and stop constraining their neighbours,
+        same as ERROR_BACKGROUND_TILE in a CellManager.
+        Returns coordinates of the first such cell, or None.
+        '''
+        wave = self.wave.reshape(-1, self._words_amount)
+        done = (self._result != -1).reshape(-1) | self._invalid.reshape(-1)
+        first_invalid = None
+
+        while changed.size > 0:
+            affected = self._get_neighbours(changed)
+            affected = affected[~done[affected]]
+
+            if affected.size == 0:
+                break
+
+            possible = wave[affected]
+            reduced = possible.copy()
+            rows, columns = np.divmod(affected, self.columns)
+
+            for i, j, self_dir in VALID_REDUCE_MOVES:
+                # a cell touches its neighbour at offset (-i, -j) with self_dir,
+                # so it sits on the opposite side of that neighbour
+                inside = self._is_inside(rows - i, columns - j)
+                neighbours = wave[(rows[inside] - i) * self.columns + columns[inside] - j]
+                reduced[inside] &= self._get_supported(neighbours, self_dir.get_opposite())
+
+            is_changed = (reduced != possible).any(axis=1)
+            changed = affected[is_changed]
+            wave[changed] = reduced[is_changed]
+            self._update_entropy(changed)
+
+            is_empty = ~reduced[is_changed].any(axis=1)
+            if is_empty.any():
+                invalid = self._mark_invalid(changed[is_empty])
+                done[changed[is_empty]] = True
+                first_invalid = invalid if first_invalid is None else first_invalid
+                changed = changed[~is_empty]
+
+        return first_invalid
+
+
+    def _get_supported(self, possible: np.ndarray, direction: Direction) -> np.ndarray:
+        '''
+        Returns packed words of tiles that fit on the @direction side of
+        cells with packed words @possible.
+        '''
+        members, neighbours = self._classes[direction]
+        supported = np.zeros_like(possible)
+
+        for class_members, class_neighbours in zip(members, neighbours):
+            has_class = (possible & class_members).any(axis=1)
+            supported[has_class] |= class_neighbours
+
+        return supported
+
+
+    def _get_neighbours(self, cells: np.ndarray) -> np.ndarray:
+        '''
+        Returns sorted unique flat indices of the cells next to flat indices @cells.
+        '''
+        rows, columns = np.divmod(cells, self.columns)
+        neighbours = []
+
+        for i, j, _ in VALID_REDUCE_MOVES:
+            inside = self._is_inside(rows + i, columns + j)
+            neighbours.append((rows[inside] + i) * self.columns + columns[inside] + j)
+
+        return np.unique(np.concatenate(neighbours))
+
+
+    def _is_inside(self, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        '''
+        Returns which of the given grid coordinates are inside of the grid.
+        '''
+        return (rows >= 0) & (rows < self.rows) & (columns >= 0) & (columns < self.columns)
+
+
+    def _mark_invalid(self, cells: np.ndarray) -> tuple[int, int]:
+        '''
+        Marks cells in flat indices @cells as invalid, and makes all tiles
+        possible in them again, so they stop constraining their neighbours.
+        Returns coordinates of the first invalid cell.
+        '''
+        full_words = mask_to_words(self.tile_set.get_full_mask(), self._words_amount)
+        self.wave.reshape(-1, self._words_amount)[cells] = full_words
+        self._invalid.reshape(-1)[cells] = True
+        self._update_entropy(cells)
+        self.contradictions += int(cells.size)
+
+        row, column = divmod(int(cells[0]), self.columns)
+        return row, column
+
+
+    def _update_entropy(self, cells: np.ndarray) -> None:
+        '''
+        Recomputes entropy of cells in flat indices @cells.
+        '''
+        counts = np.bitwise_count(self.wave.reshape(-1, self._words_amount)[cells]).sum(axis=1)
+
+        entropy = counts + self._noise.reshape(-1)[cells]
+        entropy[(self._result.reshape(-1)[cells] != -1) | self._invalid.reshape(-1)[cells]] = np.inf
+        self._entropy.reshape(-1)[cells] = entropy
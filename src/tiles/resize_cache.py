@@ -0,0 +1,90 @@
+'''
+ResizeCache of tile images resampled to cell sizes
+'''
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+from PIL import Image
+
+
+# number of sizes kept by the ResizeCache shared by every Tile
+DEFAULT_MAX_SIZES = 4
+
+
+class ResizeCache:
+    '''
+    Keeps the images of tiles resized to the most recently used sizes,
+    keyed by (tile, size).
+
+    Images are always resampled from the source image given with the tile,
+    never from an already resized image, so switching between sizes
+    does not lose quality and costs a lookup after the first time.
+
+    Sizes are evicted least recently used first, with the images of every tile
+    of that size. Images of a tile are dropped when the tile is garbage collected.
+    '''
+    def __init__(self, max_sizes: int = DEFAULT_MAX_SIZES) -> None:
+        '''
+        - max_sizes - maximum number of sizes kept
+        '''
+        if max_sizes < 1:
+            raise ValueError('max_sizes must be at least 1')
+
+        self.max_sizes = max_sizes
+        '''
+        + _sizes - {size: {tile: resized image}}, least recently used size first
+        '''
+        self._sizes: OrderedDict[tuple[int, int], WeakKeyDictionary] = OrderedDict()
+        self.resamples = 0
+
+
+    def __len__(self) -> int:
+        return sum(len(images) for images in self._sizes.values())
+
+
+    def get_image(self, tile: object, source_image: Image.Image, size: tuple[int, int]) -> Image.Image:
+        '''
+        Returns @source_image of @tile resized to @size.
+        If @size is the size of @source_image, returns @source_image.
+
+        - tile - owner of @source_image, images are cached per owner
+        - source_image - original image, resampled only on the first request of @size
+        '''
+        size = tuple(size)
+
+        if source_image.size == size:
+            return source_image
+
+        images = self._sizes.get(size)
+
+        if images is None:
+            images = self._sizes[size] = WeakKeyDictionary()
+
+            while len(self._sizes) > self.max_sizes:
+                self._sizes.popitem(last=False)
+        else:
+            self._sizes.move_to_end(size)
+
+        image = images.get(tile)
+
+        if image is None:
+            image = source_image.resize(size)
+            images[tile] = image
+            self.resamples += 1
+
+        return image
+
+
+    def discard(self, tile: object) -> None:
+        '''
+        Drops every resized image of @tile, after its source image changed.
+        '''
+        for images in self._sizes.values():
+            images.pop(tile, None)
+
+
+    def clear(self) -> None:
+        '''
+        Drops every resized image.
+        '''
+        self._sizes.clear()
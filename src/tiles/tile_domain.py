@@ -0,0 +1,70 @@
+'''
+TileDomain bitmask implementation
+'''
+from collections.abc import Iterator
+
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet, get_mask_indices
+
+
+class TileDomain:
+    '''
+    The Tile's a Cell can still choose from, stored as an integer bitmask
+    over the indices of a shared TileSet. Bit i is set if TileSet[i] is possible.
+
+    Reducing a domain is a single bitwise AND and its size is a popcount,
+    so no lists of Tile's are created while solving.
+    '''
+    def __init__(self, tile_set: TileSet, mask: int|None = None) -> None:
+        '''
+        - tile_set - TileSet whose indices the mask refers to
+        - mask - bitmask of possible tiles, if None, all tiles are possible
+        '''
+        self.tile_set = tile_set
+        self.mask = tile_set.get_full_mask() if mask is None else mask
+
+
+    @classmethod
+    def from_tiles(cls, tile_set: TileSet, tiles: list[Tile]) -> 'TileDomain':
+        '''
+        Creates a TileDomain over @tile_set, where only @tiles are possible.
+        Tiles not in @tile_set are skipped.
+        '''
+        return cls(tile_set, tile_set.get_mask(tiles))
+
+
+    def __repr__(self) -> str:
+        return f'<mask={self.mask:b}, size={len(self)}>'
+
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+
+    def __iter__(self) -> Iterator[Tile]:
+        return (self.tile_set[index] for index in get_mask_indices(self.mask))
+
+
+    def get_indices(self) -> list[int]:
+        '''
+        Returns the TileSet indices of possible tiles, in ascending order.
+        '''
+        return get_mask_indices(self.mask)
+
+
+    def to_tile_set(self) -> TileSet:
+        '''
+        Returns a new TileSet with the possible tiles.
+        '''
+        return self.tile_set.get_tiles(self.mask)
+
+
+    def intersect(self, mask: int) -> int:
+        '''
+        Keeps only tiles that are also set in @mask.
+        Returns new size of domain.
+
+        - mask - bitmask over the indices of the same TileSet
+        '''
+        self.mask &= mask
+        return len(self)
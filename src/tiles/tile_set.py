@@ -1,56 +1,331 @@
-'''
-TileSet list implementation
-'''
-from src.direction import Direction
-from src.tiles.tile import Tile
-
-
-class TileSet(list[Tile]):
-    '''
-    A list of tiles with the same theme.
-    '''
-    def get_tile_image_size(self) -> tuple[int, int]|None:
-        '''
-        All images in TileSet should have the same size.
-        Returns the first tile's image size.
-        If TileSet is empty, returns None.
-        '''
-        if len(self) == 0:
-            return None
-
-        return self[0].get_image_size()
-
-
-    def resize_tiles(self, new_size: tuple[int, int]) -> bool:
-        '''
-        Resizes image of each Tile in TileSet.
-        
-        If all tiles have an image and resize succeeds, returns True.
-        Otherwise, returns False.
-
-        - new_size - new size of tiles' images
-        '''
-        if len(self) == 0:
-            return False
-
-        return all(tile.resize_image(new_size) for tile in self)
-
-
-    def get_reduced_tile_set(self,
-                             other_tile: Tile,
-                             tile_set_direction: Direction,
-                             other_direction: Direction) -> 'TileSet':
-        '''
-        Removes Tile's from TileSet, whose sides_code do not match
-        the sides_code of @other_tile on the given directions.
-
-        - other_tile - tile whose sides_code are matched to TileSet
-        - tile_set_direction - Direction of side for TileSet Tiles'
-        - other_direction - Direction of side for other_tile
-        '''
-        return TileSet(
-            tile
-            for tile
-            in self
-            if tile.match_sides_code(other_tile, tile_set_direction, other_direction) is True
-        )
+'''
+TileSet list implementation
+'''
+from src.direction import Direction
+from src.tiles.tile import Tile
+
+
+# Directions with a side on each Tile, in order of their values
+CARDINAL_DIRECTIONS = [direction for direction in Direction if not direction.is_invalid()]
+
+# maximum number of remembered supported masks, before the cache is cleared
+SUPPORT_CACHE_SIZE = 4096
+
+
+def get_mask_indices(mask: int) -> list[int]:
+    '''
+    Returns the indices of set bits in @mask, in ascending order.
+
+    - 0b1011 -> [0, 1, 3]
+    '''
+    indices = []
+
+    while mask:
+        lowest_bit = mask & -mask
+        indices.append(lowest_bit.bit_length() - 1)
+        mask ^= lowest_bit
+
+    return indices
+
+
+class TileSet(list[Tile]):
+    '''
+    A list of tiles with the same theme.
+
+    A TileSet can be compiled, precomputing for each Tile and Direction
+    a bitmask of Tile's that can be placed on that side of it.
+    Compatibility checks then become lookups instead of side code comparisons.
+    '''
+    def __init__(self, tiles=()) -> None:
+        super().__init__(tiles)
+        '''
+        + _tile_indices - {id(tile): index of tile in TileSet}
+        + _adjacency - [direction][tile index] -> bitmask of Tiles fitting on that side
+        + _support_cache - {(direction, mask): supported bitmask}
+        '''
+        self._tile_indices: dict[int, int] = {}
+        self._adjacency: list[list[int]]|None = None
+        self._support_cache: dict[tuple[Direction, int], int] = {}
+
+
+    def compile(self, adjacency: list[list[int]]|None = None) -> None:
+        '''
+        Precomputes the adjacency table of the TileSet. All side code
+        comparisons are done here, once per Tile and Direction.
+
+        Should be invoked again if Tile's are changed after compiling.
+        Adding or removing Tile's is detected and compiles the TileSet on next use.
+
+        - adjacency - table returned by get_adjacency_table of an identical TileSet,
+                      used instead of comparing side codes
+        '''
+        self._tile_indices = {id(tile): index for index, tile in enumerate(self)}
+        self._adjacency = []
+        self._support_cache.clear()
+
+        if adjacency is not None:
+            if len(adjacency) != len(CARDINAL_DIRECTIONS) \
+               or any(len(masks) != len(self) for masks in adjacency):
+                raise ValueError('Adjacency table does not match TileSet.')
+
+            self._adjacency = [list(masks) for masks in adjacency]
+            return
+
+        for direction in CARDINAL_DIRECTIONS:
+            # group tiles by the code of the side that would touch @direction
+            code_masks: dict[str, int] = {}
+            for index, tile in enumerate(self):
+                code = tile.get_code_group(direction.get_opposite())
+                code_masks[code] = code_masks.get(code, 0) | 1 << index
+
+            self._adjacency.append([
+                code_masks.get(tile.get_code_group(direction)[::-1], 0)
+                for tile
+                in self
+            ])
+
+
+    def __setstate__(self, state: dict) -> None:
+        '''
+        Restores a pickled TileSet, keeping its adjacency table.
+        Tile indices are keyed by id, so they are rebuilt for the new Tile objects.
+        '''
+        self.__dict__.update(state)
+        self._tile_indices = {id(tile): index for index, tile in enumerate(self)}
+
+
+    def is_compiled(self) -> bool:
+        '''
+        Returns True if the adjacency table is up to date with the TileSet size.
+        '''
+        return self._adjacency is not None and len(self._tile_indices) == len(self)
+
+
+    def get_adjacency_mask(self, index: int, direction: Direction) -> int:
+        '''
+        Returns a bitmask of Tile's that can be placed on the @direction side
+        of the Tile at @index. Compiles TileSet if needed.
+
+        - index - index of Tile in TileSet
+        - direction - side of Tile at @index
+        '''
+        adjacency = self._get_adjacency()
+        return adjacency[direction][index]
+
+
+    def get_adjacency_table(self) -> list[list[int]]:
+        '''
+        Returns a copy of the adjacency table, [direction][tile index] -> bitmask
+        of Tile's fitting on that side. Compiles TileSet if needed.
+        '''
+        return [list(masks) for masks in self._get_adjacency()]
+
+
+    def get_tile_index(self, tile: Tile) -> int|None:
+        '''
+        Returns the index of @tile in TileSet, compared by identity.
+        If @tile is not in TileSet, returns None.
+        '''
+        self._get_adjacency()
+        return self._tile_indices.get(id(tile))
+
+
+    def _get_adjacency(self) -> list[list[int]]:
+        '''
+        Returns the adjacency table, compiling TileSet if it is out of date.
+        '''
+        if self.is_compiled() is False:
+            self.compile()
+
+        return self._adjacency
+
+
+    def _is_opposite_pair(self, tile_set_direction: Direction, other_direction: Direction) -> bool:
+        '''
+        Returns True if the directions are valid and face each other,
+        so the adjacency table can be used to compare them.
+        '''
+        return (isinstance(tile_set_direction, Direction)
+                and isinstance(other_direction, Direction)
+                and not other_direction.is_invalid()
+                and tile_set_direction is other_direction.get_opposite())
+
+    def get_tile_image_size(self) -> tuple[int, int]|None:
+        '''
+        All images in TileSet should have the same size.
+        Returns the first tile's image size.
+        If TileSet is empty, returns None.
+        '''
+        if len(self) == 0:
+            return None
+
+        return self[0].get_image_size()
+
+
+    def resize_tiles(self, new_size: tuple[int, int]) -> bool:
+        '''
+        Resizes image of each Tile in TileSet.
+        
+        If all tiles have an image and resize succeeds, returns True.
+        Otherwise, returns False.
+
+        - new_size - new size of tiles' images
+        '''
+        if len(self) == 0:
+            return False
+
+        return all(tile.resize_image(new_size) for tile in self)
+
+
+    def get_reduced_tile_set(self,
+                             other_tile: Tile,
+                             tile_set_direction: Direction,
+                             other_direction: Direction) -> 'TileSet':
+        '''
+        Removes Tile's from TileSet, whose sides_code do not match
+        the sides_code of @other_tile on the given directions.
+
+        - other_tile - tile whose sides_code are matched to TileSet
+        - tile_set_direction - Direction of side for TileSet Tiles'
+        - other_direction - Direction of side for other_tile
+        '''
+        return self.get_tiles(self.get_compatible_mask(other_tile, tile_set_direction, other_direction))
+
+
+    def get_supported_tile_set(self,
+                               other_tiles: list[Tile],
+                               tile_set_direction: Direction,
+                               other_direction: Direction) -> 'TileSet':
+        '''
+        Removes Tile's from TileSet, whose sides_code do not match
+        the sides_code of at least one Tile in @other_tiles on the given directions.
+
+        Side codes of @other_tiles are collected once, so the reduction
+        is linear in the size of both sets.
+
+        - other_tiles - tiles whose sides_code are matched to TileSet
+        - tile_set_direction - Direction of side for TileSet Tiles'
+        - other_direction - Direction of side for other_tiles
+        '''
+        supported_codes = set(
+            other_tile.get_code_group(other_direction)[::-1]
+            for other_tile
+            in other_tiles
+        )
+
+        return TileSet(
+            tile
+            for tile
+            in self
+            if tile.get_code_group(tile_set_direction) in supported_codes
+        )
+
+
+    def get_full_mask(self) -> int:
+        '''
+        Returns a bitmask with one set bit for each Tile in TileSet.
+        '''
+        return (1 << len(self)) - 1
+
+
+    def get_mask(self, tiles: list[Tile]) -> int:
+        '''
+        Returns a bitmask of the indices of @tiles in TileSet.
+        Tiles are compared by identity, Tiles not in TileSet are skipped.
+
+        - tiles - tiles whose indices are set in the bitmask
+        '''
+        tile_indices = {id(tile): index for index, tile in enumerate(self)}
+
+        mask = 0
+        for tile in tiles:
+            if id(tile) in tile_indices:
+                mask |= 1 << tile_indices[id(tile)]
+
+        return mask
+
+
+    def get_tiles(self, mask: int) -> 'TileSet':
+        '''
+        Returns a TileSet of the Tile's whose indices are set in @mask.
+
+        - mask - bitmask over the indices of TileSet
+        '''
+        return TileSet(self[index] for index in get_mask_indices(mask))
+
+
+    def get_compatible_mask(self,
+                            other_tile: Tile,
+                            tile_set_direction: Direction,
+                            other_direction: Direction) -> int:
+        '''
+        Returns a bitmask of Tile's, whose sides_code match
+        the sides_code of @other_tile on the given directions.
+
+        - other_tile - tile whose sides_code are matched to TileSet
+        - tile_set_direction - Direction of side for TileSet Tiles'
+        - other_direction - Direction of side for other_tile
+        '''
+        other_index = self.get_tile_index(other_tile)
+
+        if other_index is not None and self._is_opposite_pair(tile_set_direction, other_direction):
+            return self._adjacency[other_direction][other_index]
+
+        # other_tile is not part of TileSet, compare side codes
+        mask = 0
+        for index, tile in enumerate(self):
+            if tile.match_sides_code(other_tile, tile_set_direction, other_direction) is True:
+                mask |= 1 << index
+
+        return mask
+
+
+    def get_supported_mask(self,
+                           other_mask: int,
+                           tile_set_direction: Direction,
+                           other_direction: Direction) -> int:
+        '''
+        Returns a bitmask of Tile's, whose sides_code match the sides_code
+        of at least one Tile set in @other_mask on the given directions.
+
+        - other_mask - bitmask of tiles, from TileSet, whose sides_code are matched to TileSet
+        - tile_set_direction - Direction of side for TileSet Tiles'
+        - other_direction - Direction of side for tiles in other_mask
+        '''
+        if self._is_opposite_pair(tile_set_direction, other_direction):
+            return self._get_supported_mask_compiled(other_mask, other_direction)
+
+        supported_codes = set(
+            self[index].get_code_group(other_direction)[::-1]
+            for index
+            in get_mask_indices(other_mask)
+        )
+
+        mask = 0
+        for index, tile in enumerate(self):
+            if tile.get_code_group(tile_set_direction) in supported_codes:
+                mask |= 1 << index
+
+        return mask
+
+
+    def _get_supported_mask_compiled(self, other_mask: int, other_direction: Direction) -> int:
+        '''
+        Returns the union of adjacency bitmasks of Tile's set in @other_mask.
+        Results are cached, as the same masks repeat often while solving.
+        '''
+        adjacency = self._get_adjacency()[other_direction]
+
+        key = (other_direction, other_mask)
+        if key in self._support_cache:
+            return self._support_cache[key]
+
+        if len(self._support_cache) >= SUPPORT_CACHE_SIZE:
+            self._support_cache.clear()
+
+        mask = 0
+        for index in get_mask_indices(other_mask):
+            mask |= adjacency[index]
+
+        self._support_cache[key] = mask
+        return mask
@@ -0,0 +1,53 @@
+'''
+Compiled TileSet files, so tile sets are not read and compiled again on every start.
+Files are packed TileSet archives, see tile_set_pack, holding tile images at the size
+of the tile set files, so one file serves every cell size.
+'''
+import hashlib
+from pathlib import Path
+
+from src.tiles.tile_set_pack import PACK_FILE_EXTENSION, PACK_VERSION
+
+
+# changing how TileSet's are created must change the version
+CACHE_VERSION = (3, PACK_VERSION)
+CACHE_FILE_EXTENSION = PACK_FILE_EXTENSION
+
+
+def get_tile_set_hash(path_to_tile_set: Path) -> str:
+    '''
+    Returns a hash of the yaml file and image files of a tile set directory,
+    together with CACHE_VERSION. Any change to them gives a different hash.
+    '''
+    sha256 = hashlib.sha256(repr(CACHE_VERSION).encode())
+
+    for file_path in sorted(Path(path_to_tile_set).iterdir()):
+        if file_path.suffix not in ('.yaml', '.png'):
+            continue
+
+        sha256.update(file_path.name.encode())
+        sha256.update(file_path.stat().st_size.to_bytes(8, 'little'))
+        sha256.update(file_path.read_bytes())
+
+    return sha256.hexdigest()
+
+
+def get_cache_file_path(cache_directory: Path, tile_set_name: str, tile_set_hash: str) -> Path:
+    '''
+    Returns the path of the compiled file of a tile set with the given hash.
+    '''
+    return Path(cache_directory, f'{tile_set_name}-{tile_set_hash[:32]}{CACHE_FILE_EXTENSION}')
+
+
+def remove_stale_files(cache_directory: Path, tile_set_name: str, keep: Path) -> None:
+    '''
+    Removes compiled files of a tile set, other than @keep.
+    '''
+    for file_path in Path(cache_directory).glob(f'{tile_set_name}-*{CACHE_FILE_EXTENSION}'):
+        # names of other tile sets can start with the same name
+        if file_path != keep and len(file_path.stem) == len(keep.stem):
+            try:
+                file_path.unlink(missing_ok=True)
+            except PermissionError:
+                # still mapped by another process on Windows, removed next time
+                pass
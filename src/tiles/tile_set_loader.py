@@ -0,0 +1,182 @@
+'''
+Creates TileSet's from tile set directories and packed tile set archives
+'''
+import os
+from functools import partial
+from pathlib import Path
+
+from PIL import Image
+
+from src.formatters.image_config_formatter import ATLAS_KEY, format_image_configs
+from src.readers.image_reader import load_images, read_atlas
+from src.readers.yaml_reader import read_config_file
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_cache import get_cache_file_path, get_tile_set_hash, remove_stale_files
+from src.tiles.tile_set_pack import PACK_FILE_EXTENSION, load_tile_set_pack, save_tile_set_pack
+from src.tiles.tile_set_manager import TileSetManager
+
+
+def create_tile_set(configs: dict, images: dict[str, Image.Image]) -> TileSet:
+    '''
+    Create a tile set based on TileSet configs and available images.
+    '''
+    tiles = []
+
+    for image_name in configs:
+        # create a TIle for each image in configs
+        image_configs = configs[image_name]
+        side_codes = image_configs['directions']
+
+        original_tile = Tile(images[image_name], side_codes)
+        tiles.append(original_tile)
+
+        # create a number of copies of Tile based on configs
+        for rotations_amount, rotation_direction in image_configs['rotations']:
+            rotated_tile = Tile(images[image_name], side_codes)
+            rotated_tile.rotate_tile(rotations_amount, rotation_direction)
+            tiles.append(rotated_tile)
+
+    # compare all side codes once, at load time
+    tile_set = TileSet(tiles)
+    tile_set.compile()
+
+    return tile_set
+
+
+def read_tile_set(path_to_tile_set: Path,
+                  cache_directory: Path|None = None,
+                  cell_size: tuple[int, int]|None = None) -> TileSet:
+    '''
+    Create a TileSet from a tile set directory, containing
+    images and a yaml file named as the directory.
+    Images can also be the cells of one atlas image, described in the yaml file.
+    If @path_to_tile_set is a packed archive (PACK_FILE_EXTENSION), it is loaded instead.
+
+    - cache_directory - if given, the compiled TileSet is saved there, with images
+                        at the size of the tile set files, and loaded from there
+                        on the next call, until the tile set files change
+    - cell_size - size tile images are resized to, if given
+    '''
+    path_to_tile_set = Path(path_to_tile_set)
+
+    if path_to_tile_set.suffix == PACK_FILE_EXTENSION:
+        tile_set = load_tile_set_pack(path_to_tile_set)
+    elif cache_directory is not None:
+        tile_set = _read_cached_tile_set(path_to_tile_set, cache_directory)
+    else:
+        tile_set, _ = _create_tile_set_from_directory(path_to_tile_set)
+
+    if cell_size is not None:
+        tile_set.resize_tiles(cell_size)
+
+    return tile_set
+
+
+def write_tile_set_pack(path_to_tile_set: Path,
+                        file_path: Path,
+                        cell_size: tuple[int, int]|None = None) -> TileSet:
+    '''
+    Creates a TileSet from a tile set directory and writes it,
+    with its formatted configs, to a packed archive at @file_path.
+    Returns the TileSet.
+
+    - cell_size - size tile images are resized to, if given
+    '''
+    tile_set, configs = _create_tile_set_from_directory(Path(path_to_tile_set))
+
+    if cell_size is not None:
+        tile_set.resize_tiles(cell_size)
+
+    save_tile_set_pack(tile_set, file_path, configs)
+    return tile_set
+
+
+def _create_tile_set_from_directory(path_to_tile_set: Path) -> tuple[TileSet, dict]:
+    '''
+    Creates a TileSet from a tile set directory.
+    Returns the TileSet and the formatted configs it was created from.
+    '''
+    configs = read_config_file(Path(path_to_tile_set, f'{path_to_tile_set.name}.yaml'))
+    formatted_configs = format_image_configs(configs)
+    tile_set_formatted_configs = {
+        image_name: image_configs
+        for image_name, image_configs
+        in formatted_configs.items()
+        if image_name != ATLAS_KEY
+    }
+
+    if ATLAS_KEY not in formatted_configs:
+        tile_set_images = load_images(path_to_tile_set)
+    else:
+        # one image holds every tile
+        atlas_configs = formatted_configs[ATLAS_KEY]
+        positions = {
+            image_name: image_configs['position']
+            for image_name, image_configs
+            in tile_set_formatted_configs.items()
+        }
+        tile_set_images = read_atlas(Path(path_to_tile_set, atlas_configs['image']),
+                                     atlas_configs['tile_size'],
+                                     positions)
+
+    return create_tile_set(tile_set_formatted_configs, tile_set_images), formatted_configs
+
+
+def create_tile_set_manager(path_to_tiles: Path,
+                            cache_directory: Path|None = None,
+                            cell_size: tuple[int, int]|None = None) -> TileSetManager:
+    '''
+    Collect all TileSets from given directory in a TileSetManager.
+    Tile set directories and packed archives, whose names end with 'tile_set',
+    are only listed here, each TileSet is read on first access.
+
+    - cache_directory - directory of compiled TileSet's, see read_tile_set
+    - cell_size - size tile images are resized to, if given
+    '''
+    tile_set_paths = sorted(
+        Path(path_to_tiles, ts)
+        for ts
+        in os.listdir(path_to_tiles)
+        if ts.endswith('tile_set') or ts.endswith('tile_set' + PACK_FILE_EXTENSION)
+    )
+    loaders = {}
+
+    for tile_set_path in tile_set_paths:
+        is_pack = tile_set_path.suffix == PACK_FILE_EXTENSION
+        tile_set_name = tile_set_path.stem if is_pack else tile_set_path.name
+
+        # a directory takes precedence over an archive with the same name
+        if tile_set_name in loaders:
+            continue
+
+        loaders[tile_set_name] = partial(read_tile_set,
+                                         tile_set_path,
+                                         cache_directory,
+                                         cell_size)
+
+    return TileSetManager(loaders=loaders)
+
+
+def _read_cached_tile_set(path_to_tile_set: Path, cache_directory: Path) -> TileSet:
+    '''
+    Loads the compiled TileSet of a tile set directory from @cache_directory.
+    If it is missing or out of date, creates the TileSet and saves it there.
+    Tile images are not resized, so they stay the source of every later resize.
+    '''
+    path_to_tile_set = Path(path_to_tile_set)
+    tile_set_hash = get_tile_set_hash(path_to_tile_set)
+    file_path = get_cache_file_path(cache_directory, path_to_tile_set.name, tile_set_hash)
+
+    if file_path.exists():
+        try:
+            return load_tile_set_pack(file_path)
+        except (ValueError, KeyError, OSError):
+            # unreadable files are written again
+            pass
+
+    Path(cache_directory).mkdir(parents=True, exist_ok=True)
+    tile_set = write_tile_set_pack(path_to_tile_set, file_path)
+    remove_stale_files(cache_directory, path_to_tile_set.name, file_path)
+
+    return tile_set
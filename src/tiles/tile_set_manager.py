@@ -1,6 +1,8 @@
 '''
 TileSetManager dict implementation
 '''
+from typing import Callable, Iterator
+
 from src.tiles.tile_set import TileSet
 
 
@@ -8,7 +10,86 @@ class TileSetManager(dict[str, TileSet]):
     '''
     A dict of TileSets.
     Format should be {'tile_set_name': TileSet}.
+
+    TileSets can also be added as loaders, functions that create the TileSet.
+    A loader is invoked on first access of its TileSet, so only TileSets
+    that are used are read. Names of not loaded TileSets are still
+    keys of the TileSetManager.
     '''
+    def __init__(self,
+                 tile_sets=(),
+                 loaders: dict[str, Callable[[], TileSet]]|None = None) -> None:
+        '''
+        - tile_sets - loaded TileSets, as accepted by dict
+        - loaders - {'tile_set_name': function returning the TileSet}
+        '''
+        super().__init__(tile_sets)
+        self._loaders: dict[str, Callable[[], TileSet]] = {}
+
+        for tile_set_name, loader in (loaders or {}).items():
+            self.add_loader(tile_set_name, loader)
+
+
+    def __missing__(self, tile_set_name: str) -> TileSet:
+        if tile_set_name not in self._loaders:
+            raise KeyError(tile_set_name)
+
+        # the loader is kept until it succeeds, so a failed load can be tried again
+        tile_set = self._loaders[tile_set_name]()
+        del self._loaders[tile_set_name]
+        self[tile_set_name] = tile_set
+        return tile_set
+
+
+    def __contains__(self, tile_set_name: object) -> bool:
+        return super().__contains__(tile_set_name) or tile_set_name in self._loaders
+
+
+    def __iter__(self) -> Iterator[str]:
+        # iterate a snapshot, loading a TileSet while iterating moves its name out of _loaders
+        yield from [*super().__iter__(), *self._loaders]
+
+
+    def __len__(self) -> int:
+        return super().__len__() + len(self._loaders)
+
+
+    def __reduce__(self):
+        # pickle loaders as they are, instead of loading every TileSet
+        return (TileSetManager, (dict(super().items()), dict(self._loaders)))
+
+
+    def keys(self) -> list[str]:
+        return list(self)
+
+
+    def values(self) -> list[TileSet]:
+        return [self[tile_set_name] for tile_set_name in self.keys()]
+
+
+    def items(self) -> list[tuple[str, TileSet]]:
+        return [(tile_set_name, self[tile_set_name]) for tile_set_name in self.keys()]
+
+
+    def get(self, tile_set_name: str, default: TileSet|None = None) -> TileSet|None:
+        return self[tile_set_name] if tile_set_name in self else default
+
+
+    def add_loader(self, tile_set_name: str, loader: Callable[[], TileSet]) -> None:
+        '''
+        Adds a TileSet that is created by @loader on first access.
+        Replaces a loaded TileSet with the same name.
+        '''
+        super().pop(tile_set_name, None)
+        self._loaders[tile_set_name] = loader
+
+
+    def is_loaded(self, tile_set_name: str) -> bool:
+        '''
+        Returns True if the TileSet was already created.
+        '''
+        return super().__contains__(tile_set_name)
+
     def get_tile_set_image_size(self, tile_set_name: str) -> tuple[int, int]|None:
         '''
         Returns the size of a Tile in a TileSet.
@@ -0,0 +1,180 @@
+'''
+Packed TileSet archive, one file with everything needed to use a TileSet
+
+Layout, all numbers little-endian:
+    prefix - magic, version, header length, offset of the pixel block
+    header - JSON with the formatted configs, side codes and image size
+             of each tile, offset of its pixels, and the adjacency table
+    pixels - raw RGBA pixels of every tile image, uncompressed,
+             starting at a multiple of PAGE_SIZE, each tile at a multiple of TILE_ALIGNMENT
+'''
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from PIL import Image
+
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+
+
+PACK_VERSION = 1
+PACK_FILE_EXTENSION = '.wfcpack'
+MAGIC = b'WFCP'
+# magic, version, length of JSON header, offset of pixel block
+PREFIX = struct.Struct('<4sHxxIQ')
+# mode pixels are stored in, so every tile image can be mapped from the file
+PIXEL_MODE = 'RGBA'
+PAGE_SIZE = 4096
+TILE_ALIGNMENT = 64
+
+
+def _align(offset: int, alignment: int) -> int:
+    '''
+    Returns the smallest multiple of @alignment not less than @offset.
+    '''
+    return -(-offset // alignment) * alignment
+
+
+def save_tile_set_pack(tile_set: TileSet, file_path: Path, configs: dict|None = None) -> None:
+    '''
+    Writes a TileSet to a packed archive at @file_path, compiling it if needed.
+    The file is replaced only once it is complete.
+
+    - configs - formatted configs the TileSet was created from, kept in the archive
+    '''
+    tiles = []
+    pixels = []
+    offset = 0
+
+    for tile in tile_set:
+        if tile.image is None:
+            raise ValueError('TileSet with None image.')
+
+        offset = _align(offset, TILE_ALIGNMENT)
+        data = tile.image.convert(PIXEL_MODE).tobytes()
+        tiles.append({'sides_code': tile.sides_code,
+                      'size': list(tile.image.size),
+                      'offset': offset})
+        pixels.append((offset, data))
+        offset += len(data)
+
+    header = json.dumps({'version': PACK_VERSION,
+                         'configs': configs,
+                         'tiles': tiles,
+                         'adjacency': tile_set.get_adjacency_table()}).encode()
+    pixel_offset = _align(PREFIX.size + len(header), PAGE_SIZE)
+
+    temporary_path = Path(file_path).with_suffix('.tmp')
+    with open(temporary_path, 'wb') as file:
+        file.write(PREFIX.pack(MAGIC, PACK_VERSION, len(header), pixel_offset))
+        file.write(header)
+
+        for tile_offset, data in pixels:
+            file.seek(pixel_offset + tile_offset)
+            file.write(data)
+
+    os.replace(temporary_path, file_path)
+
+
+def read_pack_header(file_path: Path) -> tuple[mmap.mmap, dict, int]:
+    '''
+    Memory-maps a packed archive.
+    Returns the mapping, the JSON header and the offset of the pixel block.
+
+    Raises ValueError if the file is not an archive of this version.
+    '''
+    with open(file_path, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        if len(buffer) < PREFIX.size:
+            raise ValueError(f'Invalid tile set archive: {file_path}')
+
+        magic, version, header_length, pixel_offset = PREFIX.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError(f'Invalid tile set archive: {file_path}')
+
+        if version != PACK_VERSION:
+            raise ValueError(f'Tile set archive has another version: {file_path}')
+
+        header = json.loads(buffer[PREFIX.size:PREFIX.size + header_length])
+    except ValueError:
+        buffer.close()
+        raise
+
+    return buffer, header, pixel_offset
+
+
+def load_tile_set_pack(file_path: Path, share_pixels: bool = False) -> TileSet:
+    '''
+    Reads a TileSet from a packed archive.
+
+    - share_pixels - if True, tile images share the memory of the memory-mapped file,
+                     so processes loading the same archive share one page-cached copy
+                     of the pixels. The file stays mapped until every tile image is dropped,
+                     and cannot be deleted on Windows before that.
+                     If False, pixels are copied, and the file is closed before returning.
+    '''
+    buffer, header, pixel_offset = read_pack_header(file_path)
+    pixels = memoryview(buffer) if share_pixels is True else buffer
+    tiles = []
+
+    for tile_header in header['tiles']:
+        size = tuple(tile_header['size'])
+        start = pixel_offset + tile_header['offset']
+        end = start + size[0] * size[1] * len(PIXEL_MODE)
+        image = Image.frombuffer(PIXEL_MODE, size, pixels[start:end], 'raw', PIXEL_MODE, 0, 1)
+        tiles.append(Tile(image, tile_header['sides_code']))
+
+    # slices of the mapping itself are copies, images do not use it
+    if share_pixels is False:
+        buffer.close()
+
+    tile_set = TileSet(tiles)
+    tile_set.compile(header['adjacency'])
+
+    return tile_set
+
+
+def read_pack_configs(file_path: Path) -> dict|None:
+    '''
+    Returns the formatted configs kept in a packed archive, None if it has none.
+    '''
+    buffer, header, _ = read_pack_header(file_path)
+    buffer.close()
+
+    return header['configs']
+
+
+def get_pack_pixels(file_path: Path):
+    '''
+    Returns the pixels of every tile of a packed archive, as a read-only
+    NumPy array of shape (tiles, height, width, 4) over the memory-mapped file.
+    All tiles must have the same size.
+    '''
+    # numpy is only needed by this function
+    import numpy as np # pylint: disable=import-outside-toplevel
+
+    buffer, header, pixel_offset = read_pack_header(file_path)
+    tiles = header['tiles']
+
+    if len(tiles) == 0:
+        return np.zeros((0, 0, 0, len(PIXEL_MODE)), dtype=np.uint8)
+
+    width, height = tiles[0]['size']
+    tile_bytes = width * height * len(PIXEL_MODE)
+    stride = _align(tile_bytes, TILE_ALIGNMENT)
+
+    if any(tile['size'] != [width, height] for tile in tiles):
+        raise ValueError('Tiles of the archive have different sizes.')
+
+    # padding after the last tile is not written
+    count = stride * (len(tiles) - 1) + tile_bytes
+    data = np.frombuffer(buffer, dtype=np.uint8, offset=pixel_offset, count=count)
+    return np.lib.stride_tricks.as_strided(data,
+                                           shape=(len(tiles), height, width, len(PIXEL_MODE)),
+                                           strides=(stride, width * len(PIXEL_MODE), len(PIXEL_MODE), 1),
+                                           writeable=False)
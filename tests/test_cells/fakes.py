@@ -0,0 +1,56 @@
+from src.cells.canvas_image import CanvasImage
+
+
+class FakeCanvas:
+    '''
+    Stands in for a tkinter Canvas, recording the items created on it.
+    '''
+    def __init__(self):
+        self.images = {}
+        self.rectangles = {}
+        self.created = 0
+        self.deleted = 0
+        self.lowered = []
+        self.idle_callbacks = []
+
+    def create_image(self, x, y, image, anchor):
+        self.created += 1
+        self.images[self.created] = image
+        return self.created
+
+    def create_rectangle(self, *coordinates):
+        self.created += 1
+        self.rectangles[self.created] = coordinates
+        return self.created
+
+    def coords(self, item_id, *coordinates):
+        self.rectangles[item_id] = coordinates
+
+    def tag_raise(self, item_id):
+        pass
+
+    def tag_lower(self, item_id):
+        self.lowered.append(item_id)
+
+    def after_idle(self, callback):
+        self.idle_callbacks.append(callback)
+
+    def update_idletasks(self):
+        pass
+
+    def delete(self, item_id):
+        self.deleted += 1
+        self.images.pop(item_id, None)
+        self.rectangles.pop(item_id, None)
+
+
+class RecordingCanvasImage(CanvasImage):
+    '''
+    Records pushed boxes instead of copying them to a Tk PhotoImage.
+    '''
+    def _create_photo_images(self):
+        self.pushed = []
+        self._item_id = self.canvas.create_image(0, 0, image=self, anchor='nw')
+
+    def _push(self, box):
+        self.pushed.append(box)
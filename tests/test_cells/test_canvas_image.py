@@ -0,0 +1,51 @@
+from PIL import Image
+from tests.test_cells.fakes import FakeCanvas, RecordingCanvasImage
+
+# =======================================================================
+
+def test_create():
+    # Arrange
+    canvas = FakeCanvas()
+
+    # Act
+    canvas_image = RecordingCanvasImage(canvas, (30, 20), (10, 10), 'RGBA', (0, 0, 0, 0))
+
+    # Assert
+    assert list(canvas.images.values()) == [canvas_image]
+    assert canvas_image.image.mode == 'RGBA'
+    assert canvas_image.image.getpixel((29, 19)) == (0, 0, 0, 0)
+
+
+def test_paste_and_flush_dirty_boxes():
+    # Arrange
+    canvas_image = RecordingCanvasImage(FakeCanvas(), (30, 20), (10, 10))
+
+    # Act
+    canvas_image.paste(Image.new('RGB', (10, 10), 'red'), (20, 10, 30, 20))
+    canvas_image.paste('blue', (0, 0, 10, 10))
+    canvas_image.paste('green', (20, 10, 30, 20))
+    is_dirty = canvas_image.is_dirty()
+    canvas_image.flush()
+    canvas_image.flush()
+
+    # Assert
+    assert is_dirty is True
+    assert canvas_image.is_dirty() is False
+    assert canvas_image.pushed == [(20, 10, 30, 20), (0, 0, 10, 10)]
+    assert canvas_image.image.getpixel((25, 15)) == (0, 128, 0)
+    assert canvas_image.image.getpixel((5, 5)) == (0, 0, 255)
+
+
+def test_lower_and_delete():
+    # Arrange
+    canvas = FakeCanvas()
+    canvas_image = RecordingCanvasImage(canvas, (30, 20), (10, 10))
+
+    # Act
+    canvas_image.lower()
+    canvas_image.delete()
+    canvas_image.delete()
+
+    # Assert
+    assert canvas.lowered == [1]
+    assert canvas.images == {}
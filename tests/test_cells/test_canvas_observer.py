@@ -0,0 +1,126 @@
+from PIL import Image
+from src.cells.canvas_observer import CanvasObserver
+from src.cells.cell_grid import CellGrid
+from src.cells.heatmap_overlay import HeatmapOverlay
+from src.cells.photo_image_cache import PhotoImageCache
+from src.cells.trail import Trail
+from src.solver.background_solver import QueuedObserver
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_manager import TileSetManager
+from tests.test_cells.fakes import FakeCanvas, RecordingCanvasImage
+
+
+def create_cell_grid() -> CellGrid:
+    tile_set = TileSet([Tile(Image.new('RGB', (40, 20)), '000000000000')])
+    cell_grid = CellGrid(2, 3, (40, 20), TileSetManager({'default_tile_set': tile_set}))
+    cell_grid.switch_tile_set()
+    return cell_grid
+
+# =======================================================================
+
+def test_highlight_moves_one_rectangle():
+    # Arrange
+    canvas = FakeCanvas()
+    observer = CanvasObserver(canvas)
+    cells = create_cell_grid().cells
+
+    # Act
+    observer.highlight(cells[0][0])
+    observer.highlight(cells[1][2])
+    observer.highlight(cells[1][2])
+    observer.highlight(cells[0][1])
+
+    # Assert
+    assert canvas.created == 1
+    assert canvas.deleted == 0
+    assert canvas.rectangles == {1: (40, 0, 80, 20)}
+
+# =======================================================================
+
+def test_extra_information_is_one_overlay(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(HeatmapOverlay, 'canvas_image_type', RecordingCanvasImage)
+    canvas = FakeCanvas()
+    observer = CanvasObserver(canvas)
+    cell_grid = create_cell_grid()
+    cell_grid.add_observer(observer)
+    observer.enable_extra_information([cell for cell_row in cell_grid.cells for cell in cell_row])
+    observer.flush()
+
+    # Act
+    cell_grid.restrict(1, 1, 0)
+    observer.flush()
+
+    # Assert
+    assert canvas.created == 1
+    assert observer._overlay.canvas_image.pushed[-1] == (40, 20, 80, 40)
+
+
+def test_disable_extra_information(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(HeatmapOverlay, 'canvas_image_type', RecordingCanvasImage)
+    canvas = FakeCanvas()
+    observer = CanvasObserver(canvas)
+    cells = create_cell_grid().cells
+    observer.enable_extra_information([cell for cell_row in cells for cell in cell_row])
+
+    # Act
+    observer.disable_extra_information()
+    observer.on_reduce(cells[0][0])
+
+    # Assert
+    assert observer._overlay is None
+    assert canvas.deleted == 1
+
+# =======================================================================
+
+def create_queued_cell_grid(canvas: FakeCanvas) -> tuple[CellGrid, CanvasObserver, QueuedObserver]:
+    observer = CanvasObserver(canvas)
+    observer._photo_image_cache = PhotoImageCache(lambda image: image)
+    cell_grid = create_cell_grid()
+    cell_grid.add_observer(observer)
+    cell_grid.trail = Trail()
+    queued_observer = QueuedObserver([observer])
+    cell_grid.observers = [queued_observer]
+    return cell_grid, observer, queued_observer
+
+
+def test_collapse_undo_collapse_in_one_drain_keeps_one_image():
+    # Arrange
+    canvas = FakeCanvas()
+    cell_grid, observer, queued_observer = create_queued_cell_grid(canvas)
+
+    # Act
+    mark = cell_grid.trail.mark()
+    cell_grid.collapse(0, 0, 0)
+    cell_grid.undo_to(mark)
+    cell_grid.collapse(0, 0, 0)
+    queued_observer.drain()
+
+    # Assert
+    assert len(canvas.images) == 1
+    assert set(canvas.images) == set(observer._image_ids.values())
+
+    # Act
+    cell_grid.observers = [observer]
+    cell_grid.switch_tile_set()
+
+    # Assert
+    assert canvas.images == {}
+
+
+def test_collapse_undo_in_one_drain_keeps_no_image():
+    # Arrange
+    canvas = FakeCanvas()
+    cell_grid, observer, queued_observer = create_queued_cell_grid(canvas)
+
+    # Act
+    mark = cell_grid.trail.mark()
+    cell_grid.collapse(0, 0, 0)
+    cell_grid.undo_to(mark)
+    queued_observer.drain()
+
+    # Assert
+    assert canvas.images == {}
+    assert observer._image_ids == {}
@@ -1,279 +1,529 @@
-from PIL import Image, ImageTk
-from src.cells.cell import Cell
-from src.constants import ERROR_BACKGROUND_TILE
-from src.direction import Direction
-from src.tiles.tile import Tile
-from src.tiles.tile_set import TileSet
-
-
-def test_get_coordinates():
-    # Arrange
-    t1 = Tile()
-    t2 = Tile()
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (40, 40), tile_set)
-    expected_result = (0, 0)
-    
-    # Act
-    result = cell.get_coordinates()
-     
-    # Assert
-    assert result == expected_result
-
-# =======================================================================
-
-def test_get_tile_set_size_collapsed():
-    # Arrange
-    t1 = Tile()
-    t2 = Tile()
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (40, 40), tile_set)
-    cell._is_collapsed = True
-    expected_result = -1
-    
-    # Act
-    result = cell.get_tile_set_size()
-     
-    # Assert
-    assert result == expected_result
-
-
-def test_get_tile_set_size_actual():
-    # Arrange
-    t1 = Tile()
-    t2 = Tile()
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (40, 40), tile_set)
-    expected_result = 2
-    
-    # Act
-    result = cell.get_tile_set_size()
-     
-    # Assert
-    assert result == expected_result
-
-# ===================================================================
-
-def test_get_chosen_image_default_image():
-    # Arrange
-    t1 = Tile()
-    t2 = Tile()
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (40, 40), tile_set)
-    expected_result = Image.new('RGB', (40, 40), color='white')
-    
-    # Act
-    result = cell.get_chosen_image()
-     
-    # Assert
-    assert result == expected_result
-
-
-def test_get_chosen_image_actual_image():
-    # Arrange
-    t1 = Tile(Image.new('RGB', (20, 20), color='red'))
-    t2 = Tile()
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (40, 40), tile_set)
-    cell._is_collapsed = True
-    cell._chosen_tile = t1
-    expected_result = Image.new('RGB', (20, 20), color='red')
-    
-    # Act
-    result = cell.get_chosen_image()
-     
-    # Assert
-    assert result == expected_result
-
-# ==============================================================================
-
-def test_resize_cell_no_resize():
-    # Arrange
-    t1 = Tile()
-    t2 = Tile()
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (40, 40), tile_set)
-    expected_result = False
-    
-    # Act
-    result = cell.resize_cell((20, 20))
-     
-    # Assert
-    assert result == expected_result
-    assert cell.cell_size == (40, 40)
-    assert cell._chosen_tile is None
-    assert t1.image is None
-    assert t2.image is None
-
-
-def test_resize_cell_no_chosen_tile():
-    # Arrange
-    t1 = Tile(Image.new('RGB', (40, 40), color='red'))
-    t2 = Tile(Image.new('RGB', (40, 40), color='red'))
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (40, 40), tile_set)
-    expected_result = True
-    
-    # Act
-    result = cell.resize_cell((20, 20))
-     
-    # Assert
-    assert result == expected_result
-    assert cell._chosen_tile is None
-    assert cell.cell_size == (20, 20)
-    assert t1.image.size == (20, 20)
-    assert t2.image.size == (20, 20)
-
-
-def test_resize_cell_chosen_tile():
-    # Arrange
-    t1 = Tile(Image.new('RGB', (40, 40), color='red'))
-    t2 = Tile(Image.new('RGB', (40, 40), color='red'))
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (40, 40), tile_set)
-    cell._chosen_tile = t1
-    expected_result = True
-    
-    # Act
-    result = cell.resize_cell((20, 20))
-     
-    # Assert
-    assert result == expected_result
-    assert cell._chosen_tile == t1
-    assert cell.cell_size == (20, 20)
-    assert t1.image.size == (20, 20)
-    assert t2.image.size == (40, 40)
-
-# ==============================================================================
-
-def test_collapse_already_collapsed():
-    # Arrange
-    t1 = Tile()
-    t2 = Tile()
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (40, 40), tile_set)
-    cell._is_collapsed = True
-    expected_result = None
-    
-    # Act
-    result = cell.collapse()
-     
-    # Assert
-    assert result == expected_result
-
-
-def test_collapse_valid_cell():
-    # Arrange
-    t1 = Tile()
-    t2 = Tile()
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (40, 40), tile_set)
-    expected_result = set([t1, t2])
-    
-    # Act
-    result = cell.collapse()
-     
-    # Assert
-    assert result in expected_result
-
-
-def test_collapse_invalid_cell_default_size():
-    # Arrange
-    tile_set = TileSet()
-    cell = Cell(0, 0, (40, 40), tile_set)
-    expected_result = ERROR_BACKGROUND_TILE
-    
-    # Act
-    result = cell.collapse()
-     
-    # Assert
-    assert result == expected_result
-    assert expected_result.image.size == (40, 40)
-
-
-def test_collapse_invalid_cell_different_size():
-    # Arrange
-    tile_set = TileSet()
-    cell = Cell(0, 0, (20, 20), tile_set)
-    expected_result = ERROR_BACKGROUND_TILE
-    
-    # Act
-    result = cell.collapse()
-     
-    # Assert
-    assert result == expected_result
-    assert expected_result.image.size == (20, 20)
-
-# ======================================================================
-
-def test_reduce_tile_set_already_collapsed():
-    # Arrange
-    t1 = Tile()
-    t2 = Tile()
-    t3 = Tile()
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (20, 20), tile_set)
-    cell._is_collapsed = True
-    expected_result = None
-    
-    # Act
-    result = cell.reduce_tile_set(t3, Direction.NORTH, Direction.SOUTH)
-     
-    # Assert
-    assert result == expected_result
-
-
-def test_reduce_tile_set_no_removed():
-    # Arrange             [N][E][S][W]
-    t1 = Tile(sides_code='+++***++++++')
-    t2 = Tile(sides_code='++++++***+++')
-    t3 = Tile(sides_code='+++++++++***')
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (20, 20), tile_set)
-    expected_result = 2
-    
-    # Act
-    result = cell.reduce_tile_set(t3, Direction.NORTH, Direction.SOUTH)
-     
-    # Assert
-    assert result == expected_result
-
-
-def test_reduce_tile_set_all_removed():
-    # Arrange             [N][E][S][W]
-    t1 = Tile(sides_code='+++***++++++')
-    t2 = Tile(sides_code='+++++++++***')
-    t3 = Tile(sides_code='++++++***+++')
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (20, 20), tile_set)
-    expected_result = 0
-    
-    # Act
-    result = cell.reduce_tile_set(t3, Direction.NORTH, Direction.SOUTH)
-     
-    # Assert
-    assert result == expected_result
-
-
-def test_reduce_tile_set_one_removed():
-    # Arrange             [N][E][S][W]
-    t1 = Tile(sides_code='+++***++++++')
-    t2 = Tile(sides_code='+++++++++***')
-    t3 = Tile(sides_code='++++++***+++')
-    tile_set = TileSet([t1, t2])
-    cell = Cell(0, 0, (20, 20), tile_set)
-    expected_result = 1
-    
-    # Act
-    result = cell.reduce_tile_set(t3, Direction.EAST, Direction.WEST)
-     
-    # Assert
-    assert result == expected_result
-
-### =============================================================
-# Other methods were not tested because of tk.Canvas dependency:
-# - draw(), clear(), highlight()
-# - update_extra_information()
-# - enable_extra_information()
-# - disable-extra_information()
-### =============================================================
+import random
+from PIL import Image
+from src.cells.cell import Cell
+from src.constants import ERROR_BACKGROUND_TILE
+from src.direction import Direction
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+
+
+def test_get_coordinates():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    expected_result = (0, 0)
+    
+    # Act
+    result = cell.get_coordinates()
+     
+    # Assert
+    assert result == expected_result
+
+# =======================================================================
+
+def test_get_tile_set_size_collapsed():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    cell._is_collapsed = True
+    expected_result = -1
+    
+    # Act
+    result = cell.get_tile_set_size()
+     
+    # Assert
+    assert result == expected_result
+
+
+def test_get_tile_set_size_actual():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    expected_result = 2
+    
+    # Act
+    result = cell.get_tile_set_size()
+     
+    # Assert
+    assert result == expected_result
+
+# ===================================================================
+
+def test_get_chosen_image_default_image():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    expected_result = Image.new('RGB', (40, 40), color='white')
+    
+    # Act
+    result = cell.get_chosen_image()
+     
+    # Assert
+    assert result == expected_result
+
+
+def test_get_chosen_image_actual_image():
+    # Arrange
+    t1 = Tile(Image.new('RGB', (20, 20), color='red'))
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    cell._is_collapsed = True
+    cell._chosen_tile = t1
+    expected_result = Image.new('RGB', (20, 20), color='red')
+    
+    # Act
+    result = cell.get_chosen_image()
+     
+    # Assert
+    assert result == expected_result
+
+# ==============================================================================
+
+def test_resize_cell_no_resize():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    expected_result = False
+    
+    # Act
+    result = cell.resize_cell((20, 20))
+     
+    # Assert
+    assert result == expected_result
+    assert cell.cell_size == (40, 40)
+    assert cell._chosen_tile is None
+    assert t1.image is None
+    assert t2.image is None
+
+
+def test_resize_cell_no_chosen_tile():
+    # Arrange
+    t1 = Tile(Image.new('RGB', (40, 40), color='red'))
+    t2 = Tile(Image.new('RGB', (40, 40), color='red'))
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    expected_result = True
+    
+    # Act
+    result = cell.resize_cell((20, 20))
+     
+    # Assert
+    assert result == expected_result
+    assert cell._chosen_tile is None
+    assert cell.cell_size == (20, 20)
+    assert t1.image.size == (20, 20)
+    assert t2.image.size == (20, 20)
+
+
+def test_resize_cell_chosen_tile():
+    # Arrange
+    t1 = Tile(Image.new('RGB', (40, 40), color='red'))
+    t2 = Tile(Image.new('RGB', (40, 40), color='red'))
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    cell._chosen_tile = t1
+    expected_result = True
+    
+    # Act
+    result = cell.resize_cell((20, 20))
+     
+    # Assert
+    assert result == expected_result
+    assert cell._chosen_tile == t1
+    assert cell.cell_size == (20, 20)
+    assert t1.image.size == (20, 20)
+    assert t2.image.size == (40, 40)
+
+# ==============================================================================
+
+def test_collapse_already_collapsed():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    cell._is_collapsed = True
+    expected_result = None
+    
+    # Act
+    result = cell.collapse()
+     
+    # Assert
+    assert result == expected_result
+
+
+def test_collapse_valid_cell():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    expected_result = set([t1, t2])
+    
+    # Act
+    result = cell.collapse()
+     
+    # Assert
+    assert result in expected_result
+
+
+def test_collapse_invalid_cell_default_size():
+    # Arrange
+    tile_set = TileSet()
+    cell = Cell(0, 0, (40, 40), tile_set)
+    expected_result = ERROR_BACKGROUND_TILE
+    
+    # Act
+    result = cell.collapse()
+     
+    # Assert
+    assert result == expected_result
+    assert expected_result.image.size == (40, 40)
+
+
+def test_collapse_invalid_cell_different_size():
+    # Arrange
+    tile_set = TileSet()
+    cell = Cell(0, 0, (20, 20), tile_set)
+    expected_result = ERROR_BACKGROUND_TILE
+    
+    # Act
+    result = cell.collapse()
+     
+    # Assert
+    assert result == expected_result
+    assert expected_result.image.size == (20, 20)
+
+# ======================================================================
+
+def test_reduce_tile_set_already_collapsed():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    t3 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (20, 20), tile_set)
+    cell._is_collapsed = True
+    expected_result = None
+    
+    # Act
+    result = cell.reduce_tile_set(t3, Direction.NORTH, Direction.SOUTH)
+     
+    # Assert
+    assert result == expected_result
+
+
+def test_reduce_tile_set_no_removed():
+    # Arrange             [N][E][S][W]
+    t1 = Tile(sides_code='+++***++++++')
+    t2 = Tile(sides_code='++++++***+++')
+    t3 = Tile(sides_code='+++++++++***')
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (20, 20), tile_set)
+    expected_result = 2
+    
+    # Act
+    result = cell.reduce_tile_set(t3, Direction.NORTH, Direction.SOUTH)
+     
+    # Assert
+    assert result == expected_result
+
+
+def test_reduce_tile_set_all_removed():
+    # Arrange             [N][E][S][W]
+    t1 = Tile(sides_code='+++***++++++')
+    t2 = Tile(sides_code='+++++++++***')
+    t3 = Tile(sides_code='++++++***+++')
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (20, 20), tile_set)
+    expected_result = 0
+    
+    # Act
+    result = cell.reduce_tile_set(t3, Direction.NORTH, Direction.SOUTH)
+     
+    # Assert
+    assert result == expected_result
+
+
+def test_reduce_tile_set_one_removed():
+    # Arrange             [N][E][S][W]
+    t1 = Tile(sides_code='+++***++++++')
+    t2 = Tile(sides_code='+++++++++***')
+    t3 = Tile(sides_code='++++++***+++')
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (20, 20), tile_set)
+    expected_result = 1
+    
+    # Act
+    result = cell.reduce_tile_set(t3, Direction.EAST, Direction.WEST)
+     
+    # Assert
+    assert result == expected_result
+
+# ======================================================================
+
+def test_collapse_stores_chosen_tile():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    
+    # Act
+    result = cell.collapse()
+     
+    # Assert
+    assert cell._chosen_tile is result
+
+# ======================================================================
+
+def test_get_possible_tiles_not_collapsed():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    
+    # Act
+    result = cell.get_possible_tiles()
+     
+    # Assert
+    assert result == [t1, t2]
+
+
+def test_get_possible_tiles_collapsed():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    
+    # Act
+    chosen_tile = cell.collapse()
+    result = cell.get_possible_tiles()
+     
+    # Assert
+    assert result == [chosen_tile]
+
+# ======================================================================
+
+def test_restrict_tile_set_already_collapsed():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    t3 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (20, 20), tile_set)
+    cell._is_collapsed = True
+    expected_result = None
+    
+    # Act
+    result = cell.restrict_tile_set([t3], Direction.NORTH, Direction.SOUTH)
+     
+    # Assert
+    assert result == expected_result
+
+
+def test_restrict_tile_set_one_removed():
+    # Arrange             [N][E][S][W]
+    t1 = Tile(sides_code='+++***++++++')
+    t2 = Tile(sides_code='+++++++++***')
+    t3 = Tile(sides_code='++++++***+++')
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (20, 20), tile_set)
+    expected_result = 1
+    
+    # Act
+    result = cell.restrict_tile_set([t3], Direction.EAST, Direction.WEST)
+     
+    # Assert
+    assert result == expected_result
+    assert cell.tile_set == [t2]
+
+
+def test_restrict_tile_set_none_removed():
+    # Arrange             [N][E][S][W]
+    t1 = Tile(sides_code='+++***++++++')
+    t2 = Tile(sides_code='+++++++++***')
+    t3 = Tile(sides_code='++++++***+++')
+    t4 = Tile(sides_code='+++++++++***')
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (20, 20), tile_set)
+    expected_result = 2
+    
+    # Act
+    result = cell.restrict_tile_set([t3, t4], Direction.EAST, Direction.WEST)
+     
+    # Assert
+    assert result == expected_result
+
+# ======================================================================
+
+def test_tile_set_view_of_domain():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    t3 = Tile()
+    tile_set = TileSet([t1, t2, t3])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    
+    # Act
+    cell.domain.intersect(0b101)
+    result = cell.tile_set
+     
+    # Assert
+    assert isinstance(result, TileSet) is True
+    assert result == [t1, t3]
+    assert cell.get_tile_set_size() == 2
+
+
+def test_tile_set_assign_subset():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    
+    # Act
+    cell.tile_set = TileSet([t2])
+     
+    # Assert
+    assert cell.domain.tile_set is tile_set
+    assert cell.domain.mask == 0b10
+
+
+def test_tile_set_assign_new_tiles():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    new_tile_set = TileSet([t2])
+    cell = Cell(0, 0, (40, 40), TileSet([t1]))
+    
+    # Act
+    cell.tile_set = new_tile_set
+     
+    # Assert
+    assert cell.domain.tile_set is new_tile_set
+    assert cell.tile_set == [t2]
+
+
+def test_collapse_narrows_domain():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    
+    # Act
+    chosen_tile = cell.collapse()
+     
+    # Assert
+    assert list(cell.domain) == [chosen_tile]
+
+# ======================================================================
+
+def test_restrict_domain_one_removed():
+    # Arrange             [N][E][S][W]
+    t1 = Tile(sides_code='+++***++++++')
+    t2 = Tile(sides_code='+++++++++***')
+    t3 = Tile(sides_code='++++++***+++')
+    tile_set = TileSet([t1, t2, t3])
+    cell = Cell(0, 0, (20, 20), tile_set)
+    other_cell = Cell(0, 1, (20, 20), tile_set)
+    other_cell.tile_set = TileSet([t3])
+    expected_result = 2
+    
+    # Act
+    result = cell.restrict_domain(other_cell.domain, Direction.EAST, Direction.WEST)
+     
+    # Assert
+    assert result == expected_result
+    assert cell.tile_set == [t2, t3]
+
+
+def test_restrict_domain_already_collapsed():
+    # Arrange
+    t1 = Tile()
+    tile_set = TileSet([t1])
+    cell = Cell(0, 0, (20, 20), tile_set)
+    other_cell = Cell(0, 1, (20, 20), tile_set)
+    cell._is_collapsed = True
+    
+    # Act
+    result = cell.restrict_domain(other_cell.domain, Direction.EAST, Direction.WEST)
+     
+    # Assert
+    assert result is None
+
+# ======================================================================
+
+def test_collapse_given_tile_index():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    
+    # Act
+    chosen_tile = cell.collapse(1)
+     
+    # Assert
+    assert chosen_tile is t2
+    assert cell.domain.mask == 0b10
+
+
+def test_collapse_seeded_rng():
+    # Arrange
+    tile_set = TileSet([Tile() for _ in range(10)])
+    cells = [Cell(0, 0, (40, 40), tile_set) for _ in range(2)]
+    
+    # Act
+    results = [cell.collapse(rng=random.Random(5)) for cell in cells]
+     
+    # Assert
+    assert results[0] is results[1]
+
+
+def test_restore_state_after_collapse():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    state = cell.get_state()
+    
+    # Act
+    cell.collapse()
+    cell.restore_state(state)
+     
+    # Assert
+    assert cell.get_tile_set_size() == 2
+    assert cell.get_possible_tiles() == [t1, t2]
+
+
+def test_restore_state_after_tile_set_assign():
+    # Arrange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    cell = Cell(0, 0, (40, 40), tile_set)
+    state = cell.get_state()
+    
+    # Act
+    cell.tile_set = TileSet([Tile()])
+    cell.restore_state(state)
+     
+    # Assert
+    assert cell.domain.tile_set is tile_set
+    assert cell.tile_set == [t1, t2]
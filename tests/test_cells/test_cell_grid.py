@@ -0,0 +1,166 @@
+import subprocess
+import sys
+
+import pytest
+from PIL import Image
+from src.cells.cell_grid import CellGrid, GridObserver
+from src.cells.trail import Trail
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_manager import TileSetManager
+
+
+class RecordingObserver(GridObserver):
+    def __init__(self):
+        self.events = []
+
+    def on_load(self, cells):
+        self.events.append(('load', len(cells), len(cells[0])))
+
+    def on_collapse(self, cell, tile):
+        self.events.append(('collapse', cell.get_coordinates()))
+
+    def on_reduce(self, cell):
+        self.events.append(('reduce', cell.get_coordinates()))
+
+    def on_restore(self, cell):
+        self.events.append(('restore', cell.get_coordinates()))
+
+
+def create_cell_grid(rows: int, columns: int) -> CellGrid:
+    #                                                                [N][E][S][W]
+    t1 = Tile(image=Image.new('RGB', (40, 40), color='red'), sides_code='000111000000')
+    t2 = Tile(image=Image.new('RGB', (40, 40), color='blue'), sides_code='000000000000')
+    tile_set = TileSet([t1, t2])
+    tile_set_manager = TileSetManager({'default_tile_set': tile_set})
+    cell_grid = CellGrid(rows, columns, (40, 40), tile_set_manager)
+    cell_grid.switch_tile_set()
+    return cell_grid
+
+# =======================================================================
+
+def test_does_not_import_tkinter():
+    # Arrange
+    code = 'import sys, src.cells.cell_grid, src.solver.solver; print("tkinter" in sys.modules)'
+
+    # Act
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+    # Assert
+    assert result.stdout.strip() == 'False'
+
+
+def test_switch_tile_set_invalid_name():
+    # Arrange
+    cell_grid = create_cell_grid(1, 2)
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        cell_grid.switch_tile_set('missing_tile_set')
+
+
+def test_observer_notified():
+    # Arrange
+    cell_grid = create_cell_grid(1, 2)
+    observer = RecordingObserver()
+    cell_grid.add_observer(observer)
+
+    # Act
+    cell_grid.load_cells()
+    chosen_tile = cell_grid.collapse(0, 1, 1)
+    cell_grid.reduce_possibilities_for(0, 1, chosen_tile)
+
+    # Assert
+    assert observer.events == [('load', 1, 2), ('collapse', (0, 1)), ('reduce', (0, 0))]
+
+# =======================================================================
+
+def test_restrict_propagates():
+    '''
+    t1 EAST: 111, no tile has WEST: 111 => only t2 fits WEST of anything
+    '''
+    # Arrange
+    cell_grid = create_cell_grid(1, 3)
+
+    # Act
+    result = cell_grid.restrict(0, 2, 0b10)
+
+    # Assert
+    assert result is None
+    assert [cell.domain.mask for cell in cell_grid.cells[0]] == [0b10, 0b10, 0b10]
+
+
+def test_restrict_contradiction():
+    # Arrange
+    cell_grid = create_cell_grid(1, 2)
+
+    # Act
+    result = cell_grid.restrict(0, 0, 0b01)
+
+    # Assert
+    assert result == (0, 1)
+    assert cell_grid.cells[0][1].get_tile_set_size() == 0
+
+
+def test_undo_to():
+    # Arrange
+    cell_grid = create_cell_grid(1, 3)
+    observer = RecordingObserver()
+    cell_grid.add_observer(observer)
+    cell_grid.trail = Trail()
+    mark = cell_grid.trail.mark()
+
+    # Act
+    chosen_tile = cell_grid.collapse(0, 2, 1)
+    cell_grid.reduce_possibilities_for(0, 2, chosen_tile)
+    cell_grid.undo_to(mark)
+
+    # Assert
+    assert [cell.get_tile_set_size() for cell in cell_grid.cells[0]] == [2, 2, 2]
+    assert len(cell_grid.entropy_index) == 3
+    assert observer.events[-1] == ('restore', (0, 2))
+
+# =======================================================================
+
+def test_restore_cell_states():
+    # Arrange
+    cell_grid = create_cell_grid(2, 2)
+    states = cell_grid.get_cell_states()
+    cells = [cell for cell_row in cell_grid.cells for cell in cell_row]
+
+    # Act
+    cell_grid.collapse(1, 1)
+    cell_grid.restrict(0, 0, 0b10)
+    cell_grid.restore_cell_states(states)
+
+    # Assert
+    assert [cell for cell_row in cell_grid.cells for cell in cell_row] == cells
+    assert [cell.get_tile_set_size() for cell in cells] == [2, 2, 2, 2]
+    assert len(cell_grid.entropy_index) == 4
+
+
+def test_get_tile_indices():
+    # Arrange
+    cell_grid = create_cell_grid(1, 3)
+
+    # Act
+    cell_grid.collapse(0, 0, 1)
+    cell_grid.collapse(0, 1, 0)
+    result = cell_grid.get_tile_indices()
+
+    # Assert
+    assert result == [[1, 0, -1]]
+
+
+def test_get_current_image():
+    # Arrange
+    cell_grid = create_cell_grid(1, 2)
+
+    # Act
+    cell_grid.collapse(0, 1, 0)
+    result = cell_grid.get_current_image()
+
+    # Assert
+    assert result.size == (80, 40)
+    assert result.getpixel((60, 20)) == (255, 0, 0)
+    assert result.getpixel((20, 20)) == (255, 255, 255)
@@ -0,0 +1,10 @@
+import pytest
+from src.cells.cell_manager import CellManager
+from src.tiles.tile_set_manager import TileSetManager
+
+# =======================================================================
+
+def test_invalid_rendering():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        CellManager(1, 1, (40, 40), None, TileSetManager(), 'sprites')
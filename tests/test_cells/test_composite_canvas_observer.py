@@ -0,0 +1,128 @@
+from PIL import Image
+from src.cells.cell_grid import CellGrid
+from src.cells.composite_canvas_observer import CompositeCanvasObserver
+from src.cells.heatmap_overlay import HeatmapOverlay
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_manager import TileSetManager
+from tests.test_cells.fakes import FakeCanvas, RecordingCanvasImage
+
+
+def create_observer(canvas: FakeCanvas) -> CompositeCanvasObserver:
+    observer = CompositeCanvasObserver(canvas)
+    observer.canvas_image_type = RecordingCanvasImage
+    return observer
+
+
+def create_cell_grid(observer: CompositeCanvasObserver) -> CellGrid:
+    t1 = Tile(Image.new('RGB', (10, 10), color='red'), '000000000000')
+    t2 = Tile(Image.new('RGB', (10, 10), color='blue'), '000000000000')
+    cell_grid = CellGrid(2, 3, (10, 10), TileSetManager({'default_tile_set': TileSet([t1, t2])}))
+    cell_grid.add_observer(observer)
+    cell_grid.switch_tile_set()
+    return cell_grid
+
+# =======================================================================
+
+def test_on_load_creates_one_item():
+    # Arrange
+    canvas = FakeCanvas()
+    observer = create_observer(canvas)
+
+    # Act
+    cell_grid = create_cell_grid(observer)
+    cell_grid.load_cells()
+
+    # Assert
+    assert len(canvas.images) == 1
+    assert observer.get_image().size == (30, 20)
+    assert observer.get_image().getpixel((25, 15)) == (255, 255, 255)
+
+
+def test_collapse_pastes_into_grid_image():
+    # Arrange
+    canvas = FakeCanvas()
+    observer = create_observer(canvas)
+    cell_grid = create_cell_grid(observer)
+
+    # Act
+    cell_grid.collapse(1, 2, 0)
+    cell_grid.collapse(0, 0, 1)
+
+    # Assert
+    assert len(canvas.images) == 1
+    assert observer.get_image().getpixel((25, 15)) == (255, 0, 0)
+    assert observer.get_image().getpixel((5, 5)) == (0, 0, 255)
+    assert observer._canvas_image.pushed == []
+
+
+def test_flush_pushes_only_dirty_cells_once_per_frame():
+    # Arrange
+    canvas = FakeCanvas()
+    observer = create_observer(canvas)
+    cell_grid = create_cell_grid(observer)
+    cell_grid.collapse(1, 2, 0)
+
+    # Act
+    cell_grid.collapse(0, 0, 1)
+    for callback in canvas.idle_callbacks:
+        callback()
+    pushed_on_idle = list(observer._canvas_image.pushed)
+    observer._canvas_image.pushed.clear()
+    cell_grid.collapse(0, 1, 1)
+    observer.flush()
+
+    # Assert
+    assert len(canvas.idle_callbacks) == 2
+    assert sorted(pushed_on_idle) == [(0, 0, 10, 10), (20, 10, 30, 20)]
+    assert observer._canvas_image.pushed == [(10, 0, 20, 10)]
+
+
+def test_restore_clears_cell():
+    # Arrange
+    canvas = FakeCanvas()
+    observer = create_observer(canvas)
+    cell_grid = create_cell_grid(observer)
+    states = cell_grid.get_cell_states()
+    cell_grid.collapse(1, 2, 0)
+    observer.flush()
+
+    # Act
+    cell_grid.restore_cell_states(states)
+    observer.flush()
+
+    # Assert
+    assert observer.get_image().getpixel((25, 15)) == (255, 255, 255)
+    assert observer._canvas_image.pushed[-1] == (20, 10, 30, 20)
+
+
+def test_restore_to_collapsed_state_pastes_tile():
+    # Arrange
+    canvas = FakeCanvas()
+    observer = create_observer(canvas)
+    cell_grid = create_cell_grid(observer)
+    cell_grid.collapse(1, 2, 1)
+    states = cell_grid.get_cell_states()
+    cell_grid.load_cells()
+
+    # Act
+    cell_grid.restore_cell_states(states)
+
+    # Assert
+    assert observer.get_image().getpixel((25, 15)) == (0, 0, 255)
+
+
+def test_extra_information_overlay_kept_on_load(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(HeatmapOverlay, 'canvas_image_type', RecordingCanvasImage)
+    canvas = FakeCanvas()
+    observer = create_observer(canvas)
+    cell_grid = create_cell_grid(observer)
+
+    # Act
+    observer.enable_extra_information([cell for cell_row in cell_grid.cells for cell in cell_row])
+    cell_grid.load_cells()
+
+    # Assert
+    assert len(canvas.images) == 2
+    assert observer._overlay is not None
@@ -0,0 +1,154 @@
+from src.cells.cell import Cell
+from src.cells.entropy_index import EntropyIndex
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+
+
+def create_cell(row: int, column: int, tile_set_size: int) -> Cell:
+    tile_set = TileSet([Tile() for _ in range(tile_set_size)])
+    return Cell(row, column, (40, 40), tile_set)
+
+# =======================================================================
+
+def test_init_skips_collapsed_and_empty():
+    # Arrange
+    c1 = create_cell(0, 0, 2)
+    c2 = create_cell(0, 1, 0)
+    c3 = create_cell(0, 2, 3)
+    c3._is_collapsed = True
+
+    # Act
+    entropy_index = EntropyIndex([c1, c2, c3])
+
+    # Assert
+    assert len(entropy_index) == 1
+    assert c1 in entropy_index
+    assert c2 not in entropy_index
+    assert c3 not in entropy_index
+
+
+def test_get_min_size_empty():
+    # Arrange
+    entropy_index = EntropyIndex()
+
+    # Act
+    result = entropy_index.get_min_size()
+
+    # Assert
+    assert result is None
+
+
+def test_get_min_size():
+    # Arrange
+    c1 = create_cell(0, 0, 4)
+    c2 = create_cell(0, 1, 2)
+    c3 = create_cell(0, 2, 3)
+    entropy_index = EntropyIndex([c1, c2, c3])
+
+    # Act
+    result = entropy_index.get_min_size()
+
+    # Assert
+    assert result == 2
+
+# =======================================================================
+
+def test_choose_empty():
+    # Arrange
+    entropy_index = EntropyIndex()
+
+    # Act
+    result = entropy_index.choose()
+
+    # Assert
+    assert result is None
+
+
+def test_choose_least_entropy():
+    # Arrange
+    c1 = create_cell(0, 0, 4)
+    c2 = create_cell(0, 1, 2)
+    c3 = create_cell(0, 2, 2)
+    entropy_index = EntropyIndex([c1, c2, c3])
+
+    # Act
+    results = set(entropy_index.choose() for _ in range(50))
+
+    # Assert
+    assert results == set([c2, c3])
+
+
+def test_choose_does_not_remove():
+    # Arrange
+    c1 = create_cell(0, 0, 4)
+    entropy_index = EntropyIndex([c1])
+
+    # Act
+    result = entropy_index.choose()
+
+    # Assert
+    assert result is c1
+    assert c1 in entropy_index
+
+
+def test_choose_stale_collapsed_cell():
+    # Arrange
+    c1 = create_cell(0, 0, 4)
+    c2 = create_cell(0, 1, 2)
+    entropy_index = EntropyIndex([c1, c2])
+
+    # Act
+    c2._is_collapsed = True
+    result = entropy_index.choose()
+
+    # Assert
+    assert result is c1
+    assert c2 not in entropy_index
+
+# =======================================================================
+
+def test_update_reduced_cell():
+    # Arrange
+    c1 = create_cell(0, 0, 4)
+    c2 = create_cell(0, 1, 3)
+    entropy_index = EntropyIndex([c1, c2])
+
+    # Act
+    c1.tile_set = TileSet(c1.tile_set[:1])
+    entropy_index.update(c1)
+
+    # Assert
+    assert entropy_index.get_min_size() == 1
+    assert entropy_index.choose() is c1
+
+
+def test_update_empty_cell():
+    # Arrange
+    c1 = create_cell(0, 0, 4)
+    c2 = create_cell(0, 1, 3)
+    entropy_index = EntropyIndex([c1, c2])
+
+    # Act
+    c2.tile_set = TileSet()
+    entropy_index.update(c2)
+
+    # Assert
+    assert c2 not in entropy_index
+    assert entropy_index.get_min_size() == 4
+
+
+def test_remove_keeps_other_cells():
+    # Arrange
+    c1 = create_cell(0, 0, 2)
+    c2 = create_cell(0, 1, 2)
+    c3 = create_cell(0, 2, 2)
+    entropy_index = EntropyIndex([c1, c2, c3])
+
+    # Act
+    entropy_index.remove(c1)
+    entropy_index.remove(c1)
+    results = set(entropy_index.choose() for _ in range(50))
+
+    # Assert
+    assert len(entropy_index) == 2
+    assert results == set([c2, c3])
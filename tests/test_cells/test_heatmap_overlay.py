@@ -0,0 +1,97 @@
+import math
+
+import pytest
+from PIL import Image
+from src.cells.cell_grid import CellGrid
+from src.cells.heatmap_overlay import (COLLAPSED_COLOR, CONTRADICTION_COLOR, HEAT_ALPHA, HIGH_COLOR,
+                                       LOW_COLOR, HeatmapOverlay, get_heat, get_heat_color)
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_manager import TileSetManager
+from tests.test_cells.fakes import FakeCanvas, RecordingCanvasImage
+
+
+class RecordingHeatmapOverlay(HeatmapOverlay):
+    canvas_image_type = RecordingCanvasImage
+
+
+def create_cell_grid(cell_size: tuple[int, int]) -> CellGrid:
+    #                                                                [N][E][S][W]
+    t1 = Tile(image=Image.new('RGB', cell_size, color='red'), sides_code='000111000000')
+    t2 = Tile(image=Image.new('RGB', cell_size, color='blue'), sides_code='000000000000')
+    t3 = Tile(image=Image.new('RGB', cell_size, color='green'), sides_code='000000000000')
+    tile_set_manager = TileSetManager({'default_tile_set': TileSet([t1, t2, t3])})
+    cell_grid = CellGrid(1, 3, cell_size, tile_set_manager)
+    cell_grid.switch_tile_set()
+    return cell_grid
+
+# =======================================================================
+
+def test_get_heat():
+    # Act / Assert
+    assert get_heat(1, 5) == 0.0
+    assert get_heat(3, 5) == 0.5
+    assert get_heat(5, 5) == 1.0
+    assert get_heat(2, 4, 'entropy') == pytest.approx(math.log(2) / math.log(4))
+    assert get_heat(1, 1) == 0.0
+
+
+def test_get_heat_color():
+    # Act / Assert
+    assert get_heat_color(0.0) == (*LOW_COLOR, HEAT_ALPHA)
+    assert get_heat_color(1.0) == (*HIGH_COLOR, HEAT_ALPHA)
+
+
+def test_invalid_metric():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        RecordingHeatmapOverlay(FakeCanvas(), 1, 1, (10, 10), 'variance')
+
+# =======================================================================
+
+def test_update_colors_cells():
+    # Arrange
+    cell_grid = create_cell_grid((10, 10))
+    overlay = RecordingHeatmapOverlay(FakeCanvas(), 1, 3, (10, 10))
+
+    # Act
+    cell_grid.collapse(0, 2, 0)
+    cell_grid.reduce_possibilities_for(0, 2, cell_grid.cells[0][2].get_chosen_tile())
+    cell_grid.restrict(0, 0, 0)
+    overlay.update_all([cell for cell_row in cell_grid.cells for cell in cell_row])
+
+    # Assert
+    image = overlay.canvas_image.image
+    assert image.getpixel((5, 5)) == CONTRADICTION_COLOR
+    assert image.getpixel((15, 5)) == get_heat_color(0.5)
+    assert image.getpixel((25, 5)) == COLLAPSED_COLOR
+    assert overlay.show_labels is False
+
+
+def test_flush_pushes_updated_cells():
+    # Arrange
+    cell_grid = create_cell_grid((10, 10))
+    overlay = RecordingHeatmapOverlay(FakeCanvas(), 1, 3, (10, 10))
+    overlay.update_all(cell_grid.cells[0])
+    overlay.flush()
+
+    # Act
+    overlay.update(cell_grid.cells[0][1])
+    overlay.flush()
+
+    # Assert
+    assert overlay.canvas_image.pushed[3:] == [(10, 0, 20, 10)]
+
+
+def test_labels_at_large_cell_size():
+    # Arrange
+    cell_grid = create_cell_grid((40, 40))
+    overlay = RecordingHeatmapOverlay(FakeCanvas(), 1, 3, (40, 40))
+
+    # Act
+    overlay.update(cell_grid.cells[0][0])
+
+    # Assert
+    colors = overlay.canvas_image.image.crop((0, 0, 40, 40)).getcolors()
+    assert overlay.show_labels is True
+    assert len(colors) > 1
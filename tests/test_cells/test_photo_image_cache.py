@@ -0,0 +1,113 @@
+from PIL import Image
+from src.cells.canvas_observer import CanvasObserver
+from src.cells.cell_grid import CellGrid
+from src.cells.photo_image_cache import PhotoImageCache
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_manager import TileSetManager
+from tests.test_cells.fakes import FakeCanvas
+
+
+class FakePhotoImage:
+    def __init__(self, image):
+        self.image = image
+
+
+def create_tile_set_manager() -> TileSetManager:
+    t1 = Tile(Image.new('RGB', (40, 40), color='red'), '000000000000')
+    t2 = Tile(Image.new('RGB', (40, 40), color='blue'), '000000000000')
+    return TileSetManager({'default_tile_set': TileSet([t1, t2]),
+                           'other_tile_set': TileSet([Tile(Image.new('RGB', (40, 40)), '000000000000')])})
+
+# =======================================================================
+
+def test_get_photo_image_shared():
+    # Arrange
+    cache = PhotoImageCache(FakePhotoImage)
+    tile = Tile(Image.new('RGB', (40, 40)), '000000000000')
+
+    # Act
+    first = cache.get_photo_image(tile, (40, 40))
+    second = cache.get_photo_image(tile, [40, 40])
+
+    # Assert
+    assert first is second
+    assert first.image is tile.image
+    assert len(cache) == 1
+
+
+def test_get_photo_image_after_resize():
+    # Arrange
+    cache = PhotoImageCache(FakePhotoImage)
+    tile = Tile(Image.new('RGB', (40, 40)), '000000000000')
+    first = cache.get_photo_image(tile, (40, 40))
+
+    # Act
+    tile.resize_image((20, 20))
+    second = cache.get_photo_image(tile, (40, 40))
+
+    # Assert
+    assert second is not first
+    assert second.image.size == (20, 20)
+
+
+def test_invalidate_for():
+    # Arrange
+    cache = PhotoImageCache(FakePhotoImage)
+    tile_set = TileSet([Tile(Image.new('RGB', (40, 40)), '000000000000')])
+    other_tile_set = TileSet()
+
+    # Act
+    cache.invalidate_for(tile_set, (40, 40))
+    cache.get_photo_image(tile_set[0], (40, 40))
+    cache.invalidate_for(tile_set, (40, 40))
+    size_after_reload = len(cache)
+    cache.invalidate_for(tile_set, (20, 20))
+    cache.get_photo_image(tile_set[0], (20, 20))
+    cache.invalidate_for(other_tile_set, (20, 20))
+
+    # Assert
+    assert size_after_reload == 1
+    assert len(cache) == 0
+
+# =======================================================================
+
+def test_canvas_observer_shares_photo_images():
+    # Arrange
+    canvas = FakeCanvas()
+    observer = CanvasObserver(canvas)
+    observer._photo_image_cache = PhotoImageCache(FakePhotoImage)
+    cell_grid = CellGrid(2, 3, (40, 40), create_tile_set_manager())
+    cell_grid.add_observer(observer)
+    cell_grid.switch_tile_set()
+
+    # Act
+    for row in range(2):
+        for column in range(3):
+            cell_grid.collapse(row, column, column % 2)
+
+    # Assert
+    assert len(canvas.images) == 6
+    assert len({id(photo_image) for photo_image in canvas.images.values()}) == 2
+
+
+def test_canvas_observer_clears_photo_images_on_switch():
+    # Arrange
+    canvas = FakeCanvas()
+    observer = CanvasObserver(canvas)
+    observer._photo_image_cache = PhotoImageCache(FakePhotoImage)
+    cell_grid = CellGrid(1, 2, (40, 40), create_tile_set_manager())
+    cell_grid.add_observer(observer)
+    cell_grid.switch_tile_set()
+    cell_grid.collapse(0, 0, 0)
+    cell_grid.collapse(0, 1, 1)
+
+    # Act
+    cell_grid.load_cells()
+    size_after_reload = len(observer._photo_image_cache)
+    cell_grid.switch_tile_set('other_tile_set')
+
+    # Assert
+    assert size_after_reload == 2
+    assert len(observer._photo_image_cache) == 0
+    assert len(canvas.images) == 0
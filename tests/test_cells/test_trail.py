@@ -0,0 +1,77 @@
+from src.cells.cell import Cell
+from src.cells.trail import Trail
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+
+
+def create_cell(tile_set_size: int) -> Cell:
+    tile_set = TileSet([Tile() for _ in range(tile_set_size)])
+    return Cell(0, 0, (40, 40), tile_set)
+
+# =======================================================================
+
+def test_mark_empty():
+    # Arrange
+    trail = Trail()
+
+    # Act
+    result = trail.mark()
+
+    # Assert
+    assert result == 0
+
+
+def test_record():
+    # Arrange
+    cell = create_cell(3)
+    trail = Trail()
+
+    # Act
+    trail.record(cell, cell.get_state())
+    trail.record(cell, cell.get_state())
+
+    # Assert
+    assert len(trail) == 2
+    assert trail.mark() == 2
+
+# =======================================================================
+
+def test_pop_to_newest_first():
+    # Arrange
+    cell = create_cell(3)
+    trail = Trail()
+    trail.record(cell, cell.get_state())
+    mark = trail.mark()
+    cell.domain.intersect(0b011)
+    trail.record(cell, cell.get_state())
+    cell.domain.intersect(0b001)
+
+    # Act
+    results = [state[1] for _, state in trail.pop_to(mark)]
+
+    # Assert
+    assert results == [0b011]
+    assert len(trail) == mark
+
+
+def test_pop_to_restores_cells():
+    # Arrange
+    c1 = create_cell(3)
+    c2 = create_cell(2)
+    trail = Trail()
+    mark = trail.mark()
+    trail.record(c1, c1.get_state())
+    c1.domain.intersect(0b010)
+    trail.record(c2, c2.get_state())
+    c2.collapse()
+    trail.record(c1, c1.get_state())
+    c1.domain.intersect(0)
+
+    # Act
+    for cell, state in trail.pop_to(mark):
+        cell.restore_state(state)
+
+    # Assert
+    assert len(trail) == 0
+    assert c1.get_tile_set_size() == 3
+    assert c2.get_tile_set_size() == 2
@@ -1,5 +1,6 @@
 import pytest
-from src.formatters.wfc_config_formatter import _format_cell_size, format_wfc_configs
+from src.formatters.wfc_config_formatter import (DEFAULT_SOLVER_FPS, _format_cell_size,
+                                                  _format_solver_fps, format_wfc_configs)
 
 
 def test_format_cell_size_invalid():
@@ -37,6 +38,28 @@ def test_format_cell_size_tuple():
     # Assert
     assert result == expected_result
 
+def test_format_solver_fps_invalid():
+    # Arrange
+    solver_fps = 0
+
+    # Act
+    with pytest.raises(ValueError) as e:
+        result = _format_solver_fps(solver_fps)
+
+    # Assert
+    assert str(e.value) == 'Invalid default_solver_fps format.'
+
+
+def test_format_solver_fps_turbo():
+    # Arrange
+    solver_fps = None
+
+    # Act
+    result = _format_solver_fps(solver_fps)
+
+    # Assert
+    assert result is None
+
 # ==========================================================================
 
 def test_format_wfc_configs_int():
@@ -56,6 +79,7 @@ def test_format_wfc_configs_int():
         'default_tile_path': 'tilesets',
         'default_tile_set': 'basic_tiles_with_rotations',
         'default_solver_delay': 0.01,
+        'default_solver_fps': DEFAULT_SOLVER_FPS,
     }
     
     # Act
@@ -82,6 +106,7 @@ def test_format_wfc_configs_tuple():
         'default_tile_path': 'tilesets',
         'default_tile_set': 'basic_tiles_with_rotations',
         'default_solver_delay': 0.01,
+        'default_solver_fps': DEFAULT_SOLVER_FPS,
     }
     
     # Act
@@ -89,3 +114,21 @@ def test_format_wfc_configs_tuple():
     
     # Assert
     assert result == expected_result
+
+
+def test_format_wfc_configs_solver_fps():
+    # Arrange
+    configs = {
+        'default_cell_size': 20,
+        'default_solver_fps': 60,
+    }
+    expected_result = {
+        'default_cell_size': (20, 20),
+        'default_solver_fps': 60,
+    }
+
+    # Act
+    result = format_wfc_configs(configs)
+
+    # Assert
+    assert result == expected_result
@@ -0,0 +1,61 @@
+import json
+
+from PIL import Image
+from src.generation.batch import SUMMARY_FILE_NAME, BatchConfig, generate_batch
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+
+
+def create_tile_set() -> TileSet:
+    #                                                                [N][E][S][W]
+    t1 = Tile(image=Image.new('RGB', (10, 10), color='red'), sides_code='000111000111')
+    t2 = Tile(image=Image.new('RGB', (10, 10), color='blue'), sides_code='000000000000')
+    return TileSet([t1, t2])
+
+# =======================================================================
+
+def test_generate_batch(tmp_path):
+    # Arrange
+    config = BatchConfig('test_tile_set', 3, 4, (5, 5), output_dir=tmp_path)
+    results = []
+
+    # Act
+    summary = generate_batch(create_tile_set(), config, [7, 8, 9], 2, results.append)
+
+    # Assert
+    assert [job.seed for job in summary.jobs] == [7, 8, 9]
+    assert results == summary.jobs
+    assert all(job.is_solved for job in summary.jobs)
+    assert Image.open(tmp_path / 'test_tile_set_8.png').size == (20, 15)
+
+
+def test_generate_batch_summary(tmp_path):
+    # Arrange
+    config = BatchConfig('test_tile_set', 2, 2, (10, 10), output_dir=tmp_path)
+
+    # Act
+    generate_batch(create_tile_set(), config, range(2), 1)
+
+    with open(tmp_path / SUMMARY_FILE_NAME, encoding='utf-8') as file:
+        summary = json.load(file)
+
+    # Assert
+    assert summary['workers'] == 1
+    assert summary['solved'] == 2
+    assert summary['config']['output_dir'] == str(tmp_path)
+    assert [job['seed'] for job in summary['jobs']] == [0, 1]
+
+
+def test_generate_batch_same_seed_same_image(tmp_path):
+    # Arrange
+    config_1 = BatchConfig('test_tile_set', 4, 4, (10, 10), output_dir=tmp_path / '1')
+    config_2 = BatchConfig('test_tile_set', 4, 4, (10, 10), output_dir=tmp_path / '2')
+
+    # Act
+    generate_batch(create_tile_set(), config_1, [3], 1)
+    generate_batch(create_tile_set(), config_2, [3], 1)
+
+    # Assert
+    image_1 = Image.open(tmp_path / '1' / 'test_tile_set_3.png')
+    image_2 = Image.open(tmp_path / '2' / 'test_tile_set_3.png')
+    assert image_1.tobytes() == image_2.tobytes()
@@ -0,0 +1,113 @@
+import pytest
+from src.generation.chunk_store import TILE_SET_HASH_SIZE, ChunkStore
+from src.generation.chunks import Chunk
+
+
+TILE_SET_HASH = bytes(range(TILE_SET_HASH_SIZE))
+
+# =======================================================================
+
+def test_save_and_load(tmp_path):
+    # Arrange
+    store = ChunkStore(tmp_path, (2, 3), 5, TILE_SET_HASH)
+    chunk = Chunk(-4, 7, 2**64 - 1, [[0, 1, 2], [-1, 300, 5]], False, 3)
+
+    # Act
+    store.save(chunk)
+    result = store.load(-4, 7)
+
+    # Assert
+    assert (-4, 7) in store
+    assert result == chunk
+
+
+def test_load_missing(tmp_path):
+    # Arrange
+    store = ChunkStore(tmp_path, (2, 3), 5, TILE_SET_HASH)
+
+    # Act
+    result = store.load(0, 0)
+
+    # Assert
+    assert (0, 0) not in store
+    assert result is None
+
+
+def test_load_other_chunk_size(tmp_path):
+    # Arrange
+    store = ChunkStore(tmp_path, (1, 1), 5, TILE_SET_HASH)
+    store.save(Chunk(0, 0, 0, [[1]], True))
+    other_store = ChunkStore(tmp_path, (2, 2), 5, TILE_SET_HASH)
+
+    # Act
+    result = other_store.load(0, 0)
+
+    # Assert
+    assert result is None
+    assert (0, 0) not in other_store
+    assert store.load(0, 0) == Chunk(0, 0, 0, [[1]], True)
+
+
+def test_load_other_master_seed(tmp_path):
+    # Arrange
+    store = ChunkStore(tmp_path, (1, 1), 5, TILE_SET_HASH)
+    store.save(Chunk(0, 0, 0, [[1]], True))
+    other_store = ChunkStore(tmp_path, (1, 1), 2**70, TILE_SET_HASH)
+
+    # Act
+    result = other_store.load(0, 0)
+
+    # Assert
+    assert result is None
+    assert (0, 0) not in other_store
+    assert store.load(0, 0) == Chunk(0, 0, 0, [[1]], True)
+
+
+def test_load_other_tile_set(tmp_path):
+    # Arrange
+    store = ChunkStore(tmp_path, (1, 1), 5, TILE_SET_HASH)
+    store.save(Chunk(0, 0, 0, [[1]], True))
+    other_store = ChunkStore(tmp_path, (1, 1), 5, bytes(TILE_SET_HASH_SIZE))
+
+    # Act
+    result = other_store.load(0, 0)
+
+    # Assert
+    assert result is None
+    assert (0, 0) not in other_store
+    assert store.load(0, 0) == Chunk(0, 0, 0, [[1]], True)
+
+
+def test_load_stale_file(tmp_path):
+    # Arrange
+    store = ChunkStore(tmp_path, (1, 1), 5, TILE_SET_HASH)
+    store._get_path(0, 0).write_bytes(b'WFC1')
+    chunk = Chunk(0, 0, 0, [[1]], True)
+
+    # Act
+    result = store.load(0, 0)
+    is_stored = (0, 0) in store
+    store.save(chunk)
+
+    # Assert
+    assert result is None
+    assert is_stored is False
+    assert store.load(0, 0) == chunk
+
+
+def test_invalid_tile_set_hash(tmp_path):
+    # Act / Assert
+    with pytest.raises(ValueError):
+        ChunkStore(tmp_path, (1, 1), 5, b'short')
+
+
+def test_chunk_file_is_compact(tmp_path):
+    # Arrange
+    store = ChunkStore(tmp_path, (8, 8), 5, TILE_SET_HASH)
+    chunk = Chunk(0, 0, 0, [[1] * 8 for _ in range(8)], True)
+
+    # Act
+    store.save(chunk)
+
+    # Assert
+    assert store._get_path(0, 0).stat().st_size < 8 * 8 * 2 + 64
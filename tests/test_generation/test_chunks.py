@@ -0,0 +1,161 @@
+import pytest
+from PIL import Image
+from src.direction import Direction
+from src.generation.chunks import Chunk, ChunkGenerator, get_chunk_dependencies, get_chunk_level
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+
+
+def create_tile_set() -> TileSet:
+    '''
+    t1 only fits next to t1 on EAST/WEST, t2 only next to t2.
+    '''
+    #                                                                [N][E][S][W]
+    t1 = Tile(image=Image.new('RGB', (10, 10), color='red'), sides_code='000111000111')
+    t2 = Tile(image=Image.new('RGB', (10, 10), color='blue'), sides_code='000000000000')
+    return TileSet([t1, t2])
+
+# =======================================================================
+
+def test_get_edge():
+    # Arrange
+    chunk = Chunk(0, 0, 0, [[0, 1], [1, -1]], False)
+
+    # Act / Assert
+    assert chunk.get_edge(Direction.NORTH) == [0, 1]
+    assert chunk.get_edge(Direction.EAST) == [1, -1]
+    assert chunk.get_edge(Direction.SOUTH) == [1, -1]
+    assert chunk.get_edge(Direction.WEST) == [0, 1]
+
+
+def test_get_edge_invalid_direction():
+    # Arrange
+    chunk = Chunk(0, 0, 0, [[0]], True)
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        chunk.get_edge(Direction.INVALID)
+
+# =======================================================================
+
+def test_generate_chunk_with_west_border():
+    # Arrange
+    generator = ChunkGenerator(create_tile_set(), (3, 4), master_seed=5)
+
+    # Act
+    chunk = generator.generate_chunk(0, 1, {Direction.WEST: [0, 1, 0]})
+
+    # Assert
+    assert chunk.is_solved is True
+    assert chunk.tile_indices == [[0] * 4, [1] * 4, [0] * 4]
+
+
+def test_generate_chunk_invalid_border_cell_puts_no_constraint():
+    # Arrange
+    generator = ChunkGenerator(create_tile_set(), (1, 2), master_seed=5)
+
+    # Act
+    chunk = generator.generate_chunk(0, 0, {Direction.EAST: [-1]})
+
+    # Assert
+    assert chunk.is_solved is True
+    assert -1 not in chunk.tile_indices[0]
+
+
+def test_generate_chunk_same_coordinates_same_chunk():
+    # Arrange
+    generator_1 = ChunkGenerator(create_tile_set(), (6, 6), master_seed=11)
+    generator_2 = ChunkGenerator(create_tile_set(), (6, 6), master_seed=11)
+
+    # Act
+    chunk_1 = generator_1.generate_chunk(2, -3)
+    chunk_2 = generator_2.generate_chunk(2, -3)
+
+    # Assert
+    assert chunk_1.seed == generator_1.get_seed(2, -3)
+    assert chunk_1.tile_indices == chunk_2.tile_indices
+
+# =======================================================================
+
+def test_stream_joins_chunks_without_seams():
+    # Arrange
+    tile_set = create_tile_set()
+    generator = ChunkGenerator(tile_set, (4, 3), master_seed=3)
+
+    # Act
+    chunks = list(generator.stream(3, 2))
+
+    # Assert
+    assert [(chunk.chunk_row, chunk.chunk_column) for chunk in chunks] == \
+           [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+
+    for west, east in zip(chunks, chunks[1:]):
+        if east.chunk_column == 0:
+            continue
+
+        for west_index, east_index in zip(west.get_edge(Direction.EAST), east.get_edge(Direction.WEST)):
+            assert tile_set.get_adjacency_mask(west_index, Direction.EAST) >> east_index & 1
+
+
+def test_stream_without_end():
+    # Arrange
+    generator = ChunkGenerator(create_tile_set(), (2, 2), master_seed=3)
+
+    # Act
+    stream = generator.stream(1)
+    chunks = [next(stream) for _ in range(5)]
+
+    # Assert
+    assert [chunk.chunk_row for chunk in chunks] == [0, 1, 2, 3, 4]
+
+
+def test_get_image():
+    # Arrange
+    generator = ChunkGenerator(create_tile_set(), (1, 2), cell_size=(5, 5))
+    chunk = Chunk(0, 0, 0, [[1, -1]], False)
+
+    # Act
+    image = generator.get_image(chunk)
+
+    # Assert
+    assert image.size == (10, 5)
+    assert image.getpixel((2, 2)) == (0, 0, 255)
+    assert image.getpixel((7, 2)) == (255, 255, 255)
+
+
+def test_get_chunk_dependencies_lower_level_neighbours():
+    # Arrange
+    coordinates = [(row, column) for row in range(-9, 10) for column in range(-9, 10)]
+
+    # Act
+    dependencies = {point: get_chunk_dependencies(*point, 4) for point in coordinates}
+
+    # Assert
+    assert dependencies[(0, 0)] == {}
+    assert dependencies[(1, 1)] == {Direction.NORTH: (0, 1), Direction.WEST: (1, 0)}
+    assert dependencies[(-1, -1)] == {Direction.EAST: (-1, 0), Direction.SOUTH: (0, -1)}
+    assert len(dependencies[(2, 6)]) == 4
+
+    for (row, column), neighbours in dependencies.items():
+        # each neighbour is nearer to an anchor chunk, so there are no cycles
+        for neighbour in neighbours.values():
+            assert get_chunk_level(*neighbour, 4) == get_chunk_level(row, column, 4) - 1
+            assert get_chunk_level(*neighbour, 4) <= 4
+
+
+def test_get_chunk_dependencies_one_per_pair_of_neighbours():
+    # Arrange
+    coordinates = [(row, column) for row in range(-9, 10) for column in range(-9, 10)]
+
+    # Act / Assert
+    for row, column in coordinates:
+        for neighbour in [(row + 1, column), (row, column + 1)]:
+            depends_on_neighbour = neighbour in get_chunk_dependencies(row, column).values()
+            neighbour_depends_on_chunk = (row, column) in get_chunk_dependencies(*neighbour).values()
+            assert depends_on_neighbour is not neighbour_depends_on_chunk
+
+
+def test_get_chunk_dependencies_invalid_super_chunk_size():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        get_chunk_dependencies(0, 0, 3)
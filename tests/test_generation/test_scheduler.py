@@ -0,0 +1,69 @@
+from PIL import Image
+from src.generation.chunks import SUPER_CHUNK_SIZE, ChunkGenerator
+from src.generation.scheduler import ChunkScheduler
+from src.generation.world import LazyWorld
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+
+
+def create_generator() -> ChunkGenerator:
+    #                                                                [N][E][S][W]
+    t1 = Tile(image=Image.new('RGB', (10, 10), color='red'), sides_code='000111000111')
+    t2 = Tile(image=Image.new('RGB', (10, 10), color='blue'), sides_code='000000000000')
+    t3 = Tile(image=Image.new('RGB', (10, 10), color='green'), sides_code='000000000000')
+    return ChunkGenerator(TileSet([t1, t2, t3]), (4, 4), master_seed=2, max_attempts=2)
+
+# =======================================================================
+
+def test_solve_yields_region_chunks():
+    # Arrange
+    scheduler = ChunkScheduler(create_generator(), workers=2)
+
+    # Act
+    chunks = list(scheduler.solve(range(-1, 2), range(3, 5)))
+
+    # Assert
+    assert sorted((chunk.chunk_row, chunk.chunk_column) for chunk in chunks) == \
+           [(-1, 3), (-1, 4), (0, 3), (0, 4), (1, 3), (1, 4)]
+
+
+def test_solve_same_as_lazy_world():
+    # Arrange
+    scheduler = ChunkScheduler(create_generator(), workers=2, max_pending=1)
+    world = LazyWorld(create_generator())
+
+    # Act
+    chunks = list(scheduler.solve(range(3), range(3)))
+
+    # Assert
+    for chunk in chunks:
+        assert chunk == world.get_chunk(chunk.chunk_row, chunk.chunk_column)
+
+
+def test_solve_every_chunk_is_valid():
+    # Arrange
+    scheduler = ChunkScheduler(create_generator(), workers=2)
+
+    # Act
+    chunks = list(scheduler.solve(range(4), range(4)))
+
+    # Assert
+    assert len(chunks) == 16
+    for chunk in chunks:
+        assert chunk.is_solved is True
+        assert all(-1 not in row for row in chunk.tile_indices)
+
+
+def test_solve_far_region_depends_on_nearby_chunks():
+    # Arrange
+    region = {(row, column) for row in range(100, 110) for column in range(100, 110)}
+
+    # Act
+    dependencies = ChunkScheduler._get_dependencies(region)
+
+    # Assert
+    assert region <= set(dependencies)
+    # rows and columns between the anchor chunks around the region
+    for row, column in dependencies:
+        assert 100 - SUPER_CHUNK_SIZE <= row <= 110 + SUPER_CHUNK_SIZE
+        assert 100 - SUPER_CHUNK_SIZE <= column <= 110 + SUPER_CHUNK_SIZE
@@ -0,0 +1,146 @@
+import pytest
+from PIL import Image
+from src.direction import Direction
+from src.generation.chunks import SUPER_CHUNK_SIZE, ChunkGenerator
+from src.generation.world import LazyWorld
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+
+
+def create_generator(master_seed: int = 1) -> ChunkGenerator:
+    #                                                                [N][E][S][W]
+    t1 = Tile(image=Image.new('RGB', (10, 10), color='red'), sides_code='000111000111')
+    t2 = Tile(image=Image.new('RGB', (10, 10), color='blue'), sides_code='000000000000')
+    t3 = Tile(image=Image.new('RGB', (10, 10), color='green'), sides_code='000000000000')
+    return ChunkGenerator(TileSet([t1, t2, t3]), (3, 3), master_seed=master_seed)
+
+# =======================================================================
+
+def test_invalid_cache_size():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        LazyWorld(create_generator(), cache_size=0)
+
+
+def test_tile_at_generates_only_needed_chunks():
+    # Arrange
+    world = LazyWorld(create_generator())
+
+    # Act
+    corner_tile = world.tile_at(-1, -1)
+    generated_corner = world.generated_chunks
+    east_tile = world.tile_at(4, 1)
+
+    # Assert
+    assert corner_tile is not None and east_tile is not None
+    # (-1, -1) depends on (0, -1) and (-1, 0), which depend on (0, 0)
+    assert generated_corner == 4
+    # (0, 1) depends on (0, 0), which is already generated
+    assert world.generated_chunks == 4 + 1
+
+
+def test_tile_index_at_does_not_depend_on_query_order():
+    # Arrange
+    world_1 = LazyWorld(create_generator())
+    world_2 = LazyWorld(create_generator())
+    points = [(x, y) for y in range(-4, 5) for x in range(-4, 5)]
+
+    # Act
+    result_1 = [world_1.tile_index_at(x, y) for x, y in points]
+    result_2 = [world_2.tile_index_at(x, y) for x, y in reversed(points)][::-1]
+
+    # Assert
+    assert result_1 == result_2
+
+
+def test_chunks_join_without_seams():
+    # Arrange
+    world = LazyWorld(create_generator(7))
+    tile_set = world.generator.tile_set
+
+    # Act
+    tiles = [[world.tile_index_at(x, y) for x in range(-3, 9)] for y in range(-3, 9)]
+
+    # Assert
+    for row in tiles:
+        assert -1 not in row
+
+        for west, east in zip(row, row[1:]):
+            assert tile_set.get_adjacency_mask(west, Direction.EAST) >> east & 1
+
+
+def test_far_chunk_generates_each_chunk_once():
+    # Arrange
+    world = LazyWorld(create_generator(), cache_size=1)
+
+    # Act
+    tile_index = world.tile_index_at(-7, 7)
+
+    # Assert
+    assert tile_index != -1
+    # chunks (0..2, 0..-3), between (2, -3) and (0, 0)
+    assert world.generated_chunks == 3 * 4
+
+
+def test_far_chunk_generates_as_many_chunks_as_near_chunk():
+    # Arrange
+    near_world = LazyWorld(create_generator(), cache_size=4)
+    far_world = LazyWorld(create_generator(), cache_size=4)
+    offset = SUPER_CHUNK_SIZE * 1000
+
+    # Act
+    near_world.get_chunk(2, -3)
+    far_world.get_chunk(2 + offset, -3 - offset)
+
+    # Assert
+    assert far_world.generated_chunks == near_world.generated_chunks == 3 * 4
+
+# =======================================================================
+
+def test_evicted_chunks_are_stored(tmp_path):
+    # Arrange
+    world = LazyWorld(create_generator(), cache_size=2, store_directory=tmp_path)
+    first_tile = world.tile_index_at(0, 0)
+
+    # Act
+    for x in range(3, 12, 3):
+        world.tile_index_at(x * 2, 0)
+
+    generated_chunks = world.generated_chunks
+    result = world.tile_index_at(0, 0)
+
+    # Assert
+    assert len(world) == 2
+    assert (0, 0) in world.store
+    assert result == first_tile
+    assert world.generated_chunks == generated_chunks
+
+
+def test_store_of_other_master_seed_is_not_used(tmp_path):
+    # Arrange
+    world_1 = LazyWorld(create_generator(1), cache_size=1, store_directory=tmp_path)
+    world_1.tile_index_at(0, 0)
+    world_1.tile_index_at(3, 0)
+    world_2 = LazyWorld(create_generator(2), cache_size=1, store_directory=tmp_path)
+    expected = LazyWorld(create_generator(2)).get_chunk(0, 0)
+
+    # Act
+    result = world_2.get_chunk(0, 0)
+
+    # Assert
+    assert result == expected
+    assert world_2.generated_chunks == 1
+
+
+def test_evicted_chunks_without_store_are_generated_again():
+    # Arrange
+    world = LazyWorld(create_generator(), cache_size=1)
+    first_tile = world.tile_index_at(0, 0)
+
+    # Act
+    world.tile_index_at(6, 0)
+    result = world.tile_index_at(0, 0)
+
+    # Assert
+    assert result == first_tile
+    assert world.generated_chunks == 4
@@ -0,0 +1,23 @@
+from types import SimpleNamespace
+
+from src.motion_coalescer import MotionCoalescer
+
+# ==========================================================================
+
+def test_one_handler_call_per_frame():
+    # Arrange
+    callbacks = []
+    positions = []
+    coalescer = MotionCoalescer(lambda delay, callback: callbacks.append(callback),
+                                lambda x, y: positions.append((x, y)))
+
+    # Act
+    for x in range(100):
+        coalescer.on_motion(SimpleNamespace(x=x, y=2 * x))
+    callbacks.pop()()
+    coalescer.on_motion(SimpleNamespace(x=5, y=6))
+    callbacks.pop()()
+
+    # Assert
+    assert positions == [(99, 198), (5, 6)]
+    assert callbacks == []
@@ -1,39 +1,101 @@
-from pathlib import Path
-from PIL import Image
-from src.readers.image_reader import read_image, read_images
-
-def test_read_image():
-    # Arange
-    image_path = Path('tests/resources/black.png')
-    
-    # Act
-    image = read_image(image_path)
-    
-    # Assert
-    assert image is not None
-    assert isinstance(image, Image.Image) is True
-    assert image.size == (40, 40)
-
-
-def test_read_images_png():
-    # Arange
-    dir_path = Path('tests/resources')
-    
-    # Act
-    images = read_images(dir_path)
-    
-    # Assert
-    assert len(images) == 1
-    assert 'black' in images
-
-
-def test_read_images_jpeg_none():
-    # Arange
-    dir_path = Path('tests/resources')
-    
-    # Act
-    images = read_images(dir_path, file_extension='.jpeg')
-    
-    # Assert
-    assert len(images) == 0
-    assert 'black' not in images
\ No newline at end of file
+import pytest
+from pathlib import Path
+from PIL import Image
+from src.readers.image_reader import load_image, load_images, read_atlas, read_image, read_images
+
+def test_read_image():
+    # Arange
+    image_path = Path('tests/resources/black.png')
+    
+    # Act
+    image = read_image(image_path)
+    
+    # Assert
+    assert image is not None
+    assert isinstance(image, Image.Image) is True
+    assert image.size == (40, 40)
+
+
+def test_read_images_png():
+    # Arange
+    dir_path = Path('tests/resources')
+    
+    # Act
+    images = read_images(dir_path)
+    
+    # Assert
+    assert len(images) == 1
+    assert 'black' in images
+
+
+def test_read_images_jpeg_none():
+    # Arange
+    dir_path = Path('tests/resources')
+    
+    # Act
+    images = read_images(dir_path, file_extension='.jpeg')
+    
+    # Assert
+    assert len(images) == 0
+    assert 'black' not in images
+
+def test_load_image():
+    # Arange
+    image_path = Path('tests/resources/black.png')
+    
+    # Act
+    image = load_image(image_path)
+    
+    # Assert
+    assert image.mode == 'RGBA'
+    assert image.getpixel((0, 0)) == (0, 0, 0, 255)
+    assert getattr(image, 'fp', None) is None
+
+
+def test_load_image_keep_mode():
+    # Arange
+    image_path = Path('tests/resources/black.png')
+    
+    # Act
+    image = load_image(image_path, mode=None)
+    
+    # Assert
+    assert image.mode == 'RGB'
+    assert getattr(image, 'fp', None) is None
+
+
+def test_load_images_png():
+    # Arange
+    dir_path = Path('tests/resources')
+    
+    # Act
+    images = load_images(dir_path, max_workers=2)
+    
+    # Assert
+    assert list(images) == ['black']
+    assert images['black'].size == (40, 40)
+    assert images['black'].mode == 'RGBA'
+
+
+def test_read_atlas():
+    # Arange
+    atlas_path = Path('tests/resources/atlas/atlas_tile_set/atlas.png')
+    positions = {'blank': 0, 'cross': (0, 2), 'straight': 3}
+    
+    # Act
+    images = read_atlas(atlas_path, (40, 40), positions)
+    
+    # Assert
+    assert list(images) == ['blank', 'cross', 'straight']
+    assert all(image.size == (40, 40) for image in images.values())
+    assert images['straight'].tobytes() == \
+           load_image(Path('tilesets/default_tile_set/straight.png')).tobytes()
+
+
+def test_read_atlas_position_outside():
+    # Arange
+    atlas_path = Path('tests/resources/atlas/atlas_tile_set/atlas.png')
+    
+    # Act / Assert
+    with pytest.raises(ValueError):
+        read_atlas(atlas_path, (40, 40), {'blank': (2, 0)})
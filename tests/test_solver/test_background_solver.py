@@ -0,0 +1,181 @@
+import threading
+
+from PIL import Image
+from src.cells.cell_grid import CellGrid, GridObserver
+from src.solver.background_solver import BackgroundSolver, QueuedObserver
+from src.solver.render_scheduler import RenderScheduler
+from src.solver.solver import Solver
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_manager import TileSetManager
+
+
+class RecordingObserver(GridObserver):
+    def __init__(self):
+        self.threads = set()
+        self.collapsed = []
+        self.refreshes = 0
+
+    def on_collapse(self, cell, tile):
+        self.threads.add(threading.get_ident())
+        self.collapsed.append(cell.get_coordinates())
+
+    def refresh(self):
+        self.refreshes += 1
+
+
+class EventObserver(GridObserver):
+    def __init__(self):
+        self.events = []
+
+    def on_load(self, cells):
+        self.events.append(('on_load', None))
+
+    def on_collapse(self, cell, tile):
+        self.events.append(('on_collapse', cell.get_coordinates()))
+
+    def on_reduce(self, cell):
+        self.events.append(('on_reduce', cell.get_coordinates()))
+
+    def on_restore(self, cell):
+        self.events.append(('on_restore', cell.get_coordinates()))
+
+
+class FakeScheduler:
+    '''
+    Stands in for root.after, callbacks are run by run_until_empty.
+    '''
+    def __init__(self):
+        self.callbacks = []
+        self.delays = []
+
+    def __call__(self, delay, callback):
+        self.delays.append(delay)
+        self.callbacks.append(callback)
+
+    def run_until_empty(self, background_solver):
+        polls = 0
+        while self.callbacks:
+            background_solver._thread.join(0.01)
+            self.callbacks.pop(0)()
+            polls += 1
+        return polls
+
+
+def create_cell_grid(rows: int, columns: int) -> CellGrid:
+    t1 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000000000000')
+    t2 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000000000000')
+    tile_set_manager = TileSetManager({'default_tile_set': TileSet([t1, t2])})
+    cell_grid = CellGrid(rows, columns, (40, 40), tile_set_manager)
+    cell_grid.switch_tile_set()
+    return cell_grid
+
+# =======================================================================
+
+def test_events_passed_on_polling_thread():
+    # Arrange
+    cell_grid = create_cell_grid(5, 5)
+    observer = RecordingObserver()
+    cell_grid.add_observer(observer)
+    schedule = FakeScheduler()
+    done = []
+    background_solver = BackgroundSolver(Solver(cell_grid), schedule, RenderScheduler(50), done.append)
+
+    # Act
+    background_solver.start()
+    schedule.run_until_empty(background_solver)
+
+    # Assert
+    assert done == [background_solver]
+    assert background_solver.is_solved is True
+    assert background_solver.is_running() is False
+    assert observer.threads == {threading.get_ident()}
+    assert sorted(observer.collapsed) == [(row, column) for row in range(5) for column in range(5)]
+    assert cell_grid.observers == [observer]
+    assert schedule.delays[0] == 20
+
+
+def test_turbo_drains_once():
+    # Arrange
+    cell_grid = create_cell_grid(5, 5)
+    observer = RecordingObserver()
+    cell_grid.add_observer(observer)
+    schedule = FakeScheduler()
+    background_solver = BackgroundSolver(Solver(cell_grid), schedule, RenderScheduler(None))
+
+    # Act
+    background_solver.start()
+    schedule.run_until_empty(background_solver)
+
+    # Assert
+    assert len(observer.collapsed) == 25
+    assert observer.refreshes == 1
+
+
+def test_drain_leaves_events_added_while_draining():
+    # Arrange
+    cell = create_cell_grid(1, 1).cells[0][0]
+    observer = EventObserver()
+    queued_observer = QueuedObserver([observer])
+    # stands in for a worker adding an event for each drained one
+    observer.on_reduce = lambda cell: queued_observer.on_reduce(cell)
+    queued_observer.on_reduce(cell)
+
+    # Act
+    first_count = queued_observer.drain()
+    second_count = queued_observer.drain()
+
+    # Assert
+    assert first_count == 1
+    assert second_count == 1
+
+
+def test_drain_coalesce_one_event_per_cell():
+    # Arrange
+    cells = create_cell_grid(1, 3).cells[0]
+    tile = cells[0].domain.tile_set[0]
+    observer = EventObserver()
+    queued_observer = QueuedObserver([observer])
+    queued_observer.on_collapse(cells[2], tile)
+    queued_observer.on_load([cells])
+    queued_observer.on_reduce(cells[0])
+    queued_observer.on_collapse(cells[0], tile)
+    queued_observer.on_reduce(cells[1])
+    queued_observer.on_reduce(cells[1])
+    queued_observer.on_restore(cells[0])
+    queued_observer.on_reduce(cells[0])
+    queued_observer.on_reduce(cells[2])
+    queued_observer.on_collapse(cells[2], tile)
+
+    # Act
+    count = queued_observer.drain(coalesce=True)
+
+    # Assert
+    assert count == 10
+    assert observer.events == [('on_load', None),
+                               ('on_restore', (0, 0)),
+                               ('on_reduce', (0, 1)),
+                               ('on_collapse', (0, 2))]
+
+
+def test_cancel_paused_solver():
+    # Arrange
+    cell_grid = create_cell_grid(5, 5)
+    observer = RecordingObserver()
+    cell_grid.add_observer(observer)
+    schedule = FakeScheduler()
+    background_solver = BackgroundSolver(Solver(cell_grid), schedule)
+
+    # Act
+    background_solver.pause()
+    background_solver.start()
+    background_solver._thread.join(0.05)
+    was_running = background_solver.is_running()
+    background_solver.cancel()
+    schedule.run_until_empty(background_solver)
+
+    # Assert
+    assert was_running is True
+    assert background_solver.is_solved is False
+    assert observer.collapsed == []
+    assert all(cell.get_tile_set_size() == 2 for cell_row in cell_grid.cells for cell in cell_row)
@@ -0,0 +1,64 @@
+import pytest
+
+from src.solver.nogood_store import NogoodStore
+
+
+def test_init_invalid_max_size():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        NogoodStore(0)
+
+
+def test_add():
+    # Arrange
+    nogood_store = NogoodStore()
+    nogood = frozenset([(0, 0, 1), (0, 1, 2)])
+
+    # Act
+    nogood_store.add(nogood)
+    nogood_store.add(nogood)
+
+    # Assert
+    assert len(nogood_store) == 1
+    assert nogood in nogood_store
+
+# =======================================================================
+
+def test_get_nogoods_by_cell():
+    # Arrange
+    n1 = frozenset([(0, 0, 1), (0, 1, 2)])
+    n2 = frozenset([(0, 1, 3), (2, 2, 0)])
+    nogood_store = NogoodStore()
+    nogood_store.add(n1)
+    nogood_store.add(n2)
+
+    # Act
+    result_1 = nogood_store.get_nogoods(0, 1)
+    result_2 = nogood_store.get_nogoods(2, 2)
+    result_3 = nogood_store.get_nogoods(5, 5)
+
+    # Assert
+    assert set(result_1) == set([n1, n2])
+    assert result_2 == [n2]
+    assert result_3 == []
+
+# =======================================================================
+
+def test_add_evicts_least_recently_used():
+    # Arrange
+    n1 = frozenset([(0, 0, 1)])
+    n2 = frozenset([(0, 1, 1)])
+    n3 = frozenset([(0, 2, 1)])
+    nogood_store = NogoodStore(2)
+    nogood_store.add(n1)
+    nogood_store.add(n2)
+
+    # Act
+    nogood_store.get_nogoods(0, 0)
+    nogood_store.add(n3)
+
+    # Assert
+    assert len(nogood_store) == 2
+    assert n1 in nogood_store
+    assert n2 not in nogood_store
+    assert nogood_store.get_nogoods(0, 1) == []
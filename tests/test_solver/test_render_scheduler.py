@@ -0,0 +1,95 @@
+import pytest
+from PIL import Image
+from src.cells.cell_grid import CellGrid, GridObserver
+from src.solver.render_scheduler import RenderScheduler
+from src.solver.solver import Solver
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_manager import TileSetManager
+
+
+class FakeClock:
+    def __init__(self, step: float):
+        self.time = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.time += self.step
+        return self.time
+
+
+class RefreshCounter(GridObserver):
+    def __init__(self):
+        self.refreshes = 0
+
+    def refresh(self):
+        self.refreshes += 1
+
+
+def create_cell_grid(rows: int, columns: int) -> CellGrid:
+    t1 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000000000000')
+    t2 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000000000000')
+    tile_set_manager = TileSetManager({'default_tile_set': TileSet([t1, t2])})
+    cell_grid = CellGrid(rows, columns, (40, 40), tile_set_manager)
+    cell_grid.switch_tile_set()
+    return cell_grid
+
+# =======================================================================
+
+def test_invalid_fps():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        RenderScheduler(0)
+
+
+def test_step_renders_at_most_fps():
+    # Arrange
+    cell_grid = create_cell_grid(1, 1)
+    observer = RefreshCounter()
+    cell_grid.add_observer(observer)
+    # 10 steps per frame
+    scheduler = RenderScheduler(fps=10, clock=FakeClock(0.01))
+
+    # Act
+    rendered = [scheduler.step(cell_grid) for _ in range(30)]
+
+    # Assert
+    assert rendered.count(True) == 3
+    assert observer.refreshes == 3
+
+
+def test_turbo_renders_on_finish():
+    # Arrange
+    cell_grid = create_cell_grid(1, 1)
+    observer = RefreshCounter()
+    cell_grid.add_observer(observer)
+    scheduler = RenderScheduler(fps=None)
+
+    # Act
+    for _ in range(30):
+        scheduler.step(cell_grid)
+    scheduler.finish(cell_grid)
+
+    # Assert
+    assert scheduler.is_turbo() is True
+    assert observer.refreshes == 1
+
+# =======================================================================
+
+def test_solver_with_render_scheduler():
+    # Arrange
+    cell_grid = create_cell_grid(10, 10)
+    observer = RefreshCounter()
+    cell_grid.add_observer(observer)
+    # one frame every 25 steps
+    scheduler = RenderScheduler(fps=4, clock=FakeClock(0.01))
+    solver = Solver(cell_grid, delay=10, render_scheduler=scheduler)
+
+    # Act
+    is_solved = solver.start()
+
+    # Assert
+    assert is_solved is True
+    assert all(cell._is_collapsed for cell in solver._get_cells())
+    assert observer.refreshes == 5
+    assert scheduler.frames == 5
@@ -0,0 +1,97 @@
+import pytest
+
+from src.solver.restart import AttemptReport, RestartPolicy, derive_seed, luby
+
+
+def test_luby():
+    # Act
+    result = [luby(index) for index in range(1, 16)]
+
+    # Assert
+    assert result == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
+
+
+def test_luby_invalid_index():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        luby(0)
+
+# =======================================================================
+
+def test_derive_seed_same_arguments():
+    # Act
+    result_1 = derive_seed(42, 3, 'chunk')
+    result_2 = derive_seed(42, 3, 'chunk')
+
+    # Assert
+    assert result_1 == result_2
+    assert 0 <= result_1 < 2**64
+
+
+def test_derive_seed_different_arguments():
+    # Act
+    results = set([derive_seed(42, 0), derive_seed(42, 1), derive_seed(43, 0), derive_seed(42)])
+
+    # Assert
+    assert len(results) == 4
+
+# =======================================================================
+
+def test_policy_invalid_schedule():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        RestartPolicy(schedule='linear')
+
+
+def test_policy_invalid_budget_type():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        RestartPolicy(budget_type='seconds')
+
+
+def test_policy_random_master_seed_is_fixed():
+    # Arrange
+    policy = RestartPolicy()
+
+    # Act
+    seeds = [policy.get_seed(attempt) for attempt in range(3)]
+
+    # Assert
+    assert isinstance(policy.master_seed, int)
+    assert seeds == [derive_seed(policy.master_seed, attempt) for attempt in range(3)]
+    assert len(set(seeds)) == 3
+
+
+def test_policy_luby_budget():
+    # Arrange
+    policy = RestartPolicy(schedule='luby', base_budget=10)
+
+    # Act
+    result = [policy.get_budget(attempt) for attempt in range(7)]
+
+    # Assert
+    assert result == [10, 10, 20, 10, 10, 20, 40]
+
+
+def test_policy_geometric_budget():
+    # Arrange
+    policy = RestartPolicy(schedule='geometric', base_budget=10, factor=1.5)
+
+    # Act
+    result = [policy.get_budget(attempt) for attempt in range(4)]
+
+    # Assert
+    assert result == [10, 15, 22, 33]
+
+# =======================================================================
+
+def test_attempt_report_str():
+    # Arrange
+    report = AttemptReport(attempt=2, seed=7, budget=10, elapsed=0.5,
+                           steps=12, contradictions=11, is_over_budget=True)
+
+    # Act
+    result = str(report)
+
+    # Assert
+    assert result == 'attempt 2: over budget in 0.500s, 12 steps, 11 contradictions, seed 7'
@@ -1,14 +1,13 @@
-import tkinter as tk
+import pytest
 from PIL import Image
-from src.cells.cell_manager import CellManager
+from src.cells.cell_grid import CellGrid
+from src.solver.restart import RestartPolicy
 from src.solver.solver import Solver
+from src.solver.solver_control import SolverControl
 from src.tiles.tile import Tile
 from src.tiles.tile_set import TileSet
 from src.tiles.tile_set_manager import TileSetManager
 
-ROOT = tk.Tk()
-CANVAS = tk.Canvas(ROOT)
-
 # ======================================================================================
 
 def test_get_cells():
@@ -19,8 +18,8 @@ def test_get_cells():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     expected_result = '[<row=0,column=0,tile_set_size=4>, <row=0,column=1,tile_set_size=4>, <row=1,column=0,tile_set_size=4>, <row=1,column=1,tile_set_size=4>]'
     
@@ -40,8 +39,8 @@ def test_get_min_cells_all():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     expected_result = '[<row=0,column=0,tile_set_size=4>, <row=0,column=1,tile_set_size=4>, <row=1,column=0,tile_set_size=4>, <row=1,column=1,tile_set_size=4>]'
     
@@ -61,8 +60,8 @@ def test_get_min_cells_collapsed():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     expected_result = '[<row=0,column=0,tile_set_size=-1>]'
     
@@ -84,8 +83,8 @@ def test_get_min_cells_score_all():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     expected_result = 4
     
@@ -105,8 +104,8 @@ def test_get_min_cells_score_collapsed():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     expected_result = -1
     
@@ -128,8 +127,8 @@ def test_prune_collapsed_cells_none():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     expected_result = '[<row=0,column=0,tile_set_size=4>, <row=0,column=1,tile_set_size=4>, <row=1,column=0,tile_set_size=4>, <row=1,column=1,tile_set_size=4>]'
     
@@ -149,8 +148,8 @@ def test_prune_collapsed_cells_one():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     expected_result = '[<row=0,column=1,tile_set_size=4>, <row=1,column=0,tile_set_size=4>, <row=1,column=1,tile_set_size=4>]'
     
@@ -171,8 +170,8 @@ def test_prune_collapsed_cells_two():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     expected_result = '[<row=0,column=1,tile_set_size=4>, <row=1,column=0,tile_set_size=4>]'
     
@@ -194,8 +193,8 @@ def test_prune_collapsed_cells_tall():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     expected_result = []
     
@@ -220,8 +219,8 @@ def test_check_invalid_none_collapsed():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     
     # Act
@@ -242,8 +241,8 @@ def test_check_invalid_all_collapsed():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     
     # Act
@@ -268,8 +267,8 @@ def test_check_invalid_one_invalid():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     
     # Act
@@ -294,8 +293,8 @@ def test_start_has_cells():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     
     # Act
@@ -324,8 +323,8 @@ def test_start_no_cells():
     t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
     tile_set = TileSet([t1, t2, t3, t4])
     tile_set_manager = TileSetManager({'default_tile_set': tile_set})
-    cell_manager = CellManager(2, 2, (40, 40), CANVAS, tile_set_manager)
-    cell_manager.switch_tile_sets_with(tk.BooleanVar(ROOT, False))
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
     solver = Solver(cell_manager)
     
     # Act
@@ -340,3 +339,127 @@ def test_start_no_cells():
     assert cell_manager.cells[0][1]._is_collapsed is True
     assert cell_manager.cells[1][0]._is_collapsed is True
     assert cell_manager.cells[1][1]._is_collapsed is True
+
+
+def test_start_numpy_backend():
+    # Arrange
+    t1 = Tile(image=Image.new('RGB', (40, 40)), sides_code='111000000000')
+    t2 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000000000111')
+    t3 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000000111000')
+    t4 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
+    tile_set = TileSet([t1, t2, t3, t4])
+    tile_set_manager = TileSetManager({'default_tile_set': tile_set})
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
+    solver = Solver(cell_manager, backend='numpy')
+    
+    # Act
+    chosen_tile = cell_manager.collapse(0, 0)
+    cell_manager.reduce_possibilities_for(0, 0, chosen_tile)
+    solver.start(False)
+    solver.check_invalid()
+    
+    # Assert
+    assert cell_manager.cells[0][0]._chosen_tile is chosen_tile
+    assert cell_manager.cells[0][1]._is_collapsed is True
+    assert cell_manager.cells[1][0]._is_collapsed is True
+    assert cell_manager.cells[1][1]._is_collapsed is True
+
+
+def test_start_numpy_backend_cancelled():
+    # Arrange
+    tile_set = TileSet([Tile(image=Image.new('RGB', (40, 40)), sides_code='000000000000')])
+    tile_set_manager = TileSetManager({'default_tile_set': tile_set})
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
+    control = SolverControl()
+    solver = Solver(cell_manager, backend='numpy', control=control)
+    
+    # Act
+    control.cancel()
+    result = solver.start(False)
+    
+    # Assert
+    assert result is False
+    assert all(cell._is_collapsed is False for cell_row in cell_manager.cells for cell in cell_row)
+
+
+def test_init_invalid_backend():
+    # Arrange
+    tile_set_manager = TileSetManager({'default_tile_set': TileSet()})
+    cell_manager = CellGrid(2, 2, (40, 40), tile_set_manager)
+    
+    # Act / Assert
+    with pytest.raises(ValueError):
+        Solver(cell_manager, backend='gpu')
+
+
+def test_start_backtracking_dead_end():
+    # Arrange               [N][E][S][W]
+    t1 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
+    t2 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000000000000')
+    tile_set = TileSet([t1, t2])
+    tile_set_manager = TileSetManager({'default_tile_set': tile_set})
+    cell_manager = CellGrid(1, 3, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
+    solver = Solver(cell_manager, search='backtracking')
+    
+    # Act
+    result = solver.start(False)
+    
+    # Assert
+    assert result is True
+    assert cell_manager.trail is None
+    assert cell_manager.cells[0][0]._chosen_tile is t2
+    assert cell_manager.cells[0][1]._chosen_tile is t2
+    assert cell_manager.cells[0][2]._is_collapsed is True
+
+
+def test_start_backjumping_dead_end():
+    # Arrange               [N][E][S][W]
+    t1 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
+    t2 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000000000000')
+    tile_set = TileSet([t1, t2])
+    tile_set_manager = TileSetManager({'default_tile_set': tile_set})
+    cell_manager = CellGrid(2, 3, (40, 40), tile_set_manager)
+    cell_manager.switch_tile_set()
+    solver = Solver(cell_manager, search='backjumping')
+    
+    # Act
+    result = solver.start(False)
+    
+    # Assert
+    assert result is True
+    assert cell_manager.record_culprits is False
+    assert cell_manager.cells[0][0]._chosen_tile is t2
+    assert cell_manager.cells[1][1]._chosen_tile is t2
+    assert cell_manager.cells[1][2]._is_collapsed is True
+
+
+def test_start_restarts_same_master_seed():
+    # Arrange               [N][E][S][W]
+    t1 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000111000000')
+    t2 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000000000000')
+    t3 = Tile(image=Image.new('RGB', (40, 40)), sides_code='000000000111')
+    tile_set = TileSet([t1, t2, t3])
+    tile_set_manager = TileSetManager({'default_tile_set': tile_set})
+    results = []
+    
+    # Act
+    for _ in range(2):
+        cell_manager = CellGrid(3, 3, (40, 40), tile_set_manager)
+        cell_manager.switch_tile_set()
+        solver = Solver(cell_manager, restart_policy=RestartPolicy(budget_type='contradictions',
+                                                                   base_budget=0,
+                                                                   max_attempts=50,
+                                                                   master_seed=3))
+        is_solved = solver.start(False)
+        tiles = [cell._chosen_tile for cell in solver._get_cells()]
+        results.append((is_solved, solver.winning_seed, len(solver.reports), tiles))
+    
+    # Assert
+    assert results[0] == results[1]
+    assert results[0][0] is True
+    assert results[0][1] == solver.reports[-1].seed
+    assert solver.reports[-1].is_solved is True
+    assert cell_manager.rng is None
@@ -0,0 +1,50 @@
+import threading
+
+from src.solver.solver_control import SolverControl
+
+# =======================================================================
+
+def test_checkpoint_running():
+    # Arrange
+    control = SolverControl()
+
+    # Act
+    result = control.checkpoint()
+
+    # Assert
+    assert result is True
+    assert control.is_paused() is False
+
+
+def test_checkpoint_waits_while_paused():
+    # Arrange
+    control = SolverControl()
+    results = []
+    control.pause()
+    thread = threading.Thread(target=lambda: results.append(control.checkpoint()))
+
+    # Act
+    thread.start()
+    thread.join(0.05)
+    waited = thread.is_alive()
+    control.resume()
+    thread.join(1)
+
+    # Assert
+    assert waited is True
+    assert results == [True]
+
+
+def test_cancel_while_paused():
+    # Arrange
+    control = SolverControl()
+    control.pause()
+
+    # Act
+    control.cancel()
+    control.pause()
+
+    # Assert
+    assert control.checkpoint() is False
+    assert control.is_cancelled() is True
+    assert control.is_paused() is False
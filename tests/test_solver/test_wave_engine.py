@@ -0,0 +1,197 @@
+from itertools import product
+
+import pytest
+
+from src.constants import VALID_REDUCE_MOVES
+from src.direction import Direction
+from src.solver.wave_engine import WaveEngine, mask_to_words, words_to_mask
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+
+
+def create_tile_set() -> TileSet:
+    '''
+    Every combination of 'aaa' and 'bbb' sides, so any grid can be solved.
+    '''
+    tiles = [Tile(sides_code=''.join(sides)) for sides in product(['aaa', 'bbb'], repeat=4)]
+    tile_set = TileSet(tiles)
+    tile_set.compile()
+    return tile_set
+
+
+def assert_consistent(engine: WaveEngine) -> None:
+    tile_indices = engine.get_tile_indices()
+
+    for row in range(engine.rows):
+        for column in range(engine.columns):
+            for i, j, direction in VALID_REDUCE_MOVES:
+                if not (0 <= row + i < engine.rows and 0 <= column + j < engine.columns):
+                    continue
+
+                tile = engine.tile_set[int(tile_indices[row, column])]
+                other = engine.tile_set[int(tile_indices[row + i, column + j])]
+                assert other.match_sides_code(tile, direction, direction.get_opposite())
+
+# =======================================================================
+
+def test_mask_to_words():
+    # Arrange
+    mask = 0b11 << 64 | 0b101
+
+    # Act
+    words = mask_to_words(mask, 2)
+
+    # Assert
+    assert words.tolist() == [0b101, 0b11]
+    assert words_to_mask(words) == mask
+
+
+def test_init_invalid_batch_radius():
+    # Arrange
+    tile_set = create_tile_set()
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        WaveEngine(tile_set, 4, 4, batch_radius=0)
+
+
+def test_init_all_tiles_possible():
+    # Arrange
+    tile_set = create_tile_set()
+
+    # Act
+    engine = WaveEngine(tile_set, 2, 3)
+
+    # Assert
+    assert engine.wave.shape == (2, 3, 1)
+    assert engine.get_mask(1, 2) == tile_set.get_full_mask()
+    assert (engine.get_tile_indices() == -1).all()
+
+# =======================================================================
+
+def test_solve():
+    # Arrange
+    engine = WaveEngine(create_tile_set(), 12, 9, seed=1)
+
+    # Act
+    result = engine.solve()
+
+    # Assert
+    assert result is True
+    assert engine.get_invalid_cells() == []
+    assert (engine.get_tile_indices() != -1).all()
+    assert_consistent(engine)
+
+
+def test_solve_same_seed_same_result():
+    # Arrange
+    tile_set = create_tile_set()
+    engine1 = WaveEngine(tile_set, 8, 8, seed=7)
+    engine2 = WaveEngine(tile_set, 8, 8, seed=7)
+
+    # Act
+    engine1.solve()
+    engine2.solve()
+
+    # Assert
+    assert (engine1.get_tile_indices() == engine2.get_tile_indices()).all()
+
+
+def test_solve_one_cell_per_step():
+    # Arrange
+    engine = WaveEngine(create_tile_set(), 9, 9)
+
+    # Act
+    collapsed = engine.step()
+
+    # Assert
+    assert collapsed == 1
+
+
+def test_solve_batch_per_step():
+    # Arrange
+    engine = WaveEngine(create_tile_set(), 9, 9, seed=3, batch_radius=1)
+
+    # Act
+    collapsed = engine.step()
+    result = engine.solve()
+
+    # Assert
+    assert collapsed > 1
+    assert result is True
+    assert_consistent(engine)
+
+
+def test_solve_should_stop():
+    # Arrange
+    engine = WaveEngine(create_tile_set(), 4, 4, seed=2)
+    checks = []
+
+    # Act
+    result = engine.solve(should_stop=lambda: checks.append(1) or len(checks) > 3)
+
+    # Assert
+    assert result is False
+    assert engine.steps == 3
+    assert (engine.get_tile_indices() != -1).sum() == 3
+
+# =======================================================================
+
+def test_collapse_given_tile():
+    # Arrange
+    tile_set = create_tile_set()
+    engine = WaveEngine(tile_set, 3, 3)
+
+    # Act
+    result = engine.collapse(1, 1, 5)
+
+    # Assert
+    assert result == 5
+    assert engine.get_mask(1, 1) == 1 << 5
+    assert engine.collapse(1, 1) is None
+
+    east_tile = tile_set[5].sides_code[3:6]
+    for index in range(len(tile_set)):
+        fits = tile_set[index].sides_code[9:12] == east_tile[::-1]
+        assert bool(engine.get_mask(1, 2) >> index & 1) is fits
+
+
+def test_restrict_contradiction():
+    '''
+    t1 EAST: 111, no tile has WEST: 111 => nothing fits EAST of t1
+    '''
+    # Arrange
+    t1 = Tile(sides_code='000111000000')
+    t2 = Tile(sides_code='000000000000')
+    tile_set = TileSet([t1, t2])
+    tile_set.compile()
+    engine = WaveEngine(tile_set, 1, 2)
+
+    # Act
+    result = engine.restrict(0, 0, 0b01)
+
+    # Assert
+    assert result == (0, 1)
+    assert engine.get_invalid_cells() == [(0, 1)]
+    assert engine.solve() is False
+    assert engine.get_tile_indices().tolist() == [[0, -1]]
+
+
+def test_restrict_propagates():
+    '''
+    t1 SOUTH: 111, only t1 has NORTH: 111 => a column under t1 is all t1
+    '''
+    # Arrange
+    t1 = Tile(sides_code='111000111000')
+    t2 = Tile(sides_code='000000000000')
+    tile_set = TileSet([t1, t2])
+    tile_set.compile()
+    engine = WaveEngine(tile_set, 3, 1)
+
+    # Act
+    result = engine.restrict(0, 0, 0b01)
+
+    # Assert
+    assert result is None
+    assert [engine.get_mask(row, 0) for row in range(3)] == [0b01, 0b01, 0b01]
+    assert tile_set.get_adjacency_mask(0, Direction.SOUTH) == 0b01
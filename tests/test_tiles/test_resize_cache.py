@@ -0,0 +1,139 @@
+import gc
+
+import pytest
+from PIL import Image
+from src.tiles.resize_cache import ResizeCache
+from src.tiles.tile import Tile
+
+
+def create_tile(color: str = 'red') -> Tile:
+    return Tile(Image.new('RGB', (40, 40), color=color), '000000000000')
+
+# =======================================================================
+
+def test_invalid_max_sizes():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        ResizeCache(0)
+
+
+def test_get_image_source_size():
+    # Arrange
+    cache = ResizeCache()
+    tile = create_tile()
+
+    # Act
+    result = cache.get_image(tile, tile.source_image, (40, 40))
+
+    # Assert
+    assert result is tile.source_image
+    assert cache.resamples == 0
+
+
+def test_get_image_resamples_once():
+    # Arrange
+    cache = ResizeCache()
+    tile = create_tile()
+
+    # Act
+    first = cache.get_image(tile, tile.source_image, (20, 20))
+    second = cache.get_image(tile, tile.source_image, [20, 20])
+
+    # Assert
+    assert first is second
+    assert first.size == (20, 20)
+    assert cache.resamples == 1
+
+
+def test_least_recently_used_size_evicted():
+    # Arrange
+    cache = ResizeCache(max_sizes=2)
+    tile = create_tile()
+
+    # Act
+    cache.get_image(tile, tile.source_image, (10, 10))
+    cache.get_image(tile, tile.source_image, (20, 20))
+    cache.get_image(tile, tile.source_image, (10, 10))
+    cache.get_image(tile, tile.source_image, (30, 30))
+    cache.get_image(tile, tile.source_image, (10, 10))
+    cache.get_image(tile, tile.source_image, (20, 20))
+
+    # Assert
+    assert cache.resamples == 4
+    assert len(cache) == 2
+
+
+def test_images_dropped_with_tile():
+    # Arrange
+    cache = ResizeCache()
+    tile = create_tile()
+    cache.get_image(tile, tile.source_image, (20, 20))
+
+    # Act
+    del tile
+    gc.collect()
+
+    # Assert
+    assert len(cache) == 0
+
+
+def test_discard():
+    # Arrange
+    cache = ResizeCache()
+    tile = create_tile()
+    other_tile = create_tile('blue')
+    cache.get_image(tile, tile.source_image, (20, 20))
+    cache.get_image(other_tile, other_tile.source_image, (20, 20))
+
+    # Act
+    cache.discard(tile)
+
+    # Assert
+    assert len(cache) == 1
+
+# =======================================================================
+
+def test_tile_resize_resamples_source_image():
+    # Arrange
+    image = Image.new('RGB', (40, 40), color='white')
+    image.putpixel((20, 20), (255, 0, 0))
+    tile = Tile(image, '000000000000')
+
+    # Act
+    tile.resize_image((4, 4))
+    tile.resize_image((40, 40))
+
+    # Assert
+    assert tile.image is image
+    assert tile.image.getpixel((20, 20)) == (255, 0, 0)
+
+
+def test_tile_switching_sizes_is_cached():
+    # Arrange
+    tile = create_tile()
+    Tile.resize_cache.clear()
+    resamples = Tile.resize_cache.resamples
+
+    # Act
+    tile.resize_image((20, 20))
+    small_image = tile.image
+    tile.resize_image((80, 80))
+    tile.resize_image((20, 20))
+
+    # Assert
+    assert tile.image is small_image
+    assert Tile.resize_cache.resamples - resamples == 2
+
+
+def test_tile_rotate_after_resize():
+    # Arrange
+    tile = Tile(Image.new('RGB', (40, 80), color='green'), '000000000000')
+    tile.resize_image((20, 40))
+
+    # Act
+    tile.rotate_tile(1)
+    tile.resize_image((80, 40))
+
+    # Assert
+    assert tile.source_image.size == (80, 40)
+    assert tile.image is tile.source_image
@@ -0,0 +1,98 @@
+from src.tiles.tile import Tile
+from src.tiles.tile_domain import TileDomain
+from src.tiles.tile_set import TileSet
+
+# ==========================================================================
+
+def test_default_domain_full():
+    # Arange
+    tile_set = TileSet([Tile(), Tile(), Tile()])
+    
+    # Act
+    domain = TileDomain(tile_set)
+    
+    # Assert
+    assert domain.mask == 0b111
+    assert len(domain) == 3
+
+
+def test_default_domain_empty_tile_set():
+    # Arange
+    tile_set = TileSet()
+    
+    # Act
+    domain = TileDomain(tile_set)
+    
+    # Assert
+    assert domain.mask == 0
+    assert len(domain) == 0
+
+
+def test_from_tiles():
+    # Arange
+    t1 = Tile()
+    t2 = Tile()
+    t3 = Tile()
+    tile_set = TileSet([t1, t2, t3])
+    
+    # Act
+    domain = TileDomain.from_tiles(tile_set, [t3, t1, Tile()])
+    
+    # Assert
+    assert domain.mask == 0b101
+    assert list(domain) == [t1, t3]
+
+# ==========================================================================
+
+def test_get_indices():
+    # Arange
+    tile_set = TileSet([Tile(), Tile(), Tile(), Tile()])
+    domain = TileDomain(tile_set, 0b1010)
+    
+    # Act
+    indices = domain.get_indices()
+    
+    # Assert
+    assert indices == [1, 3]
+
+
+def test_to_tile_set():
+    # Arange
+    t1 = Tile()
+    t2 = Tile()
+    tile_set = TileSet([t1, t2])
+    domain = TileDomain(tile_set, 0b10)
+    
+    # Act
+    view = domain.to_tile_set()
+    
+    # Assert
+    assert isinstance(view, TileSet) is True
+    assert view == [t2]
+
+# ==========================================================================
+
+def test_intersect():
+    # Arange
+    tile_set = TileSet([Tile(), Tile(), Tile(), Tile()])
+    domain = TileDomain(tile_set)
+    
+    # Act
+    size = domain.intersect(0b0110)
+    
+    # Assert
+    assert size == 2
+    assert domain.mask == 0b0110
+
+
+def test_intersect_to_empty():
+    # Arange
+    tile_set = TileSet([Tile(), Tile(), Tile(), Tile()])
+    domain = TileDomain(tile_set, 0b0011)
+    
+    # Act
+    size = domain.intersect(0b1100)
+    
+    # Assert
+    assert size == 0
+    assert domain.mask == 0
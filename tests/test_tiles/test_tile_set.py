@@ -1,191 +1,436 @@
-from PIL import Image
-from src.direction import Direction
-from src.tiles.tile_set import TileSet
-from src.tiles.tile import Tile
-
-# ==========================================================================
-# we can think of t1 as the original tile, and t2-t4, as its three rotations
-# t1 = Tile(sides_code='111000000000')
-# t2 = Tile(sides_code='000000000111')
-# t3 = Tile(sides_code='000000111000')
-# t4 = Tile(sides_code='000111000000')
-
-# ==========================================================================
-
-def test_get_tile_image_size_empty():
-    # Arange
-    tile_set = TileSet()
-    
-    # Act
-    size = tile_set.get_tile_image_size()
-    
-    # Assert
-    assert size is None
-
-
-def test_get_tile_image_size_no_images():
-    # Arange
-    t1 = Tile(sides_code='111000000000')
-    t2 = Tile(sides_code='000000000111')
-    t3 = Tile(sides_code='000000111000')
-    t4 = Tile(sides_code='000111000000')
-    tile_set = TileSet([t1, t2, t3, t4])
-    
-    # Act
-    size = tile_set.get_tile_image_size()
-    
-    # Assert
-    assert size is None
-
-
-def test_get_tile_image_size_with_images_1():
-    # Arange
-    image = Image.new('RGB', (40, 40))
-    tile = Tile(image)
-    tile_set = TileSet([tile])
-    
-    # Act
-    size = tile_set.get_tile_image_size()
-    
-    # Assert
-    assert size == (40, 40)
-
-
-def test_get_tile_image_size_with_images_2():
-    # Arange
-    image1 = Image.new('RGB', (40, 90))
-    image2 = Image.new('RGB', (40, 90))
-    t1 = Tile(image1)
-    t2 = Tile(image2)
-    tile_set = TileSet([t1, t2])
-    
-    # Act
-    size = tile_set.get_tile_image_size()
-    
-    # Assert
-    assert size == (40, 90)
-
-# ==========================================================================
-
-def test_resize_tiles_no_tiles():
-    # Arange
-    tile_set = TileSet()
-    
-    # Act
-    result = tile_set.resize_tiles((40, 40))
-    
-    # Assert
-    assert result is False
-
-
-def test_resize_tiles_with_tiles():
-    # Arange
-    image1 = Image.new('RGB', (40, 40))
-    image2 = Image.new('RGB', (40, 40))
-    t1 = Tile(image1)
-    t2 = Tile(image2)
-    tile_set = TileSet([t1, t2])
-    
-    # Act
-    result = tile_set.resize_tiles((80, 80))
-    size = tile_set.get_tile_image_size()
-    
-    # Assert
-    assert result is True
-    assert size == (80, 80)
-
-# ==========================================================================
-'''
-Explainging following tests:
-- each test compares a side of t1 to the rest of tiles in tile_set
-- each test has a description, showing the code of t1 corresponding to given direction
-  and a list of codes, corresponding to given direction, for each tile in tile_set in the order t1, t2, t3, t4
-
-'''
-
-def test_get_reduced_tile_set_north_south():
-    '''
-    NORTH t1: 111
-    SOUTH tile_set: aaa aaa 111 aaa
-    => only 1 match
-    '''
-    # Arange
-    other_direction = Direction.NORTH
-    tile_set_direction = Direction.SOUTH
-    t1 = Tile(sides_code='111aaaaaaaaa')
-    t2 = Tile(sides_code='aaaaaaaaa111')
-    t3 = Tile(sides_code='aaaaaa111aaa')
-    t4 = Tile(sides_code='aaa111aaaaaa')
-    tile_set = TileSet([t1, t2, t3, t4])
-    
-    # Act
-    reduced_tile_set = tile_set.get_reduced_tile_set(t1, tile_set_direction, other_direction)
-    
-    # Assert
-    assert str(reduced_tile_set) == '[<sides_code=aaaaaa111aaa, image=None>]'
-
-
-def test_get_reduced_tile_set_south_north():
-    '''
-    SOUTH t1: aaa
-    NORTH tile_set: 111 aaa aaa aaa
-    => 3 matches
-    '''
-    # Arange
-    other_direction = Direction.SOUTH
-    tile_set_direction = Direction.NORTH
-    t1 = Tile(sides_code='111aaaaaaaaa')
-    t2 = Tile(sides_code='aaaaaaaaa111')
-    t3 = Tile(sides_code='aaaaaa111aaa')
-    t4 = Tile(sides_code='aaa111aaaaaa')
-    tile_set = TileSet([t1, t2, t3, t4])
-    
-    # Act
-    reduced_tile_set = tile_set.get_reduced_tile_set(t1, tile_set_direction, other_direction)
-    
-    # Assert
-    assert str(reduced_tile_set) == '[<sides_code=aaaaaaaaa111, image=None>, <sides_code=aaaaaa111aaa, image=None>, <sides_code=aaa111aaaaaa, image=None>]'
-
-
-def test_get_reduced_tile_set_east_west():
-    '''
-    EAST t1: aaa
-    WEST tile_set: aaa 111 aaa aaa
-    => 3 matches
-    '''
-    # Arange
-    other_direction = Direction.EAST
-    tile_set_direction = Direction.WEST
-    t1 = Tile(sides_code='111aaaaaaaaa')
-    t2 = Tile(sides_code='aaaaaaaaa111')
-    t3 = Tile(sides_code='aaaaaa111aaa')
-    t4 = Tile(sides_code='aaa111aaaaaa')
-    tile_set = TileSet([t1, t2, t3, t4])
-    
-    # Act
-    reduced_tile_set = tile_set.get_reduced_tile_set(t1, tile_set_direction, other_direction)
-    
-    # Assert
-    assert str(reduced_tile_set) == '[<sides_code=111aaaaaaaaa, image=None>, <sides_code=aaaaaa111aaa, image=None>, <sides_code=aaa111aaaaaa, image=None>]'
-
-
-def test_get_reduced_tile_set_west_east():
-    '''
-    WEST t1: aaa
-    EAST tile_set: aaa aaa aaa 111
-    => 3 matches
-    '''
-    # Arange
-    other_direction = Direction.WEST
-    tile_set_direction = Direction.EAST
-    t1 = Tile(sides_code='111aaaaaaaaa')
-    t2 = Tile(sides_code='aaaaaaaaa111')
-    t3 = Tile(sides_code='aaaaaa111aaa')
-    t4 = Tile(sides_code='aaa111aaaaaa')
-    tile_set = TileSet([t1, t2, t3, t4])
-    
-    # Act
-    reduced_tile_set = tile_set.get_reduced_tile_set(t1, tile_set_direction, other_direction)
-    
-    # Assert
-    assert str(reduced_tile_set) == '[<sides_code=111aaaaaaaaa, image=None>, <sides_code=aaaaaaaaa111, image=None>, <sides_code=aaaaaa111aaa, image=None>]'
+import pickle
+
+from PIL import Image
+from src.direction import Direction
+from src.tiles.tile_set import CARDINAL_DIRECTIONS, TileSet, get_mask_indices
+from src.tiles.tile import Tile
+
+# ==========================================================================
+# we can think of t1 as the original tile, and t2-t4, as its three rotations
+# t1 = Tile(sides_code='111000000000')
+# t2 = Tile(sides_code='000000000111')
+# t3 = Tile(sides_code='000000111000')
+# t4 = Tile(sides_code='000111000000')
+
+# ==========================================================================
+
+def test_get_tile_image_size_empty():
+    # Arange
+    tile_set = TileSet()
+    
+    # Act
+    size = tile_set.get_tile_image_size()
+    
+    # Assert
+    assert size is None
+
+
+def test_get_tile_image_size_no_images():
+    # Arange
+    t1 = Tile(sides_code='111000000000')
+    t2 = Tile(sides_code='000000000111')
+    t3 = Tile(sides_code='000000111000')
+    t4 = Tile(sides_code='000111000000')
+    tile_set = TileSet([t1, t2, t3, t4])
+    
+    # Act
+    size = tile_set.get_tile_image_size()
+    
+    # Assert
+    assert size is None
+
+
+def test_get_tile_image_size_with_images_1():
+    # Arange
+    image = Image.new('RGB', (40, 40))
+    tile = Tile(image)
+    tile_set = TileSet([tile])
+    
+    # Act
+    size = tile_set.get_tile_image_size()
+    
+    # Assert
+    assert size == (40, 40)
+
+
+def test_get_tile_image_size_with_images_2():
+    # Arange
+    image1 = Image.new('RGB', (40, 90))
+    image2 = Image.new('RGB', (40, 90))
+    t1 = Tile(image1)
+    t2 = Tile(image2)
+    tile_set = TileSet([t1, t2])
+    
+    # Act
+    size = tile_set.get_tile_image_size()
+    
+    # Assert
+    assert size == (40, 90)
+
+# ==========================================================================
+
+def test_resize_tiles_no_tiles():
+    # Arange
+    tile_set = TileSet()
+    
+    # Act
+    result = tile_set.resize_tiles((40, 40))
+    
+    # Assert
+    assert result is False
+
+
+def test_resize_tiles_with_tiles():
+    # Arange
+    image1 = Image.new('RGB', (40, 40))
+    image2 = Image.new('RGB', (40, 40))
+    t1 = Tile(image1)
+    t2 = Tile(image2)
+    tile_set = TileSet([t1, t2])
+    
+    # Act
+    result = tile_set.resize_tiles((80, 80))
+    size = tile_set.get_tile_image_size()
+    
+    # Assert
+    assert result is True
+    assert size == (80, 80)
+
+# ==========================================================================
+'''
+Explainging following tests:
+- each test compares a side of t1 to the rest of tiles in tile_set
+- each test has a description, showing the code of t1 corresponding to given direction
+  and a list of codes, corresponding to given direction, for each tile in tile_set in the order t1, t2, t3, t4
+
+'''
+
+def test_get_reduced_tile_set_north_south():
+    '''
+    NORTH t1: 111
+    SOUTH tile_set: aaa aaa 111 aaa
+    => only 1 match
+    '''
+    # Arange
+    other_direction = Direction.NORTH
+    tile_set_direction = Direction.SOUTH
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaaaaa111')
+    t3 = Tile(sides_code='aaaaaa111aaa')
+    t4 = Tile(sides_code='aaa111aaaaaa')
+    tile_set = TileSet([t1, t2, t3, t4])
+    
+    # Act
+    reduced_tile_set = tile_set.get_reduced_tile_set(t1, tile_set_direction, other_direction)
+    
+    # Assert
+    assert str(reduced_tile_set) == '[<sides_code=aaaaaa111aaa, image=None>]'
+
+
+def test_get_reduced_tile_set_south_north():
+    '''
+    SOUTH t1: aaa
+    NORTH tile_set: 111 aaa aaa aaa
+    => 3 matches
+    '''
+    # Arange
+    other_direction = Direction.SOUTH
+    tile_set_direction = Direction.NORTH
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaaaaa111')
+    t3 = Tile(sides_code='aaaaaa111aaa')
+    t4 = Tile(sides_code='aaa111aaaaaa')
+    tile_set = TileSet([t1, t2, t3, t4])
+    
+    # Act
+    reduced_tile_set = tile_set.get_reduced_tile_set(t1, tile_set_direction, other_direction)
+    
+    # Assert
+    assert str(reduced_tile_set) == '[<sides_code=aaaaaaaaa111, image=None>, <sides_code=aaaaaa111aaa, image=None>, <sides_code=aaa111aaaaaa, image=None>]'
+
+
+def test_get_reduced_tile_set_east_west():
+    '''
+    EAST t1: aaa
+    WEST tile_set: aaa 111 aaa aaa
+    => 3 matches
+    '''
+    # Arange
+    other_direction = Direction.EAST
+    tile_set_direction = Direction.WEST
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaaaaa111')
+    t3 = Tile(sides_code='aaaaaa111aaa')
+    t4 = Tile(sides_code='aaa111aaaaaa')
+    tile_set = TileSet([t1, t2, t3, t4])
+    
+    # Act
+    reduced_tile_set = tile_set.get_reduced_tile_set(t1, tile_set_direction, other_direction)
+    
+    # Assert
+    assert str(reduced_tile_set) == '[<sides_code=111aaaaaaaaa, image=None>, <sides_code=aaaaaa111aaa, image=None>, <sides_code=aaa111aaaaaa, image=None>]'
+
+
+def test_get_reduced_tile_set_west_east():
+    '''
+    WEST t1: aaa
+    EAST tile_set: aaa aaa aaa 111
+    => 3 matches
+    '''
+    # Arange
+    other_direction = Direction.WEST
+    tile_set_direction = Direction.EAST
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaaaaa111')
+    t3 = Tile(sides_code='aaaaaa111aaa')
+    t4 = Tile(sides_code='aaa111aaaaaa')
+    tile_set = TileSet([t1, t2, t3, t4])
+    
+    # Act
+    reduced_tile_set = tile_set.get_reduced_tile_set(t1, tile_set_direction, other_direction)
+    
+    # Assert
+    assert str(reduced_tile_set) == '[<sides_code=111aaaaaaaaa, image=None>, <sides_code=aaaaaaaaa111, image=None>, <sides_code=aaaaaa111aaa, image=None>]'
+
+# ==========================================================================
+
+def test_get_supported_tile_set_no_others():
+    # Arange
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaaaaa111')
+    tile_set = TileSet([t1, t2])
+    
+    # Act
+    supported_tile_set = tile_set.get_supported_tile_set([], Direction.SOUTH, Direction.NORTH)
+    
+    # Assert
+    assert len(supported_tile_set) == 0
+
+
+def test_get_supported_tile_set_single_other():
+    '''
+    Same as test_get_reduced_tile_set_north_south, with a list of one tile.
+    '''
+    # Arange
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaaaaa111')
+    t3 = Tile(sides_code='aaaaaa111aaa')
+    t4 = Tile(sides_code='aaa111aaaaaa')
+    tile_set = TileSet([t1, t2, t3, t4])
+    
+    # Act
+    supported_tile_set = tile_set.get_supported_tile_set([t1], Direction.SOUTH, Direction.NORTH)
+    
+    # Assert
+    assert str(supported_tile_set) == '[<sides_code=aaaaaa111aaa, image=None>]'
+
+
+def test_get_supported_tile_set_many_others():
+    '''
+    NORTH others: 111 aaa
+    SOUTH tile_set: aaa aaa 111 aaa
+    => all match
+    '''
+    # Arange
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaaaaa111')
+    t3 = Tile(sides_code='aaaaaa111aaa')
+    t4 = Tile(sides_code='aaa111aaaaaa')
+    tile_set = TileSet([t1, t2, t3, t4])
+    
+    # Act
+    supported_tile_set = tile_set.get_supported_tile_set([t1, t2], Direction.SOUTH, Direction.NORTH)
+    
+    # Assert
+    assert supported_tile_set == tile_set
+
+
+def test_get_supported_tile_set_asymmetrical():
+    '''
+    EAST other: 001
+    WEST tile_set: 100 001
+    => only the reversed code matches
+    '''
+    # Arange
+    other = Tile(sides_code='000001000000')
+    t1 = Tile(sides_code='000000000100')
+    t2 = Tile(sides_code='000000000001')
+    tile_set = TileSet([t1, t2])
+    
+    # Act
+    supported_tile_set = tile_set.get_supported_tile_set([other], Direction.WEST, Direction.EAST)
+    
+    # Assert
+    assert supported_tile_set == [t1]
+
+# ==========================================================================
+
+def test_get_mask_indices():
+    # Act
+    indices = get_mask_indices(0b1011)
+    
+    # Assert
+    assert indices == [0, 1, 3]
+
+
+def test_get_full_mask():
+    # Arange
+    tile_set = TileSet([Tile(), Tile(), Tile()])
+    
+    # Act
+    mask = tile_set.get_full_mask()
+    
+    # Assert
+    assert mask == 0b111
+
+
+def test_get_mask_and_get_tiles():
+    # Arange
+    t1 = Tile()
+    t2 = Tile()
+    t3 = Tile()
+    tile_set = TileSet([t1, t2, t3])
+    
+    # Act
+    mask = tile_set.get_mask([t3, t2])
+    tiles = tile_set.get_tiles(mask)
+    
+    # Assert
+    assert mask == 0b110
+    assert tiles == [t2, t3]
+
+
+def test_get_compatible_mask_north_south():
+    '''
+    Same tiles as test_get_reduced_tile_set_north_south
+    '''
+    # Arange
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaaaaa111')
+    t3 = Tile(sides_code='aaaaaa111aaa')
+    t4 = Tile(sides_code='aaa111aaaaaa')
+    tile_set = TileSet([t1, t2, t3, t4])
+    
+    # Act
+    mask = tile_set.get_compatible_mask(t1, Direction.SOUTH, Direction.NORTH)
+    
+    # Assert
+    assert mask == 0b0100
+
+
+def test_get_supported_mask_many_others():
+    '''
+    Same tiles as test_get_supported_tile_set_many_others
+    '''
+    # Arange
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaaaaa111')
+    t3 = Tile(sides_code='aaaaaa111aaa')
+    t4 = Tile(sides_code='aaa111aaaaaa')
+    tile_set = TileSet([t1, t2, t3, t4])
+    
+    # Act
+    single_mask = tile_set.get_supported_mask(0b0001, Direction.SOUTH, Direction.NORTH)
+    many_mask = tile_set.get_supported_mask(0b0011, Direction.SOUTH, Direction.NORTH)
+    
+    # Assert
+    assert single_mask == 0b0100
+    assert many_mask == 0b1111
+
+# ==========================================================================
+
+def test_compile_adjacency():
+    '''
+    t1 NORTH: 111, t3 SOUTH: 111
+    => t3 fits NORTH of t1, and t1 fits SOUTH of t3
+    '''
+    # Arange
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaaaaa111')
+    t3 = Tile(sides_code='aaaaaa111aaa')
+    t4 = Tile(sides_code='aaa111aaaaaa')
+    tile_set = TileSet([t1, t2, t3, t4])
+    
+    # Act
+    tile_set.compile()
+    
+    # Assert
+    assert tile_set.is_compiled() is True
+    assert tile_set.get_adjacency_mask(0, Direction.NORTH) == 0b0100
+    assert tile_set.get_adjacency_mask(2, Direction.SOUTH) == 0b0001
+    assert tile_set.get_adjacency_mask(0, Direction.SOUTH) == 0b1110
+
+
+def test_compile_matches_sides_code():
+    # Arange
+    t1 = Tile(sides_code='010001111100')
+    t2 = Tile(sides_code='001100010111')
+    t3 = Tile(sides_code='111111111111')
+    tile_set = TileSet([t1, t2, t3])
+    
+    # Act
+    tile_set.compile()
+    
+    # Assert
+    for direction in CARDINAL_DIRECTIONS:
+        for i, tile in enumerate(tile_set):
+            for j, other in enumerate(tile_set):
+                fits = other.match_sides_code(tile, direction.get_opposite(), direction)
+                assert bool(tile_set.get_adjacency_mask(i, direction) >> j & 1) is fits
+
+
+def test_compile_after_append():
+    # Arange
+    t1 = Tile(sides_code='111111111111')
+    t2 = Tile(sides_code='111111111111')
+    tile_set = TileSet([t1])
+    tile_set.compile()
+    
+    # Act
+    tile_set.append(t2)
+    
+    # Assert
+    assert tile_set.is_compiled() is False
+    assert tile_set.get_adjacency_mask(0, Direction.EAST) == 0b11
+    assert tile_set.get_tile_index(t2) == 1
+
+
+def test_get_tile_index_not_in_tile_set():
+    # Arange
+    tile_set = TileSet([Tile()])
+    
+    # Act
+    index = tile_set.get_tile_index(Tile())
+    
+    # Assert
+    assert index is None
+
+
+def test_get_compatible_mask_other_not_in_tile_set():
+    # Arange
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaa111aaa')
+    other = Tile(sides_code='111aaaaaaaaa')
+    tile_set = TileSet([t1, t2])
+    
+    # Act
+    mask = tile_set.get_compatible_mask(other, Direction.SOUTH, Direction.NORTH)
+    
+    # Assert
+    assert mask == 0b10
+
+
+def test_pickled_tile_set_keeps_compiled_indices():
+    # Arange
+    t1 = Tile(sides_code='111aaaaaaaaa')
+    t2 = Tile(sides_code='aaaaaa111aaa')
+    tile_set = TileSet([t1, t2])
+    tile_set.compile()
+    
+    # Act
+    copy = pickle.loads(pickle.dumps(tile_set))
+    
+    # Assert
+    assert copy.is_compiled() is True
+    assert copy.get_tile_index(copy[1]) == 1
+    assert copy.get_compatible_mask(copy[1], Direction.NORTH, Direction.SOUTH) == 0b01
@@ -0,0 +1,129 @@
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_cache import get_tile_set_hash
+from src.tiles.tile_set_loader import create_tile_set_manager, read_tile_set
+
+
+def create_tile_set_directory(path: Path) -> Path:
+    path_to_tile_set = path / 'test_tile_set'
+    path_to_tile_set.mkdir()
+    (path_to_tile_set / 'test_tile_set.yaml').write_text("corner:\n"
+                                                        "  directions: '100000000001'\n"
+                                                        "  rotations: 1\n"
+                                                        "fill:\n"
+                                                        "  directions: 1\n")
+    Image.new('RGB', (4, 4), color='red').save(path_to_tile_set / 'corner.png')
+    Image.new('RGB', (4, 4), color='blue').save(path_to_tile_set / 'fill.png')
+    return path_to_tile_set
+
+# =======================================================================
+
+def test_compile_with_wrong_adjacency_table():
+    # Arrange
+    tile_set = TileSet([Tile(sides_code='111000000000')])
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        tile_set.compile([[1], [1]])
+
+# =======================================================================
+
+def test_get_tile_set_hash_changes_with_files(tmp_path):
+    # Arrange
+    path_to_tile_set = create_tile_set_directory(tmp_path)
+    old_hash = get_tile_set_hash(path_to_tile_set)
+
+    # Act
+    Image.new('RGB', (4, 4), color='green').save(path_to_tile_set / 'fill.png')
+
+    # Assert
+    assert get_tile_set_hash(path_to_tile_set) != old_hash
+
+
+def test_read_tile_set_with_cache(tmp_path):
+    # Arrange
+    path_to_tile_set = create_tile_set_directory(tmp_path)
+    cache_directory = tmp_path / 'cache'
+
+    # Act
+    cold = read_tile_set(path_to_tile_set, cache_directory, (8, 8))
+    warm = read_tile_set(path_to_tile_set, cache_directory, (8, 8))
+
+    # Assert
+    assert len(list(cache_directory.iterdir())) == 1
+    assert [tile.sides_code for tile in warm] == [tile.sides_code for tile in cold]
+    assert warm.get_adjacency_table() == cold.get_adjacency_table()
+    assert warm.get_tile_image_size() == (8, 8)
+
+
+def test_read_tile_set_with_cache_resizes_source_images(tmp_path):
+    # Arrange
+    path_to_tile_set = create_tile_set_directory(tmp_path)
+    cache_directory = tmp_path / 'cache'
+    corner_image = Image.new('RGB', (4, 4), color='red')
+    corner_image.paste('white', (0, 0, 2, 2))
+    corner_image.save(path_to_tile_set / 'corner.png')
+    read_tile_set(path_to_tile_set, cache_directory, (2, 2))
+
+    # Act
+    warm = read_tile_set(path_to_tile_set, cache_directory, (2, 2))
+    warm.resize_tiles((8, 8))
+    cold = read_tile_set(path_to_tile_set, None, (8, 8))
+
+    # Assert
+    assert len(list(cache_directory.iterdir())) == 1
+    assert [tile.image.tobytes() for tile in warm] == [tile.image.tobytes() for tile in cold]
+
+
+def test_read_tile_set_with_cache_replaces_stale_file(tmp_path):
+    # Arrange
+    path_to_tile_set = create_tile_set_directory(tmp_path)
+    cache_directory = tmp_path / 'cache'
+    read_tile_set(path_to_tile_set, cache_directory)
+    # loaded from the cached file, which becomes stale
+    old_tile_set = read_tile_set(path_to_tile_set, cache_directory)
+
+    # Act
+    (path_to_tile_set / 'test_tile_set.yaml').write_text("fill:\n"
+                                                        "  directions: 1\n")
+    result = read_tile_set(path_to_tile_set, cache_directory)
+
+    # Assert
+    assert len(result) == 1
+    assert len(list(cache_directory.iterdir())) == 1
+    assert old_tile_set.get_tile_image_size() == result.get_tile_image_size()
+
+
+def test_create_tile_set_manager_reads_tile_sets_on_access(tmp_path):
+    # Arrange
+    create_tile_set_directory(tmp_path)
+    (tmp_path / 'broken_tile_set').mkdir()
+
+    # Act
+    tile_set_manager = create_tile_set_manager(tmp_path)
+    tile_set = tile_set_manager['test_tile_set']
+
+    # Assert
+    assert sorted(tile_set_manager) == ['broken_tile_set', 'test_tile_set']
+    assert len(tile_set) == 3
+    assert tile_set_manager.is_loaded('broken_tile_set') is False
+
+
+def test_read_atlas_tile_set():
+    # Arrange
+    path_to_atlas_tile_set = Path('tests/resources/atlas/atlas_tile_set')
+    path_to_tile_set = Path('tilesets/default_tile_set')
+
+    # Act
+    atlas_tile_set = read_tile_set(path_to_atlas_tile_set)
+    tile_set = read_tile_set(path_to_tile_set)
+
+    # Assert
+    assert [tile.sides_code for tile in atlas_tile_set] == [tile.sides_code for tile in tile_set]
+    assert atlas_tile_set.get_adjacency_table() == tile_set.get_adjacency_table()
+    assert [tile.image.tobytes() for tile in atlas_tile_set] == \
+           [tile.image.tobytes() for tile in tile_set]
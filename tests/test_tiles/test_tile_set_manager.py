@@ -1,3 +1,6 @@
+import pickle
+
+import pytest
 from PIL import Image
 from src.tiles.tile_set_manager import TileSetManager
 from src.tiles.tile_set import TileSet
@@ -94,3 +97,100 @@ def test_resize_tile_set_tile():
     # Assert
     assert result is True
     assert size == (40, 80)
+
+# ==========================================================================
+
+def test_loader_invoked_on_first_access():
+    # Arange
+    calls = []
+    tile_set = TileSet([Tile(Image.new('RGB', (5, 5)))])
+    tsm = TileSetManager(loaders={'lazy_tile_set': lambda: calls.append(1) or tile_set})
+    
+    # Act
+    names = list(tsm)
+    loaded_before = tsm.is_loaded('lazy_tile_set')
+    first = tsm['lazy_tile_set']
+    second = tsm['lazy_tile_set']
+    
+    # Assert
+    assert names == ['lazy_tile_set']
+    assert 'lazy_tile_set' in tsm and len(tsm) == 1
+    assert loaded_before is False
+    assert first is tile_set and second is tile_set
+    assert calls == [1]
+
+
+
+def test_iterate_and_load_every_tile_set():
+    # Arange
+    loaded = TileSet([Tile(Image.new('RGB', (5, 5)))])
+    tsm = TileSetManager({'loaded_tile_set': loaded},
+                         {'lazy_tile_set_1': lambda: TileSet(), 'lazy_tile_set_2': lambda: TileSet()})
+
+    # Act
+    tile_sets = {tile_set_name: tsm[tile_set_name] for tile_set_name in tsm}
+
+    # Assert
+    assert list(tile_sets) == ['loaded_tile_set', 'lazy_tile_set_1', 'lazy_tile_set_2']
+    assert tile_sets['loaded_tile_set'] is loaded
+    assert all(tsm.is_loaded(tile_set_name) for tile_set_name in tile_sets)
+
+def test_get_tile_set_image_size_with_loader():
+    # Arange
+    tile_set = TileSet([Tile(Image.new('RGB', (5, 7)))])
+    tsm = TileSetManager(loaders={'lazy_tile_set': lambda: tile_set})
+    
+    # Act
+    size = tsm.get_tile_set_image_size('lazy_tile_set')
+    
+    # Assert
+    assert size == (5, 7)
+
+
+def test_missing_tile_set_with_loaders():
+    # Arange
+    tsm = TileSetManager(loaders={'lazy_tile_set': TileSet})
+    
+    # Act / Assert
+    with pytest.raises(KeyError):
+        tsm['invalid_tile_set']
+
+    assert tsm.get('invalid_tile_set') is None
+
+
+def test_failed_loader_is_kept():
+    # Arange
+    tile_set = TileSet([Tile(Image.new('RGB', (5, 5)))])
+    results = [OSError('unreadable'), tile_set]
+
+    def loader():
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    tsm = TileSetManager(loaders={'lazy_tile_set': loader})
+
+    # Act
+    with pytest.raises(OSError):
+        tsm['lazy_tile_set']
+
+    names = list(tsm)
+    result = tsm['lazy_tile_set']
+
+    # Assert
+    assert names == ['lazy_tile_set']
+    assert result is tile_set
+    assert tsm.is_loaded('lazy_tile_set') is True
+
+
+def test_pickle_keeps_loaders():
+    # Arange
+    tsm = TileSetManager([('tile_set_name', TileSet())], loaders={'lazy_tile_set': TileSet})
+    
+    # Act
+    result = pickle.loads(pickle.dumps(tsm))
+    
+    # Assert
+    assert list(result) == ['tile_set_name', 'lazy_tile_set']
+    assert result.is_loaded('lazy_tile_set') is False
@@ -0,0 +1,160 @@
+import gc
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from src.tiles.tile import Tile
+from src.tiles.tile_set import TileSet
+from src.tiles.tile_set_loader import create_tile_set_manager, read_tile_set, write_tile_set_pack
+from src.tiles.tile_set_pack import (PAGE_SIZE, PREFIX, TILE_ALIGNMENT, get_pack_pixels,
+                                     load_tile_set_pack, read_pack_configs, save_tile_set_pack)
+
+
+def create_tile_set() -> TileSet:
+    t1 = Tile(Image.new('RGB', (3, 3), color='red'), '111000000000')
+    t2 = Tile(Image.new('RGBA', (3, 3), color=(0, 0, 255, 128)), '000000111000')
+    return TileSet([t1, t2])
+
+
+def is_mapped(file_path: Path) -> bool:
+    return str(file_path.resolve()) in Path('/proc/self/maps').read_text()
+
+
+requires_proc_maps = pytest.mark.skipif(not Path('/proc/self/maps').exists(),
+                                        reason='needs /proc/self/maps')
+
+# =======================================================================
+
+def test_save_and_load_tile_set_pack(tmp_path):
+    # Arrange
+    tile_set = create_tile_set()
+
+    # Act
+    save_tile_set_pack(tile_set, tmp_path / 'test.wfcpack', {'blank': {'directions': '0' * 12}})
+    result = load_tile_set_pack(tmp_path / 'test.wfcpack')
+
+    # Assert
+    assert [tile.sides_code for tile in result] == ['111000000000', '000000111000']
+    assert result.is_compiled() is True
+    assert result.get_adjacency_table() == tile_set.get_adjacency_table()
+    assert result[0].image.getpixel((2, 2)) == (255, 0, 0, 255)
+    assert result[1].image.getpixel((0, 0)) == (0, 0, 255, 128)
+    assert read_pack_configs(tmp_path / 'test.wfcpack') == {'blank': {'directions': '0' * 12}}
+
+
+def test_load_tile_set_pack_invalid_file(tmp_path):
+    # Arrange
+    (tmp_path / 'test.wfcpack').write_bytes(b'not a tile set')
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        load_tile_set_pack(tmp_path / 'test.wfcpack')
+
+
+def test_pack_layout_is_aligned(tmp_path):
+    # Arrange
+    save_tile_set_pack(create_tile_set(), tmp_path / 'test.wfcpack')
+
+    # Act
+    data = (tmp_path / 'test.wfcpack').read_bytes()
+    _, _, _, pixel_offset = PREFIX.unpack_from(data)
+
+    # Assert
+    assert pixel_offset % PAGE_SIZE == 0
+    assert len(data) == pixel_offset + TILE_ALIGNMENT + 3 * 3 * 4
+    assert data[pixel_offset + TILE_ALIGNMENT:pixel_offset + TILE_ALIGNMENT + 4] == bytes([0, 0, 255, 128])
+
+
+def test_get_pack_pixels(tmp_path):
+    # Arrange
+    save_tile_set_pack(create_tile_set(), tmp_path / 'test.wfcpack')
+
+    # Act
+    pixels = get_pack_pixels(tmp_path / 'test.wfcpack')
+
+    # Assert
+    assert pixels.shape == (2, 3, 3, 4)
+    assert pixels.flags.writeable is False
+    assert pixels[0, 2, 1].tolist() == [255, 0, 0, 255]
+    assert pixels[1, 1, 2].tolist() == [0, 0, 255, 128]
+
+# =======================================================================
+
+def test_write_and_read_tile_set_pack(tmp_path):
+    # Arrange
+    path_to_tile_set = Path('tests/resources/atlas/atlas_tile_set')
+
+    # Act
+    tile_set = write_tile_set_pack(path_to_tile_set, tmp_path / 'atlas_tile_set.wfcpack')
+    result = read_tile_set(tmp_path / 'atlas_tile_set.wfcpack')
+
+    # Assert
+    assert [tile.sides_code for tile in result] == [tile.sides_code for tile in tile_set]
+    assert [tile.image.tobytes() for tile in result] == \
+           [tile.image.convert('RGBA').tobytes() for tile in tile_set]
+    assert read_pack_configs(tmp_path / 'atlas_tile_set.wfcpack')['atlas']['tile_size'] == [40, 40]
+
+
+def test_create_tile_set_manager_with_packs(tmp_path):
+    # Arrange
+    write_tile_set_pack(Path('tests/resources/atlas/atlas_tile_set'),
+                        tmp_path / 'atlas_tile_set.wfcpack')
+    (tmp_path / 'other.wfcpack').write_bytes(b'')
+
+    # Act
+    tile_set_manager = create_tile_set_manager(tmp_path)
+
+    # Assert
+    assert list(tile_set_manager) == ['atlas_tile_set']
+    assert len(tile_set_manager['atlas_tile_set']) == 16
+
+# =======================================================================
+
+@requires_proc_maps
+def test_load_tile_set_pack_closes_file(tmp_path):
+    # Arrange
+    file_path = tmp_path / 'test.wfcpack'
+    save_tile_set_pack(create_tile_set(), file_path)
+
+    # Act
+    result = load_tile_set_pack(file_path)
+
+    # Assert
+    assert is_mapped(file_path) is False
+    assert result[0].image.getpixel((2, 2)) == (255, 0, 0, 255)
+
+
+def test_replaced_pack_can_be_deleted(tmp_path):
+    # Arrange
+    file_path = tmp_path / 'test.wfcpack'
+    save_tile_set_pack(create_tile_set(), file_path)
+    old_tile_set = load_tile_set_pack(file_path)
+
+    # Act
+    save_tile_set_pack(TileSet(create_tile_set()[:1]), file_path)
+    new_tile_set = load_tile_set_pack(file_path)
+    file_path.unlink()
+
+    # Assert
+    assert file_path.exists() is False
+    assert len(old_tile_set) == 2 and len(new_tile_set) == 1
+    assert old_tile_set[1].image.getpixel((0, 0)) == (0, 0, 255, 128)
+
+
+@requires_proc_maps
+def test_load_tile_set_pack_shared_pixels_mapped_while_used(tmp_path):
+    # Arrange
+    file_path = tmp_path / 'test.wfcpack'
+    save_tile_set_pack(create_tile_set(), file_path)
+
+    # Act
+    result = load_tile_set_pack(file_path, share_pixels=True)
+    mapped_while_used = is_mapped(file_path)
+    pixel = result[0].image.getpixel((2, 2))
+    del result
+    gc.collect()
+
+    # Assert
+    assert mapped_while_used is True
+    assert pixel == (255, 0, 0, 255)
+    assert is_mapped(file_path) is False